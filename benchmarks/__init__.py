@@ -0,0 +1 @@
+"""Offline performance benchmarks for hdd_cdd_calculator (see benchmarks/run.py)."""
@@ -0,0 +1,91 @@
+"""
+Deterministic offline fixtures for the benchmark suite.
+
+Nothing here touches the network: NWS responses are canned JSON documents
+and Meteostat data is a synthetic DataFrame shaped like
+``meteostat.Daily(...).fetch()``. Every generator is seeded so runs are
+reproducible.
+"""
+import numpy as np
+import pandas as pd
+
+SEED = 20230601
+START_DATE = np.datetime64("1800-01-01")
+
+# pandas timestamps cannot represent 1M distinct days, so longer series
+# repeat a 150k-day calendar (as if several stations were stacked).
+MAX_DISTINCT_DAYS = 150_000
+
+POINTS_JSON = {
+    "properties": {
+        "forecast": "https://api.weather.gov/gridpoints/OKX/33,35/forecast",
+        "forecastHourly": "https://api.weather.gov/gridpoints/OKX/33,35/forecast/hourly",
+        "forecastGridData": "https://api.weather.gov/gridpoints/OKX/33,35",
+        "gridId": "OKX",
+        "gridX": 33,
+        "gridY": 35,
+        "timeZone": "America/New_York",
+    }
+}
+
+
+def dates(n: int) -> np.ndarray:
+    """`n` daily dates, repeating after MAX_DISTINCT_DAYS."""
+    return START_DATE + (np.arange(n) % MAX_DISTINCT_DAYS)
+
+
+def temperatures(n: int):
+    """Seasonal daily highs and lows in °F with noise."""
+    rng = np.random.default_rng(SEED)
+    day = np.arange(n)
+    mean = 55 + 25 * np.sin(2 * np.pi * day / 365.25) + rng.normal(0, 5, n)
+    spread = rng.uniform(8, 22, n)
+    return mean + spread / 2, mean - spread / 2
+
+
+def forecast_json(n: int) -> dict:
+    """Canned NWS forecast document with a day and a night period per day."""
+    highs, lows = temperatures(n)
+    day_strings = np.datetime_as_string(dates(n), unit="D").tolist()
+    periods = []
+    for day, high, low in zip(day_strings, np.round(highs).astype(int).tolist(), np.round(lows).astype(int).tolist()):
+        periods.append({"startTime": f"{day}T06:00:00-05:00", "temperature": high, "isDaytime": True})
+        periods.append({"startTime": f"{day}T18:00:00-05:00", "temperature": low, "isDaytime": False})
+    return {"properties": {"periods": periods}}
+
+
+def meteostat_frame(n: int) -> pd.DataFrame:
+    """Synthetic Meteostat daily frame (°C) with a few missing days."""
+    highs, lows = temperatures(n)
+    tmax = (highs - 32) * 5 / 9
+    tmin = (lows - 32) * 5 / 9
+    tmax[::97] = np.nan
+    return pd.DataFrame(
+        {"tavg": (tmax + tmin) / 2, "tmin": tmin, "tmax": tmax},
+        index=pd.DatetimeIndex(dates(n).astype("datetime64[ns]"), name="time"),
+    )
+
+
+def energy_csv(n: int, path) -> None:
+    """Write an energy CSV with `n` daily rows driven by HDD."""
+    highs, lows = temperatures(n)
+    hdd = np.maximum(65 - (highs + lows) / 2, 0)
+    rng = np.random.default_rng(SEED + 1)
+    pd.DataFrame({
+        "date": np.datetime_as_string(dates(n), unit="D"),
+        "kwh": np.round(300 + 12 * hdd + rng.normal(0, 15, n), 2),
+    }).to_csv(path, index=False)
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response around a canned JSON document."""
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
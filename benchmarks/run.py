@@ -0,0 +1,193 @@
+"""
+Run the offline benchmark suite and compare results between releases.
+
+Usage:
+    python -m benchmarks.run                          # all benchmarks, 1 / 10k / 1M days
+    python -m benchmarks.run --scales 1 10000 -k align -o before.json
+    python -m benchmarks.run --compare before.json after.json --threshold 1.10
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .suite import BENCHMARKS
+
+DEFAULT_SCALES = (1, 10_000, 1_000_000)
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2  # seconds per repeat before the loop count stops growing
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def _time(run, repeat: int, min_time: float) -> Dict[str, float]:
+    """Time `run` like timeit: grow the loop count to `min_time`, keep per-call times."""
+    run()  # warm-up (imports, caches)
+    number = 1
+    while True:
+        elapsed = _loop(run, number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = [elapsed / number] + [_loop(run, number) / number for _ in range(repeat - 1)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeat": len(times),
+    }
+
+
+def _loop(run, number: int) -> float:
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _metadata() -> Dict[str, str]:
+    import numpy
+    import pandas
+    import hdd_cdd_calculator
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "package_version": hdd_cdd_calculator.__version__,
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "pandas": pandas.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_suite(
+    scales: Sequence[int] = DEFAULT_SCALES,
+    names: Optional[Sequence[str]] = None,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    log=sys.stderr
+) -> Dict:
+    """
+    Run the selected benchmarks at every scale.
+
+    Args:
+        scales: Problem sizes in days.
+        names: Substrings selecting benchmarks (all by default).
+        repeat: Timed repeats per benchmark and scale.
+        min_time: Minimum seconds per repeat.
+        log: Stream for progress lines, or None.
+
+    Returns:
+        {"metadata": {...}, "results": {name: {scale: stats}}}; scales above
+        a benchmark's max_scale are recorded as {"skipped": reason}.
+    """
+    results: Dict[str, Dict[str, Dict]] = {}
+    for bench in BENCHMARKS.values():
+        if names and not any(name in bench.name for name in names):
+            continue
+        results[bench.name] = {}
+        for n in scales:
+            if bench.max_scale is not None and n > bench.max_scale:
+                results[bench.name][str(n)] = {"skipped": f"above max_scale {bench.max_scale}"}
+                continue
+            with bench.setup(n) as run:
+                stats = _time(run, repeat, min_time)
+            results[bench.name][str(n)] = stats
+            if log is not None:
+                print(f"{bench.name:<40} n={n:<9} {_format(stats['median'])}", file=log)
+    return {"metadata": _metadata(), "results": results}
+
+
+def compare(old: Dict, new: Dict, threshold: float = 1.10) -> List[Dict]:
+    """
+    Compare the median times of two result documents.
+
+    Returns:
+        One row per benchmark and scale present in both, with the ratio
+        new/old and whether it exceeds `threshold`.
+    """
+    rows = []
+    for name, scales in new["results"].items():
+        for scale, stats in scales.items():
+            before = old["results"].get(name, {}).get(scale)
+            if before is None or "median" not in before or "median" not in stats:
+                continue
+            ratio = stats["median"] / before["median"] if before["median"] > 0 else float("inf")
+            rows.append({
+                "name": name,
+                "scale": int(scale),
+                "old": before["median"],
+                "new": stats["median"],
+                "ratio": ratio,
+                "regression": ratio > threshold,
+            })
+    return rows
+
+
+def _format(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="hdd_cdd_calculator benchmark suite")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Problem sizes in days (default: 1 10000 1000000)")
+    parser.add_argument("-k", "--bench", nargs="+", help="Only run benchmarks whose name contains these")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed repeats")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="Minimum seconds per repeat")
+    parser.add_argument("-o", "--output", help="Result JSON path (default: benchmarks/results/<version>-<time>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="Slowdown ratio reported as a regression (default: 1.10)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        old, new = (json.loads(Path(path).read_text()) for path in args.compare)
+        rows = compare(old, new, args.threshold)
+        for row in rows:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(f"{row['name']:<40} n={row['scale']:<9} {_format(row['old'])} -> {_format(row['new'])}"
+                  f"  x{row['ratio']:.2f}{flag}")
+        return 1 if any(row["regression"] for row in rows) else 0
+
+    document = run_suite(args.scales, args.bench, args.repeat, args.min_time)
+    if args.output:
+        output = Path(args.output)
+    else:
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+        output = RESULTS_DIR / f"{document['metadata']['package_version']}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2))
+    print(f"Results saved to: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""
+Benchmark definitions.
+
+Each benchmark is a generator taking the problem size ``n`` (days): code
+before ``yield`` is untimed setup, the yielded callable is what gets timed,
+and code after ``yield`` is cleanup. Benchmarks whose fixtures do not fit
+in memory at large sizes declare a ``max_scale``.
+"""
+import contextlib
+import io
+import os
+import tempfile
+from typing import Callable, Dict, NamedTuple, Optional
+from unittest import mock
+
+import numpy as np
+
+from . import fixtures
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable
+    max_scale: Optional[int]
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(max_scale: Optional[int] = None):
+    """Register a benchmark generator under its function name."""
+    def register(func):
+        BENCHMARKS[func.__name__] = Benchmark(func.__name__, contextlib.contextmanager(func), max_scale)
+        return func
+    return register
+
+
+@benchmark(max_scale=10_000)
+def time_calculate_degree_days(n):
+    """Scalar calculate_degree_days called once per day."""
+    from hdd_cdd_calculator import calculate_degree_days
+
+    highs, lows = (t.tolist() for t in fixtures.temperatures(n))
+
+    def run():
+        for high, low in zip(highs, lows):
+            calculate_degree_days(high, low)
+    yield run
+
+
+@benchmark()
+def time_calculate_degree_days_array(n):
+    """Vectorized degree days for the whole series."""
+    from hdd_cdd_calculator import calculate_degree_days_array
+
+    highs, lows = fixtures.temperatures(n)
+    yield lambda: calculate_degree_days_array(highs, lows)
+
+
+@benchmark()
+def time_calculate_degree_days_double_sine(n):
+    """Vectorized double-sine degree days for the whole series."""
+    from hdd_cdd_calculator import calculate_degree_days_array
+
+    highs, lows = fixtures.temperatures(n)
+    yield lambda: calculate_degree_days_array(highs, lows, method="double_sine")
+
+
+@benchmark(max_scale=100_000)
+def time_degree_days_from_hourly(n):
+    """Degree-hour integration of 24 samples per day."""
+    from hdd_cdd_calculator import degree_days_from_hourly
+
+    times = np.datetime64("2000-01-01T00") + np.arange(24 * n).astype("timedelta64[h]")
+    temps = 60 + 15 * np.sin(2 * np.pi * np.arange(24 * n) / 24)
+    yield lambda: degree_days_from_hourly(times, temps)
+
+
+@benchmark()
+def time_billing_period_totals(n):
+    """Prefix-sum totals for one ~30-day billing period per day of data."""
+    from hdd_cdd_calculator import DegreeDayIndex
+
+    highs, lows = fixtures.temperatures(n)
+    dates = np.datetime64("2000-01-01") + np.arange(n)
+    index = DegreeDayIndex(dates, highs - lows, lows)
+    starts = dates[np.random.default_rng(0).integers(0, n, n)]
+    yield lambda: index.totals(starts, starts + 29)
+
+
+@benchmark(max_scale=100_000)
+def time_get_daily_temps(n):
+    """Parse a canned NWS forecast document into daily highs and lows."""
+    from hdd_cdd_calculator.calculator import get_daily_temps
+
+    response = fixtures.FakeResponse(fixtures.forecast_json(n))
+    with mock.patch("hdd_cdd_calculator.calculator.http_get", return_value=response):
+        yield lambda: get_daily_temps(fixtures.POINTS_JSON["properties"]["forecast"])
+
+
+@benchmark()
+def time_fetch_meteostat_data(n):
+    """Meteostat post-processing (°C → °F, masking, degree days) to result lists."""
+    from hdd_cdd_calculator import fetch_meteostat_data
+
+    frame = fixtures.meteostat_frame(n)
+    with mock.patch("hdd_cdd_calculator.meteostat_api.fetch_meteostat_daily", return_value=frame):
+        yield lambda: fetch_meteostat_data(40.7128, -74.006, "2023-01-01", "2023-12-31")
+
+
+@benchmark()
+def time_align_energy_with_degree_days(n):
+    """Read an energy CSV and merge it with degree days by date."""
+    from hdd_cdd_calculator import DegreeDaysArray, align_energy_with_degree_days
+
+    days = min(n, fixtures.MAX_DISTINCT_DAYS)
+    highs, lows = fixtures.temperatures(days)
+    degree_days = DegreeDaysArray.from_temperatures(fixtures.dates(days), highs, lows)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "energy.csv")
+        fixtures.energy_csv(n, path)
+        yield lambda: align_energy_with_degree_days(degree_days, path)
+
+
+@benchmark()
+def time_perform_regression(n):
+    """Single-meter scikit-learn regression of energy on HDD."""
+    from hdd_cdd_calculator import perform_regression
+
+    rng = np.random.default_rng(fixtures.SEED)
+    hdd = rng.uniform(0, 40, n)
+    energy = 300 + 12 * hdd + rng.normal(0, 15, n)
+    yield lambda: perform_regression(hdd, energy)
+
+
+@benchmark()
+def time_plot_regression(n):
+    """Render the regression scatter plot to an in-memory PNG."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from hdd_cdd_calculator import perform_regression, plot_regression
+
+    rng = np.random.default_rng(fixtures.SEED)
+    hdd = rng.uniform(0, 40, n)
+    energy = 300 + 12 * hdd + rng.normal(0, 15, n)
+    model = perform_regression(hdd, energy)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            plot_regression(hdd, energy, model, save_path=io.BytesIO(), show=False)
+    yield run
+
+
+@benchmark(max_scale=10_000)
+def time_render_regressions(n):
+    """Render one 365-day chart per meter for n/100 meters on 3 × 4 grid pages."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from hdd_cdd_calculator import RegressionPlot, perform_regression_batch, render_regressions
+
+    rng = np.random.default_rng(fixtures.SEED)
+    hdd = rng.uniform(0, 40, (max(n // 100, 1), 365))
+    energy = 300 + 12 * hdd + rng.normal(0, 15, hdd.shape)
+    fit = perform_regression_batch(hdd, energy)
+    plots = [RegressionPlot(f"meter-{i}", hdd[i], energy[i], fit.model(i)) for i in range(len(hdd))]
+    with tempfile.TemporaryDirectory() as tmp:
+        yield lambda: render_regressions(plots, tmp, grid=(3, 4))
@@ -0,0 +1,15 @@
+"""Shared fixtures for the test modules."""
+import numpy as np
+
+from hdd_cdd_calculator import DegreeDaysArray
+
+
+def inclusive_days(start_date, end_date) -> int:
+    """Number of days from `start_date` through `end_date`."""
+    return int((np.datetime64(end_date, "D") - np.datetime64(start_date, "D")).astype(int)) + 1
+
+
+def daily_series(start_date, days: int, high=70.0, low=50.0) -> DegreeDaysArray:
+    """Degree days for `days` consecutive days; `high`/`low` are scalars or per-day arrays."""
+    dates = np.datetime64(start_date, "D") + np.arange(days)
+    return DegreeDaysArray.from_temperatures(dates, np.broadcast_to(high, days), np.broadcast_to(low, days))
@@ -0,0 +1,107 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from hdd_cdd_calculator import DegreeDayArchive
+from hdd_cdd_calculator.exceptions import InvalidCoordinatesError, NWSAPIError
+from helpers import daily_series, inclusive_days
+
+
+class TestDegreeDayArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = DegreeDayArchive.create(
+            self.tmp.name, "2023-01-01", ["A", "B"], lats=[40.0, 41.0], lons=[-74.0, -75.0],
+            capacity_days=10,
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_query_returns_views_of_the_archive(self):
+        self.archive.write("A", daily_series("2023-01-01", 5))
+        self.archive.flush()
+
+        archive = DegreeDayArchive(self.tmp.name)
+        result = archive.query("A", "2023-01-02", "2023-01-03")
+        self.assertEqual([str(d) for d in result.dates], ["2023-01-02", "2023-01-03"])
+        np.testing.assert_allclose(result.hdd, 5.0)
+        self.assertEqual(result.hdd.dtype, np.float32)
+        self.assertFalse(result.hdd.flags.owndata)
+        self.assertTrue(np.isnan(archive.matrix("hdd")[1]).all())
+
+    def test_write_grows_capacity(self):
+        self.archive.write("B", daily_series("2023-01-01", 25, high=90.0))
+
+        self.assertEqual(self.archive.n_days, 25)
+        self.assertGreaterEqual(self.archive.capacity_days, 25)
+        np.testing.assert_allclose(self.archive.query("B").cdd, 5.0)
+        self.assertTrue(np.isnan(self.archive.query("A").hdd).all())
+
+    def test_add_stations_keeps_existing_rows(self):
+        self.archive.write("A", daily_series("2023-01-01", 3))
+        self.archive.add_stations(["C"], lats=[42.0], lons=[-76.0])
+
+        self.assertEqual(DegreeDayArchive(self.tmp.name).station_ids, ["A", "B", "C"])
+        np.testing.assert_allclose(self.archive.query("A").hdd, 5.0)
+        self.assertTrue(np.isnan(self.archive.query("C").hdd).all())
+
+    def test_append_fetches_only_new_days(self):
+        calls = []
+
+        def fake_get_degree_days(lat, lon, start_date, end_date, **kwargs):
+            calls.append((lat, start_date, end_date))
+            if lat == 41.0 and len(calls) == 2:
+                raise NWSAPIError("temporarily unavailable")
+            return daily_series(start_date, inclusive_days(start_date, end_date))
+
+        with mock.patch("hdd_cdd_calculator.archive.get_degree_days", fake_get_degree_days):
+            errors = self.archive.append("2023-01-03")
+            self.assertEqual(list(errors), ["B"])
+            self.archive.append("2023-01-05")
+
+        self.assertEqual(calls, [
+            (40.0, "2023-01-01", "2023-01-03"),
+            (41.0, "2023-01-01", "2023-01-03"),
+            (40.0, "2023-01-04", "2023-01-05"),
+            (41.0, "2023-01-01", "2023-01-05"),
+        ])
+        self.assertEqual(str(self.archive.end_date), "2023-01-05")
+        np.testing.assert_allclose(self.archive.matrix("hdd"), 5.0)
+
+    def test_append_refetches_trailing_days_without_data(self):
+        published = {"end": "2023-01-03"}
+        calls = []
+
+        def fake_get_degree_days(lat, lon, start_date, end_date, **kwargs):
+            calls.append((start_date, end_date))
+            end = min(end_date, published["end"])
+            return daily_series(start_date, max(inclusive_days(start_date, end), 0))
+
+        with mock.patch("hdd_cdd_calculator.archive.get_degree_days", fake_get_degree_days):
+            self.archive.append("2023-01-05", station_ids=["A"])
+            self.assertEqual(self.archive.n_days, 5)
+            self.assertTrue(np.isnan(self.archive.query("A", "2023-01-04").hdd).all())
+            published["end"] = "2023-01-05"
+            self.archive.append("2023-01-05", station_ids=["A"])
+
+        self.assertEqual(calls, [("2023-01-01", "2023-01-05"), ("2023-01-04", "2023-01-05")])
+        np.testing.assert_allclose(self.archive.query("A").hdd, 5.0)
+
+    def test_append_records_stations_without_coordinates(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = DegreeDayArchive.create(tmp, "2023-01-01", ["s1"])
+            with mock.patch("hdd_cdd_calculator.archive.get_degree_days") as fetch:
+                errors = archive.append("2023-01-05")
+
+            fetch.assert_not_called()
+            self.assertIsInstance(errors["s1"], InvalidCoordinatesError)
+            self.assertIn("s1", str(errors["s1"]))
+            self.assertEqual(archive.fetched_days.tolist(), [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from hdd_cdd_calculator import (
+    DegreeDaysArray,
+    InvalidCoordinatesError,
+    MultiBaseDegreeDays,
+    NWSAPIError,
+    fetch_degree_days_many,
+    get_degree_days_many,
+)
+from hdd_cdd_calculator.async_api import AsyncRateLimiter
+from hdd_cdd_calculator.calculator import configure_point_cache
+
+FORECAST = {
+    "properties": {
+        "periods": [
+            {"startTime": "2023-06-01T06:00:00-04:00", "temperature": 70, "isDaytime": True},
+            {"startTime": "2023-06-01T18:00:00-04:00", "temperature": 50, "isDaytime": False},
+            {"startTime": "2023-06-02T06:00:00-04:00", "temperature": 80, "isDaytime": True},
+            {"startTime": "2023-06-02T18:00:00-04:00", "temperature": 60, "isDaytime": False},
+        ]
+    }
+}
+
+
+def _fake_http_get(url, **kwargs):
+    response = mock.Mock()
+    if "/points/" in url:
+        if url.endswith("0.0000,0.0000"):
+            response.raise_for_status.side_effect = NWSAPIError("not found")
+        response.json.return_value = {"properties": {"forecast": "https://api.weather.gov/gridpoints/OKX/33,35/forecast"}}
+    else:
+        response.json.return_value = FORECAST
+    return response
+
+
+class TestGetDegreeDaysMany(unittest.TestCase):
+
+    def setUp(self):
+        configure_point_cache()
+
+    def test_collects_results_and_per_location_errors(self):
+        locations = {
+            "nyc": (40.7128, -74.0060),
+            "dc": (38.8977, -77.0365),
+            "bad": (-100.0, 0.0),
+            "ocean": (0.0, 0.0),
+        }
+        with mock.patch("hdd_cdd_calculator.calculator.http_get", side_effect=_fake_http_get):
+            results, errors = fetch_degree_days_many(
+                locations, "2023-06-01", "2023-06-02", rate_limit=1000
+            )
+
+        self.assertEqual(sorted(results), ["dc", "nyc"])
+        self.assertEqual([r.hdd for r in results["nyc"]], [5.0, 0.0])
+        self.assertIsInstance(errors["bad"], InvalidCoordinatesError)
+        self.assertIsInstance(errors["ocean"], NWSAPIError)
+
+    def test_early_exit_does_not_wait_for_pending_fetches(self):
+        slow_started, release = threading.Event(), threading.Event()
+
+        def fake_get_degree_days(lat, lon, *args, **kwargs):
+            if lat == 2.0:
+                slow_started.set()
+                release.wait(5)
+            else:
+                slow_started.wait(5)
+            return DegreeDaysArray.empty()
+
+        async def first():
+            async for item in get_degree_days_many([(1.0, 1.0), (2.0, 2.0)], "2023-06-01", "2023-06-02",
+                                                   source="meteostat", rate_limit=1000, columnar=True):
+                return item
+
+        with mock.patch("hdd_cdd_calculator.async_api.get_degree_days", fake_get_degree_days):
+            start = time.monotonic()
+            item = asyncio.run(first())
+            elapsed = time.monotonic() - start
+        release.set()
+
+        self.assertEqual(item.key, 0)
+        self.assertLess(elapsed, 2)
+
+    def test_takes_a_token_per_request_and_keeps_multi_base_results(self):
+        tokens = []
+
+        async def acquire(limiter, count=1):
+            tokens.append(count)
+
+        multi = MultiBaseDegreeDays.from_temperatures(["2023-06-01"], [70.0], [50.0], [60, 65])
+        with mock.patch.object(AsyncRateLimiter, "acquire", acquire), \
+                mock.patch("hdd_cdd_calculator.async_api.get_degree_days", return_value=multi):
+            results, errors = fetch_degree_days_many(
+                [(40.7, -74.0)], "2023-06-01", "2023-06-01", source="nws_grid", base_temp=[60, 65]
+            )
+
+        self.assertEqual(errors, {})
+        self.assertIs(results[0], multi)
+        self.assertEqual(tokens, [2])  # /points and gridpoint data
+
+    def test_rate_limiter_spaces_requests(self):
+        async def run():
+            limiter = AsyncRateLimiter(rate=50)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(6):
+                await limiter.acquire()
+            return loop.time() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+
+if __name__ == '__main__':
+    unittest.main()
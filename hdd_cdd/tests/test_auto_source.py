@@ -0,0 +1,111 @@
+import threading
+import unittest
+from datetime import date
+from unittest import mock
+
+import numpy as np
+
+from hdd_cdd_calculator import MultiBaseDegreeDays, get_degree_days
+from hdd_cdd_calculator.data_sources import _split_range
+from hdd_cdd_calculator.exceptions import NWSAPIError
+from helpers import daily_series, inclusive_days
+
+TODAY = date(2023, 6, 10)
+
+
+class TestAutoSource(unittest.TestCase):
+
+    def setUp(self):
+        for target, value in (("_today", TODAY), ("_site_time_zone", "America/New_York")):
+            patcher = mock.patch(f"hdd_cdd_calculator.data_sources.{target}", return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_split_range(self):
+        self.assertEqual(
+            _split_range("2023-06-01", "2023-06-15", TODAY),
+            ((date(2023, 6, 1), date(2023, 6, 9)), (date(2023, 6, 10), date(2023, 6, 15))),
+        )
+        self.assertEqual(_split_range("2023-05-01", "2023-05-31", TODAY), ((date(2023, 5, 1), date(2023, 5, 31)), None))
+        self.assertEqual(_split_range("2023-06-10", "2023-06-12", TODAY)[0], None)
+        with self.assertRaises(ValueError):
+            _split_range("2023-06-12", "2023-06-10", TODAY)
+
+    def test_stitches_history_and_forecast_concurrently(self):
+        calls = {}
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meteostat(lat, lon, start, end, base_temp, columnar, method):
+            calls["meteostat"] = (start, end)
+            barrier.wait()  # both fetches must be in flight at once
+            return daily_series(start, inclusive_days(start, end), 70.0, 50.0)
+
+        def nws_grid(lat, lon, start, end, base_temp, columnar, method):
+            calls["nws_grid"] = (start, end)
+            barrier.wait()
+            # The forecast also returns today's and earlier days; history wins
+            return daily_series("2023-06-08", 9, 80.0, 60.0)
+
+        with mock.patch.dict(
+            "hdd_cdd_calculator.data_sources.SOURCES", {"meteostat": meteostat, "nws_grid": nws_grid}
+        ):
+            results = get_degree_days(40.7, -74.0, "2023-06-05", "2023-06-12", source="auto", columnar=True)
+
+        self.assertEqual(calls, {"meteostat": ("2023-06-05", "2023-06-09"), "nws_grid": ("2023-06-10", "2023-06-12")})
+        np.testing.assert_array_equal(results.dates, np.arange(np.datetime64("2023-06-05"), np.datetime64("2023-06-13")))
+        np.testing.assert_allclose(results.high_temp, [70] * 5 + [80] * 3)
+        np.testing.assert_allclose(results.hdd, [5] * 5 + [0] * 3)
+
+    def test_past_range_only_fetches_history(self):
+        meteostat = mock.Mock(return_value=daily_series("2023-05-01", 3, 80.0, 60.0))
+        nws_grid = mock.Mock()
+        with mock.patch.dict(
+            "hdd_cdd_calculator.data_sources.SOURCES", {"meteostat": meteostat, "nws_grid": nws_grid}
+        ):
+            results = get_degree_days(40.7, -74.0, "2023-05-01", "2023-05-03", source="auto", base_temp=[60, 65])
+        nws_grid.assert_not_called()
+        self.assertIsInstance(results, MultiBaseDegreeDays)
+        np.testing.assert_allclose(results.cdd[:, 0], 10.0)
+
+    def test_serves_history_alone_outside_nws_coverage(self):
+        meteostat = mock.Mock(side_effect=lambda lat, lon, start, end, *args, **kwargs:
+                              daily_series(start, inclusive_days(start, end)))
+        nws_grid = mock.Mock(side_effect=NWSAPIError("404 outside coverage"))
+        with mock.patch.dict(
+            "hdd_cdd_calculator.data_sources.SOURCES", {"meteostat": meteostat, "nws_grid": nws_grid}
+        ):
+            results = get_degree_days(48.9, 2.3, "2023-06-05", "2023-06-12", source="auto", columnar=True)
+            np.testing.assert_array_equal(
+                results.dates, np.arange(np.datetime64("2023-06-05"), np.datetime64("2023-06-10"))
+            )
+            with self.assertRaises(NWSAPIError):
+                get_degree_days(48.9, 2.3, "2023-06-10", "2023-06-12", source="auto")
+
+    def test_splits_at_the_site_local_date(self):
+        # Late evening in New York: UTC has already moved on to June 11
+        def today(time_zone="UTC"):
+            return date(2023, 6, 11) if time_zone == "UTC" else TODAY
+
+        calls = {}
+
+        def meteostat(lat, lon, start, end, base_temp, columnar, method, time_zone=None):
+            calls["meteostat"] = (start, end, time_zone)
+            return daily_series(start, inclusive_days(start, end))
+
+        def nws_grid(lat, lon, start, end, base_temp, columnar, method):
+            calls["nws_grid"] = (start, end)
+            return daily_series(start, inclusive_days(start, end))
+
+        with mock.patch("hdd_cdd_calculator.data_sources._today", side_effect=today), mock.patch.dict(
+            "hdd_cdd_calculator.data_sources.SOURCES", {"meteostat": meteostat, "nws_grid": nws_grid}
+        ):
+            get_degree_days(40.7, -74.0, "2023-06-08", "2023-06-12", source="auto", method="hourly")
+
+        self.assertEqual(calls, {
+            "meteostat": ("2023-06-08", "2023-06-09", "America/New_York"),
+            "nws_grid": ("2023-06-10", "2023-06-12"),
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
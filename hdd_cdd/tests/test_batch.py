@@ -0,0 +1,108 @@
+import pickle
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from hdd_cdd_calculator import InvalidCoordinatesError, NWSAPIError, fetch_meteostat_batch
+from hdd_cdd_calculator.stations import StationIndex, snap_to_grid
+
+
+def _fake_daily(lat, lon, start_date, end_date):
+    if lat < -90:
+        raise InvalidCoordinatesError(lat, lon)
+    index = pd.date_range(start_date, end_date, name="time")
+    return pd.DataFrame({"tmin": 10.0, "tmax": 20.0 + lat % 1}, index=index)
+
+
+class TestFetchMeteostatBatch(unittest.TestCase):
+
+    def test_chunks_are_unpacked_per_site(self):
+        sites = {
+            "a": (40.0, -74.0),
+            "b": (40.5, -74.0, "2023-06-01", "2023-06-02"),
+            "bad": (-100.0, 0.0),
+        }
+        with mock.patch("hdd_cdd_calculator.batch.fetch_meteostat_daily", side_effect=_fake_daily):
+            results, errors = fetch_meteostat_batch(
+                sites, "2023-06-01", "2023-06-05", workers=0, chunk_size=2
+            )
+
+        self.assertEqual(sorted(results), ["a", "b"])
+        self.assertEqual(len(results["a"]), 5)
+        self.assertEqual(len(results["b"]), 2)
+        self.assertEqual(results["a"][0].hdd, 6.0)
+        self.assertEqual(results["b"][0].high_temp, 68.9)
+        self.assertIsInstance(errors["bad"], InvalidCoordinatesError)
+
+    def test_grid_snapping_fetches_each_cell_once(self):
+        sites = [(40.7128, -74.0060), (40.7130, -74.0070), (40.9, -74.0060)]
+        with mock.patch("hdd_cdd_calculator.batch.fetch_meteostat_daily", side_effect=_fake_daily) as fetch:
+            results, errors = fetch_meteostat_batch(
+                sites, "2023-06-01", "2023-06-02", workers=0, snap="grid"
+            )
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(sorted(results), [0, 1, 2])
+        self.assertIs(results[0], results[1])
+        self.assertEqual(errors, {})
+
+    def test_station_snapping(self):
+        index = StationIndex(["72503", "72405"], [40.7789, 38.8483], [-73.9692, -77.0342])
+        ids, distances = index.query([40.7128, 38.8977], [-74.0060, -77.0365])
+        self.assertEqual(ids.tolist(), ["72503", "72405"])
+        self.assertLess(distances.max(), 10)
+
+        calls = []
+        def fake_station(station_id, start_date, end_date):
+            calls.append(station_id)
+            return _fake_daily(40.0, -74.0, start_date, end_date)
+
+        with mock.patch("hdd_cdd_calculator.batch.fetch_meteostat_station_daily", side_effect=fake_station):
+            results, _ = fetch_meteostat_batch(
+                [(40.7128, -74.0060), (40.75, -73.99), (38.8977, -77.0365)],
+                "2023-06-01", "2023-06-02", workers=0, snap="station", station_index=index,
+            )
+        self.assertEqual(sorted(calls), ["72405", "72503"])
+        self.assertEqual(len(results), 3)
+
+    def test_station_snapping_skips_stations_without_data(self):
+        # The closest station stopped reporting daily data before the period
+        index = StationIndex(
+            ["closed", "72503", "nodaily"], [40.713, 40.7789, 40.7128], [-74.006, -73.9692, -74.0061],
+            daily_start=["1990-01-01", "1990-01-01", "NaT"], daily_end=["2020-12-31", "2024-12-31", "NaT"],
+        )
+        self.assertEqual(index.with_daily_data("2023-06-01", "2023-06-02").station_ids.tolist(), ["72503"])
+
+        with mock.patch("hdd_cdd_calculator.batch.fetch_meteostat_station_daily",
+                        side_effect=lambda station_id, *args: _fake_daily(40.0, -74.0, *args)) as fetch:
+            results, errors = fetch_meteostat_batch(
+                [(40.7128, -74.0060)], "2023-06-01", "2023-06-02", workers=0, snap="station", station_index=index,
+            )
+        fetch.assert_called_once_with("72503", "2023-06-01", "2023-06-02")
+        self.assertEqual(len(results[0]), 2)
+
+        # No station covers the period: fall back to Meteostat's interpolated point data
+        with mock.patch("hdd_cdd_calculator.batch.fetch_meteostat_daily", side_effect=_fake_daily) as fetch:
+            results, errors = fetch_meteostat_batch(
+                [(40.7128, -74.0060)], "2030-01-01", "2030-01-02", workers=0, snap="station", station_index=index,
+            )
+        fetch.assert_called_once_with(40.7128, -74.006, "2030-01-01", "2030-01-02")
+        self.assertEqual(errors, {})
+
+    def test_snap_to_grid(self):
+        lats, lons = snap_to_grid([40.7128, 40.7399], [-74.0060, -74.0001], resolution=0.05)
+        self.assertEqual(lats.tolist(), [40.725, 40.725])
+        self.assertEqual(lons.tolist(), [-74.025, -74.025])
+
+    def test_exceptions_survive_pickling(self):
+        error = pickle.loads(pickle.dumps(NWSAPIError("boom", status_code=503, url="https://x")))
+        self.assertEqual((error.status_code, error.url), (503, "https://x"))
+        self.assertEqual(str(error), "boom (HTTP 503) | URL: https://x")
+
+        error = pickle.loads(pickle.dumps(InvalidCoordinatesError(-100, 0)))
+        self.assertEqual((error.lat, error.lon), (-100, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _run_benchmarks(*args):
+    return subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", *args],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_suite_runs_offline_and_compares(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            proc = _run_benchmarks(
+                "--scales", "1", "200000", "-k", "array", "get_daily_temps",
+                "--repeat", "1", "--min-time", "0", "-o", output,
+            )
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            with open(output) as f:
+                document = json.load(f)
+
+            results = document["results"]
+            self.assertEqual(set(results), {"time_calculate_degree_days_array", "time_get_daily_temps"})
+            self.assertGreater(results["time_get_daily_temps"]["1"]["median"], 0)
+            self.assertIn("skipped", results["time_get_daily_temps"]["200000"])
+            self.assertIn("package_version", document["metadata"])
+
+            # A 1000x slowdown is reported as a regression
+            for scales in results.values():
+                for stats in scales.values():
+                    if "median" in stats:
+                        stats["median"] *= 1000
+            slower = os.path.join(tmp, "slower.json")
+            with open(slower, "w") as f:
+                json.dump(document, f)
+            self.assertEqual(_run_benchmarks("--compare", output, output).returncode, 0)
+            proc = _run_benchmarks("--compare", output, slower)
+            self.assertEqual(proc.returncode, 1)
+            self.assertIn("REGRESSION", proc.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
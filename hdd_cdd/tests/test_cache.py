@@ -0,0 +1,119 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from hdd_cdd_calculator import DegreeDaysArray, WeatherCache, get_degree_days
+from hdd_cdd_calculator.cache import PointCache
+
+
+def _fake_meteostat(lat, lon, start_date, end_date, base_temp=65.0, columnar=False):
+    dates = np.arange(np.datetime64(start_date), np.datetime64(end_date) + 1)
+    return DegreeDaysArray.from_temperatures(dates, np.full(len(dates), 70.0), np.full(len(dates), 50.0))
+
+
+class TestWeatherCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = WeatherCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup_reports_missing_sub_ranges(self):
+        self.cache.store("meteostat", 40.7128, -74.006, ["2023-06-03", "2023-06-04"], [70, 71], [50, 51])
+        cached, missing = self.cache.lookup("meteostat", 40.7128, -74.006, "2023-06-01", "2023-06-06")
+
+        self.assertEqual([str(d) for d in cached.dates], ["2023-06-03", "2023-06-04"])
+        self.assertEqual(missing, [("2023-06-01", "2023-06-02"), ("2023-06-05", "2023-06-06")])
+        self.assertEqual(self.cache.stats["hits"], 2)
+        self.assertEqual(self.cache.stats["misses"], 4)
+
+    def test_forecast_records_expire(self):
+        self.cache.forecast_ttl = 0
+        self.cache.store("nws", 40.0, -74.0, ["2023-06-01"], [70], [50])
+        time.sleep(0.01)
+        cached, missing = self.cache.lookup("nws", 40.0, -74.0, "2023-06-01", "2023-06-01")
+        self.assertEqual(len(cached.dates), 0)
+        self.assertEqual(missing, [("2023-06-01", "2023-06-01")])
+
+    def test_lru_eviction(self):
+        self.cache.store("meteostat", 40.0, -74.0, ["2023-06-01"], [70], [50])
+        old = self.cache._path("meteostat", 40.0, -74.0)
+        os.utime(old, (0, 0))
+        self.cache.max_bytes = old.stat().st_size + 1
+        self.cache.store("meteostat", 41.0, -74.0, ["2023-06-01"], [70], [50])
+
+        self.assertFalse(old.exists())
+        self.assertEqual(self.cache.stats["evictions"], 1)
+
+    def test_eviction_scans_only_when_over_the_limit(self):
+        with mock.patch.object(self.cache, "_evict", wraps=self.cache._evict) as evict:
+            self.cache.store("meteostat", 40.0, -74.0, ["2023-06-01"], [70], [50])
+            self.cache.store("meteostat", 41.0, -74.0, ["2023-06-01"], [70], [50])
+            evict.assert_not_called()
+            self.cache.max_bytes = 1
+            self.cache.store("meteostat", 42.0, -74.0, ["2023-06-01"], [70], [50])
+        evict.assert_called_once()
+        self.assertEqual(self.cache.stats["evictions"], 3)
+
+    def test_recent_days_missing_from_a_fetch_are_fetched_again(self):
+        today = np.datetime64("today", "D")
+        start, end = str(today - 6), str(today - 2)
+        self.cache.store("meteostat", 40.0, -74.0, [start, str(today - 5)], [70, 71], [50, 51],
+                         start_date=start, end_date=end)
+        cached, missing = self.cache.lookup("meteostat", 40.0, -74.0, start, end)
+        self.assertEqual(len(cached.dates), 2)
+        self.assertEqual(missing, [(str(today - 4), end)])
+
+    def test_old_gaps_are_not_fetched_again(self):
+        self.cache.store("meteostat", 40.0, -74.0, ["2023-06-01"], [70], [50],
+                         start_date="2023-06-01", end_date="2023-06-03")
+        cached, missing = self.cache.lookup("meteostat", 40.0, -74.0, "2023-06-01", "2023-06-03")
+        self.assertEqual(len(cached.dates), 1)
+        self.assertEqual(missing, [])
+
+    def test_get_degree_days_fetches_only_missing_ranges(self):
+        with mock.patch("hdd_cdd_calculator.data_sources.fetch_meteostat_data", side_effect=_fake_meteostat) as fetch:
+            get_degree_days(40.7128, -74.006, "2023-06-01", "2023-06-05", source="meteostat", cache=self.cache)
+            results = get_degree_days(40.7128, -74.006, "2023-06-03", "2023-06-08", source="meteostat", cache=self.cache)
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(fetch.call_args[0][2:4], ("2023-06-06", "2023-06-08"))
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results[0].hdd, 5.0)
+
+
+class TestPointCache(unittest.TestCase):
+
+    def test_bounded_lru(self):
+        cache = PointCache(maxsize=2)
+        cache.set(40.0, -74.0, {"forecast": "a"})
+        cache.set(41.0, -74.0, {"forecast": "b"})
+        cache.get(40.0, -74.0)
+        cache.set(42.0, -74.0, {"forecast": "c"})
+
+        self.assertIsNone(cache.get(41.0, -74.0))
+        self.assertEqual(cache.get(40.00001, -74.0), {"forecast": "a"})
+
+    def test_ttl_expiry(self):
+        cache = PointCache(ttl=-1)
+        cache.set(40.0, -74.0, {"forecast": "a"})
+        self.assertIsNone(cache.get(40.0, -74.0))
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "points.json")
+            cache = PointCache(path=path)
+            cache.set(40.0, -74.0, {"forecast": "a"})
+            cache.save()
+
+            self.assertEqual(PointCache(path=path).get(40.0, -74.0), {"forecast": "a"})
+
+
+if __name__ == '__main__':
+    unittest.main()
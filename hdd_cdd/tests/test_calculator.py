@@ -1,7 +1,13 @@
 import unittest
-from hdd_cdd_calculator import calculate_degree_days, validate_coordinates
+from unittest import mock
+import numpy as np
+from hdd_cdd_calculator import (
+    calculate_degree_days,
+    calculate_degree_days_array,
+    validate_coordinates,
+)
 from hdd_cdd_calculator.exceptions import InvalidCoordinatesError
-from hdd_cdd_calculator.calculator import get_forecast_url
+from hdd_cdd_calculator.calculator import configure_point_cache, get_forecast_url
 
 
 class TestCalculator(unittest.TestCase):
@@ -15,6 +21,30 @@ class TestCalculator(unittest.TestCase):
         # Test with different base temperature
         self.assertEqual(calculate_degree_days(70, 50, base_temp=60), (0, 0))  # Mean 60, same as base
 
+    def test_calculate_degree_days_array(self):
+        hdd, cdd = calculate_degree_days_array([70, 80, 65], [50, 60, 65])
+        np.testing.assert_allclose(hdd, [5.0, 0.0, 0.0])
+        np.testing.assert_allclose(cdd, [0.0, 5.0, 0.0])
+
+        # Per-element base temperatures
+        hdd, cdd = calculate_degree_days_array([70, 70], [50, 50], base_temp=[60, 65])
+        np.testing.assert_allclose(hdd, [0.0, 5.0])
+
+        # Celsius input matches the Fahrenheit result
+        hdd, _ = calculate_degree_days_array([20.0], [10.0], base_temp=18.0, unit="C")
+        np.testing.assert_allclose(hdd, [5.4])
+
+    def test_calculate_degree_days_array_masks_suspicious_rows(self):
+        hdd, cdd = calculate_degree_days_array([70, 500, np.nan], [50, 60, 60])
+        self.assertEqual(hdd[0], 5.0)
+        self.assertTrue(np.isnan(hdd[1:]).all())
+        self.assertTrue(np.isnan(cdd[1:]).all())
+
+        with self.assertRaises(ValueError):
+            calculate_degree_days_array([70, 500], [50, 60], errors="raise")
+        with self.assertRaises(ValueError):
+            calculate_degree_days(500, 60)
+
     def test_validate_coordinates_valid(self):
         # Should round and return valid coordinates
         lat, lon = validate_coordinates(40.712776, -74.005974)
@@ -34,6 +64,20 @@ class TestCalculator(unittest.TestCase):
         with self.assertRaises(InvalidCoordinatesError):
             get_forecast_url(0, 200)
 
+    def test_get_forecast_url_is_memoized(self):
+        configure_point_cache()
+        response = mock.Mock()
+        response.json.return_value = {
+            "properties": {"forecast": "https://api.weather.gov/gridpoints/OKX/33,35/forecast"}
+        }
+        with mock.patch("hdd_cdd_calculator.calculator.http_get", return_value=response) as http_get:
+            first = get_forecast_url(40.7128, -74.0060)
+            second = get_forecast_url(40.71281, -74.00601)
+
+        self.assertEqual(first, second)
+        self.assertEqual(http_get.call_count, 1)
+        self.assertEqual(http_get.call_args[0][0], "https://api.weather.gov/points/40.7128,-74.0060")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from io import StringIO
+
+import numpy as np
+
+from hdd_cdd_calculator import DegreeDaysArray, align_energy_with_degree_days
+from hdd_cdd_calculator.csv_utils import read_energy_data_streaming
+
+HOURLY_CSV = "date,kwh,meter_note\n" + "".join(
+    f"2023-06-0{day} {hour:02d}:00,{day},x\n" for day in (1, 2, 3) for hour in range(24)
+)
+
+
+class TestStreamingIngestion(unittest.TestCase):
+
+    def test_daily_totals_across_chunk_boundaries(self):
+        df = read_energy_data_streaming(StringIO(HOURLY_CSV), chunksize=10)
+
+        self.assertEqual(list(df.columns), ["date", "kwh"])
+        self.assertEqual(df["kwh"].tolist(), [24.0, 48.0, 72.0])
+        self.assertEqual(df["kwh"].dtype, np.float64)
+
+    def test_date_range_filter(self):
+        df = read_energy_data_streaming(
+            StringIO(HOURLY_CSV), start_date="2023-06-02", end_date="2023-06-02", chunksize=7
+        )
+        self.assertEqual(df["kwh"].tolist(), [48.0])
+
+    def test_raw_rows_without_aggregation(self):
+        df = read_energy_data_streaming(StringIO(HOURLY_CSV), daily=False, end_date="2023-06-01")
+        self.assertEqual(len(df), 24)
+
+    def test_timestamps_with_utc_offsets(self):
+        # Readings around the spring DST change, stamped in local time with offsets
+        csv = StringIO(
+            "date,kwh\n"
+            "2023-03-11T23:00:00-05:00,1\n"
+            "2023-03-12T01:00:00-05:00,2\n"
+            "2023-03-12T03:00:00-04:00,3\n"
+            "2023-03-13T00:00:00-04:00,4\n"
+        )
+        df = read_energy_data_streaming(csv, start_date="2023-03-12", end_date="2023-03-12", chunksize=2)
+        self.assertEqual(df["date"].astype(str).tolist(), ["2023-03-12"])
+        self.assertEqual(df["kwh"].tolist(), [5.0])
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            read_energy_data_streaming(StringIO(HOURLY_CSV), columns=["mmbtu"])
+
+    def test_streaming_alignment(self):
+        degree_days = DegreeDaysArray.from_temperatures(["2023-06-02", "2023-06-03"], [70, 80], [50, 60])
+        energy, hdd = align_energy_with_degree_days(degree_days, StringIO(HOURLY_CSV), chunksize=5)
+        self.assertEqual(energy, [48.0, 72.0])
+        self.assertEqual(hdd, [5.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
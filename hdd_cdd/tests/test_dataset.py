@@ -0,0 +1,117 @@
+import unittest
+from io import StringIO
+
+import numpy as np
+
+from hdd_cdd_calculator import (
+    DegreeDaysArray,
+    EnergyDataset,
+    MultiBaseDegreeDays,
+    align_energy_with_degree_days,
+    perform_regression_batch,
+)
+
+CSV = """date,kwh,mmbtu
+2023-06-03,300,3.0
+2023-06-01,100,1.0
+2023-06-02,,2.0
+2023-06-05,500,5.0
+"""
+
+
+class TestEnergyDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = EnergyDataset.from_csv(StringIO(CSV))
+        self.degree_days = DegreeDaysArray.from_temperatures(
+            ["2023-06-01", "2023-06-02", "2023-06-03", "2023-06-04"],
+            [70, 72, 80, 85], [50, 52, 60, 65],
+        )
+
+    def test_parsed_once_and_sorted(self):
+        self.assertEqual(self.dataset.columns, ["kwh", "mmbtu"])
+        self.assertEqual(str(self.dataset.dates[0]), "2023-06-01")
+        self.assertTrue(self.dataset.values("kwh").flags["C_CONTIGUOUS"])
+
+    def test_align_returns_hdd_and_cdd(self):
+        aligned = self.dataset.align(self.degree_days, "kwh")
+        self.assertEqual([str(d) for d in aligned.dates], ["2023-06-01", "2023-06-03"])
+        self.assertEqual(aligned.energy.tolist(), [100.0, 300.0])
+        self.assertEqual(aligned.hdd.tolist(), [5.0, 0.0])
+        self.assertEqual(aligned.cdd.tolist(), [0.0, 5.0])
+
+        aligned = self.dataset.align(self.degree_days, "mmbtu")
+        self.assertEqual(aligned.energy.tolist(), [1.0, 2.0, 3.0])
+
+    def test_matches_csv_alignment(self):
+        expected = align_energy_with_degree_days(self.degree_days, StringIO(CSV), "mmbtu", "cdd")
+        self.assertEqual(align_energy_with_degree_days(self.degree_days, self.dataset, "mmbtu", "cdd"), expected)
+
+    def test_multi_base_and_unsorted_degree_days(self):
+        multi = MultiBaseDegreeDays.from_degree_days(self.degree_days[::-1], [60, 65])
+        aligned = self.dataset.align(multi, "kwh")
+        self.assertEqual(aligned.hdd.shape, (2, 2))
+        np.testing.assert_allclose(aligned.hdd[:, 1], [5.0, 0.0])
+
+    def test_duplicate_days_are_summed(self):
+        dataset = EnergyDataset(["2023-06-01 00:00", "2023-06-01 12:00"], {"kwh": [1.0, 2.0]})
+        self.assertEqual(dataset.values("kwh").tolist(), [3.0])
+
+    def test_utc_offsets_match_the_streaming_path(self):
+        csv = ("date,kwh\n2023-03-11T23:00:00-05:00,1\n2023-03-12T01:00:00-05:00,2\n"
+               "2023-03-12T03:00:00-04:00,3\n2023-03-13T22:00:00-04:00,4\n")
+        parsed = EnergyDataset.from_csv(StringIO(csv))
+        streamed = EnergyDataset.from_csv(StringIO(csv), columns=["kwh"], chunksize=2)
+        self.assertEqual([str(d) for d in parsed.dates], ["2023-03-11", "2023-03-12", "2023-03-13"])
+        np.testing.assert_array_equal(parsed.dates, streamed.dates)
+        self.assertEqual(parsed.values("kwh").tolist(), [1.0, 5.0, 4.0])
+        self.assertEqual(streamed.values("kwh").tolist(), [1.0, 5.0, 4.0])
+
+        single = EnergyDataset.from_csv(StringIO("date,kwh\n2023-03-11T23:00:00-05:00,1\n"))
+        self.assertEqual(str(single.dates[0]), "2023-03-11")
+
+WIDE_CSV = """date,m1,m2,m3
+2023-06-01,10,20,
+2023-06-02,11,22,33
+2023-06-03,12,,36
+"""
+
+LONG_CSV = """date,meter_id,kwh
+2023-06-01,m1,10
+2023-06-01,m2,20
+2023-06-02,m1,11
+2023-06-02,m2,22
+2023-06-02,m3,33
+2023-06-03,m1,12
+2023-06-03,m3,36
+"""
+
+
+class TestMultiMeterAlignment(unittest.TestCase):
+
+    def setUp(self):
+        self.degree_days = DegreeDaysArray.from_temperatures(
+            ["2023-06-01", "2023-06-02", "2023-06-03", "2023-06-04"],
+            [60, 58, 56, 54], [40, 38, 36, 34],
+        )
+
+    def test_wide_and_long_formats_align_identically(self):
+        wide = EnergyDataset.from_csv(StringIO(WIDE_CSV)).align_matrix(self.degree_days)
+        long = EnergyDataset.from_long_csv(StringIO(LONG_CSV)).align_matrix(self.degree_days)
+
+        self.assertEqual(wide.meter_ids, ["m1", "m2", "m3"])
+        self.assertEqual(long.meter_ids, wide.meter_ids)
+        np.testing.assert_array_equal(wide.energy, long.energy)
+        np.testing.assert_array_equal(wide.mask, long.mask)
+        self.assertEqual(wide.energy.shape, (3, 3))
+        self.assertEqual(wide.mask.tolist(), [[True, True, True], [True, True, False], [False, True, True]])
+        self.assertEqual(wide.degree_days.tolist(), [15.0, 17.0, 19.0])
+
+    def test_feeds_batch_regression(self):
+        aligned = EnergyDataset.from_csv(StringIO(WIDE_CSV)).align_matrix(self.degree_days, columns=["m1", "m3"])
+        batch = perform_regression_batch(aligned.degree_days, aligned.energy)
+        np.testing.assert_allclose(batch.slopes, [0.5, 1.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
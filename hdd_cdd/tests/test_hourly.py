@@ -0,0 +1,149 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from hdd_cdd_calculator import (
+    MultiBaseDegreeDays,
+    calculate_degree_days,
+    calculate_degree_days_array,
+    degree_days_from_hourly,
+    degree_hours,
+    get_degree_days,
+)
+from hdd_cdd_calculator.calculator import configure_point_cache
+from hdd_cdd_calculator.meteostat_api import fetch_meteostat_data, meteostat_hourly_to_degree_days
+
+
+def _sine_day(days, mean=60.0, amplitude=10.0):
+    times = np.arange(
+        np.datetime64("2023-01-01T00"), np.datetime64("2023-01-01T00") + np.timedelta64(24 * days, "h")
+    )
+    temps = mean + amplitude * np.sin(2 * np.pi * np.arange(len(times)) / 24)
+    return times, temps
+
+
+class TestSineMethods(unittest.TestCase):
+
+    def test_single_sine_counts_hours_on_both_sides_of_the_base(self):
+        hdd, cdd = calculate_degree_days(70, 50, 62, method="single_sine")
+        self.assertAlmostEqual(hdd, 4.24698, places=4)
+        self.assertAlmostEqual(cdd, 2.24698, places=4)
+        # Entirely below or above the base matches the mean method
+        self.assertEqual(calculate_degree_days(60, 40, method="single_sine"), calculate_degree_days(60, 40))
+        self.assertEqual(calculate_degree_days(90, 70, method="single_sine"), calculate_degree_days(90, 70))
+
+    def test_sine_matches_numerical_integration(self):
+        phase = np.linspace(0, 2 * np.pi, 200001)
+        curve = 60 + 10 * np.sin(phase)
+        expected = np.maximum(curve - 62, 0).mean()
+        _, cdd = calculate_degree_days_array([70], [50], 62, method="single_sine")
+        self.assertAlmostEqual(cdd[0], expected, places=3)
+
+    def test_double_sine_uses_next_days_low(self):
+        hdd, _ = calculate_degree_days_array([70, 70], [50, 40], 62, method="double_sine")
+        single, _ = calculate_degree_days_array([70, 70], [50, 40], 62, method="single_sine")
+        tomorrow, _ = calculate_degree_days_array([70], [40], 62, method="single_sine")
+        self.assertAlmostEqual(hdd[0], (single[0] + tomorrow[0]) / 2)
+        self.assertAlmostEqual(hdd[1], single[1])  # last day has no next low
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            calculate_degree_days(70, 50, method="cubic")
+        with self.assertRaises(ValueError):
+            get_degree_days(40.7, -74.0, "2023-01-01", "2023-01-02", method="cubic")
+
+
+class TestHourlyIntegration(unittest.TestCase):
+
+    def test_degree_hours(self):
+        hdh, cdh = degree_hours([60, 70, np.nan], 65)
+        np.testing.assert_allclose(hdh, [5, 0, np.nan])
+        np.testing.assert_allclose(cdh, [0, 5, np.nan])
+
+    def test_constant_day_matches_mean_method(self):
+        times, _ = _sine_day(2)
+        results = degree_days_from_hourly(times, np.full(len(times), 55.0), 65)
+        np.testing.assert_array_equal(results.dates, np.array(["2023-01-01", "2023-01-02"], dtype="datetime64[D]"))
+        np.testing.assert_allclose(results.hdd, [10.0, 10.0])
+        np.testing.assert_allclose(results.cdd, [0.0, 0.0])
+
+    def test_profile_crossing_the_base(self):
+        times, temps = _sine_day(3)
+        results = degree_days_from_hourly(times, temps, 62)
+        expected = np.maximum(62 - temps[:24], 0).mean()
+        np.testing.assert_allclose(results.hdd, expected)
+        np.testing.assert_allclose(results.high_temp, 70.0)
+        np.testing.assert_allclose(results.low_temp, 50.0)
+        np.testing.assert_allclose(results.mean_temp, 60.0, atol=1e-9)
+
+    def test_sites_and_bases(self):
+        times, temps = _sine_day(2)
+        per_site = degree_days_from_hourly(times, np.vstack([temps, temps + 20]), 65)
+        self.assertEqual(len(per_site), 2)
+        np.testing.assert_allclose(per_site[1].hdd, np.maximum(65 - temps[:24] - 20, 0).mean())
+
+        multi = degree_days_from_hourly(times, temps, [60, 65])
+        self.assertIsInstance(multi, MultiBaseDegreeDays)
+        np.testing.assert_allclose(multi.hdd[:, 1], per_site[0].hdd)
+
+    def test_incomplete_days(self):
+        times, temps = _sine_day(2)
+        temps[30:40] = np.nan
+        results = degree_days_from_hourly(times, temps, 65, min_samples=18)
+        self.assertFalse(np.isnan(results.hdd[0]))
+        self.assertTrue(np.isnan(results.hdd[1]))
+        self.assertEqual(len(degree_days_from_hourly(times, temps, 65, dropna=True)), 1)
+
+    def test_meteostat_hourly_uses_local_days(self):
+        times, temps = _sine_day(3)
+        df = pd.DataFrame({"temp": (temps - 32) * 5 / 9}, index=pd.DatetimeIndex(times))
+        results = meteostat_hourly_to_degree_days(df, 65, time_zone="America/New_York")
+        # Shifted to local time the first UTC hours fall on Dec 31 (5 samples, dropped)
+        self.assertEqual(str(results.dates[0]), "2023-01-01")
+        self.assertEqual(len(results), 3)
+
+    def test_meteostat_hourly_days_follow_dst(self):
+        # Hours from Saturday to Monday around the spring DST change, in UTC
+        times = np.datetime64("2023-03-11T05:00") + np.arange(71).astype("timedelta64[h]")
+        df = pd.DataFrame({"temp": np.arange(71.0) / 4}, index=pd.DatetimeIndex(times))
+        with mock.patch("hdd_cdd_calculator.meteostat_api.fetch_meteostat_hourly", return_value=df), \
+                mock.patch("hdd_cdd_calculator.meteostat_api.station_time_zone", return_value="America/New_York"):
+            results = fetch_meteostat_data(40.7, -74.0, "2023-03-11", "2023-03-13", columnar=True, method="hourly")
+
+        # 24 local hours on Mar 11, 23 on the DST day, 24 on Mar 13
+        np.testing.assert_array_equal(results.dates.astype(str), ["2023-03-11", "2023-03-12", "2023-03-13"])
+        mean_temps = [np.arange(24).mean(), np.arange(24, 47).mean(), np.arange(47, 71).mean()]
+        np.testing.assert_allclose(results.mean_temp, 32 + 1.8 * np.array(mean_temps) / 4)
+
+
+class TestNWSHourly(unittest.TestCase):
+
+    def test_get_degree_days_integrates_hourly_forecast(self):
+        configure_point_cache()
+        times, temps = _sine_day(2)
+        periods = [
+            {"startTime": f"{t}:00-05:00", "temperature": float(temp), "temperatureUnit": "F"}
+            for t, temp in zip(np.datetime_as_string(times, unit="m"), temps)
+        ]
+        points = mock.Mock()
+        points.json.return_value = {"properties": {"forecastHourly": "https://example/hourly"}}
+        hourly = mock.Mock()
+        hourly.json.return_value = {"properties": {"periods": periods[5:]}}
+
+        with mock.patch("hdd_cdd_calculator.calculator.http_get", side_effect=[points, hourly]):
+            results = get_degree_days(
+                40.7, -74.0, "2023-01-01", "2023-01-02", method="hourly", columnar=True
+            )
+        # 19 hourly samples on the first day is still enough
+        self.assertEqual(len(results), 2)
+        np.testing.assert_allclose(results.hdd[1], np.maximum(65 - temps[24:], 0).mean())
+
+    def test_cache_rejects_hourly(self):
+        with self.assertRaises(ValueError):
+            get_degree_days(40.7, -74.0, "2023-01-01", "2023-01-02", method="hourly", cache=object())
+
+
+if __name__ == "__main__":
+    unittest.main()
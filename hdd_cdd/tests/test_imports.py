@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+import unittest
+
+# Modules that must not load when only the core math is used
+HEAVY_MODULES = ("pandas", "requests", "sklearn", "matplotlib", "meteostat", "pyarrow")
+
+# Generous ceiling for the package's own import cost, excluding NumPy (seconds)
+MAX_PACKAGE_IMPORT_SECONDS = 0.25
+
+
+def _run(code, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+class TestImportCost(unittest.TestCase):
+
+    def test_core_imports_do_not_load_heavy_dependencies(self):
+        code = (
+            "import json, sys\n"
+            "from hdd_cdd_calculator import calculate_degree_days, DegreeDaysArray\n"
+            "import hdd_cdd_calculator.utils\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        self.assertEqual(json.loads(_run(code).stdout), [])
+
+    def test_cli_help_does_not_load_heavy_dependencies(self):
+        code = (
+            "import json, sys\n"
+            "sys.argv = ['hdd_cdd_calculator', '--help']\n"
+            "from hdd_cdd_calculator.__main__ import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        self.assertEqual(json.loads(_run(code).stdout.splitlines()[-1]), [])
+
+    def test_lazy_attributes_resolve(self):
+        code = (
+            "import hdd_cdd_calculator as h\n"
+            "missing = [n for n in h.__all__ if getattr(h, n, None) is None]\n"
+            "print(','.join(missing))"
+        )
+        self.assertEqual(_run(code).stdout.strip(), "")
+
+    def test_package_import_time(self):
+        # -X importtime reports cumulative microseconds per module on stderr
+        stderr = _run("import hdd_cdd_calculator", "-X", "importtime").stderr
+        cumulative = {}
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, total, name = line.split("|")
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total)
+        own = cumulative["hdd_cdd_calculator"] - cumulative.get("numpy", 0)
+        self.assertLess(own / 1e6, MAX_PACKAGE_IMPORT_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import io
+import logging
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from hdd_cdd_calculator import DegreeDaysArray, align_energy_with_degree_days, record_metrics
+from hdd_cdd_calculator import instrumentation
+from hdd_cdd_calculator.calculator import configure_point_cache, get_point_properties
+from hdd_cdd_calculator.meteostat_api import fetch_meteostat_daily
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_disabled_stage_is_a_shared_no_op(self):
+        self.assertFalse(instrumentation.enabled())
+        with instrumentation.stage("anything") as stage:
+            stage.rows = 10
+        self.assertIs(instrumentation.stage("other"), instrumentation._NULL_STAGE)
+
+    def test_records_stages_rows_and_counters(self):
+        degree_days = DegreeDaysArray.from_temperatures(
+            ["2023-06-01", "2023-06-02"], [70, 72], [50, 52]
+        )
+        csv = io.StringIO("date,kwh\n2023-06-01,10\n2023-06-02,12\n2023-06-03,14\n")
+        with record_metrics() as metrics:
+            align_energy_with_degree_days(degree_days, csv)
+            instrumentation.increment("custom", 2)
+        align_energy_with_degree_days(degree_days, io.StringIO(csv.getvalue()))
+
+        snapshot = metrics.to_dict()
+        self.assertEqual(snapshot["stages"]["csv.read"]["rows"], 3)
+        self.assertEqual(snapshot["stages"]["csv.align"]["rows"], 2)
+        self.assertEqual(snapshot["stages"]["csv.align"]["count"], 1)  # not after the block
+        self.assertEqual(snapshot["counters"], {"custom": 2})
+        self.assertFalse(instrumentation.enabled())
+
+    def test_http_requests_bytes_and_point_cache(self):
+        configure_point_cache()
+        # 18 bytes decoded from 12 bytes on the wire
+        response = mock.Mock(content=b'{"properties": {}}', raw=mock.Mock(retries=None, **{"tell.return_value": 12}))
+        response.json.return_value = {"properties": {"forecast": "url"}}
+        session = mock.Mock()
+        session.get.return_value = response
+
+        with mock.patch("hdd_cdd_calculator.http_session.get_session", return_value=session):
+            with record_metrics() as metrics:
+                get_point_properties(40.0, -74.0)
+                get_point_properties(40.0, -74.0)
+
+        counters = metrics.to_dict()["counters"]
+        self.assertEqual(counters["http.requests"], 1)
+        self.assertEqual(counters["http.bytes"], 12)
+        self.assertEqual(counters["point_cache.misses"], 1)
+        self.assertEqual(counters["point_cache.hits"], 1)
+        self.assertEqual(metrics.to_dict()["stages"]["nws.points"]["count"], 1)
+
+    def test_meteostat_fetches_are_counted(self):
+        daily = mock.Mock()
+        daily.return_value.fetch.return_value = pd.DataFrame({"tmin": [10.0], "tmax": [20.0]})
+        with mock.patch("hdd_cdd_calculator.meteostat_api.Daily", daily):
+            with record_metrics() as metrics:
+                fetch_meteostat_daily(40.0, -74.0, "2023-06-01", "2023-06-01")
+
+        snapshot = metrics.to_dict()
+        self.assertEqual(snapshot["counters"]["meteostat.requests"], 1)
+        self.assertEqual(snapshot["stages"]["meteostat.fetch"]["rows"], 1)
+
+    def test_exports(self):
+        metrics = instrumentation.Metrics()
+        metrics("stage", "csv.align", 0.5, 100)
+        metrics("counter", "http.requests", 3)
+
+        text = metrics.to_openmetrics()
+        self.assertIn('hdd_cdd_stage_seconds_count{stage="csv.align"} 1', text)
+        self.assertIn('hdd_cdd_stage_rows_total{stage="csv.align"} 100', text)
+        self.assertIn("hdd_cdd_http_requests_total 3", text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+        with self.assertLogs("hdd_cdd_calculator.instrumentation", logging.INFO) as logs:
+            metrics.log()
+        self.assertEqual(len(logs.output), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
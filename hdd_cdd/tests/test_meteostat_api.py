@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hdd_cdd_calculator.meteostat_api import meteostat_to_degree_days
+
+
+class TestMeteostatToDegreeDays(unittest.TestCase):
+
+    def test_vectorized_conversion_skips_incomplete_days(self):
+        df = pd.DataFrame(
+            {
+                "tavg": [15.0, 20.0, 25.0],
+                "tmin": [10.0, np.nan, 20.0],
+                "tmax": [20.0, 25.0, 30.0],
+            },
+            index=pd.date_range("2023-06-01", periods=3, name="time"),
+        )
+        results = meteostat_to_degree_days(df, base_temp=65.0)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual([r.date for r in results], ["2023-06-01", "2023-06-03"])
+        np.testing.assert_allclose(results.high_temp, [68.0, 86.0])
+        np.testing.assert_allclose(results.low_temp, [50.0, 68.0])
+        np.testing.assert_allclose(results.hdd, [6.0, 0.0])
+        np.testing.assert_allclose(results.cdd, [0.0, 12.0])
+
+    def test_empty_frame(self):
+        self.assertEqual(len(meteostat_to_degree_days(pd.DataFrame())), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
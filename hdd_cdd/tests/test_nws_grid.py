@@ -0,0 +1,141 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from hdd_cdd_calculator import (
+    MultiBaseDegreeDays,
+    fetch_gridpoint_degree_days_many,
+    get_degree_days,
+)
+from hdd_cdd_calculator.calculator import configure_point_cache
+from hdd_cdd_calculator.nws_grid import (
+    expand_intervals,
+    gridpoint_to_degree_days,
+    parse_intervals,
+)
+
+
+def _c(temp_f):
+    return (temp_f - 32) * 5 / 9
+
+
+def _gridpoint():
+    """Two days of raw data for a New York grid cell (UTC intervals, °C)."""
+    return {
+        "maxTemperature": {"uom": "wmoUnit:degC", "values": [
+            {"validTime": "2023-06-01T12:00:00+00:00/PT13H", "value": _c(80)},
+            {"validTime": "2023-06-02T12:00:00+00:00/PT13H", "value": _c(70)},
+            {"validTime": "2023-06-03T12:00:00+00:00/PT13H", "value": _c(75)},
+        ]},
+        "minTemperature": {"uom": "wmoUnit:degC", "values": [
+            {"validTime": "2023-06-01T00:00:00+00:00/PT14H", "value": _c(60)},
+            {"validTime": "2023-06-02T00:00:00+00:00/PT14H", "value": _c(50)},
+        ]},
+        "temperature": {"uom": "wmoUnit:degC", "values": [
+            {"validTime": "2023-06-01T04:00:00+00:00/PT12H", "value": _c(60)},
+            {"validTime": "2023-06-01T16:00:00+00:00/PT12H", "value": _c(80)},
+            {"validTime": "2023-06-02T04:00:00+00:00/P1D", "value": _c(50)},
+        ]},
+    }
+
+
+def _response(payload):
+    response = mock.Mock()
+    response.json.return_value = payload
+    return response
+
+
+class TestIntervalParsing(unittest.TestCase):
+
+    def test_parse_intervals(self):
+        starts, durations = parse_intervals([
+            "2023-06-01T12:00:00+00:00/PT13H",
+            "2023-06-01T08:00:00-04:00/P1DT2H30M",
+            "2023-06-01T12:00:00Z/PT1H",
+        ])
+        np.testing.assert_array_equal(starts, np.array(["2023-06-01T12:00:00"] * 3, dtype="datetime64[s]"))
+        np.testing.assert_array_equal(durations.astype(np.int64), [13 * 3600, 26.5 * 3600, 3600])
+
+        with self.assertRaises(ValueError):
+            parse_intervals(["2023-06-01T12:00:00+00:00/PT"])
+        with self.assertRaises(ValueError):
+            parse_intervals(["2023-06-01T12:00:00+00:00/1H"])
+
+    def test_expand_intervals(self):
+        starts, durations = parse_intervals(["2023-06-01T00:00:00+00:00/PT3H", "2023-06-01T03:00:00+00:00/PT1H"])
+        times, values = expand_intervals(starts, durations, np.array([1.0, 2.0]))
+        self.assertEqual(len(times), 4)
+        np.testing.assert_array_equal(values, [1, 1, 1, 2])
+        self.assertEqual(str(times[-1]), "2023-06-01T03:00:00")
+
+
+class TestGridpointDegreeDays(unittest.TestCase):
+
+    def test_daily_from_max_and_min(self):
+        results = gridpoint_to_degree_days(_gridpoint(), time_zone="America/New_York")
+        # Lows are dated by the local morning they fall on; June 3 has no low
+        np.testing.assert_array_equal(results.dates, np.array(["2023-06-01", "2023-06-02"], dtype="datetime64[D]"))
+        np.testing.assert_allclose(results.high_temp, [80, 70])
+        np.testing.assert_allclose(results.low_temp, [60, 50])
+        np.testing.assert_allclose(results.cdd, [5, 0])
+
+    def test_hourly_method(self):
+        results = gridpoint_to_degree_days(_gridpoint(), time_zone="America/New_York", method="hourly")
+        # Local June 1 runs 04:00-04:00 UTC: 12 h at 60 °F and 12 h at 80 °F
+        self.assertEqual(str(results.dates[0]), "2023-06-01")
+        np.testing.assert_allclose(results.hdd[0], 2.5)
+        np.testing.assert_allclose(results.cdd[0], 7.5)
+
+        multi = gridpoint_to_degree_days(_gridpoint(), [60, 65], "America/New_York", method="hourly")
+        np.testing.assert_allclose(multi.hdd[0], [0.0, 2.5])
+
+
+class TestGridpointSource(unittest.TestCase):
+
+    def setUp(self):
+        configure_point_cache()
+
+    def _points(self, grid_url):
+        return _response({"properties": {
+            "forecastGridData": grid_url, "timeZone": "America/New_York",
+        }})
+
+    def test_get_degree_days_source(self):
+        with mock.patch("hdd_cdd_calculator.calculator.http_get", return_value=self._points("grid/OKX/33,35")), \
+                mock.patch("hdd_cdd_calculator.nws_grid.http_get", return_value=_response({"properties": _gridpoint()})) as grid:
+            results = get_degree_days(40.7, -74.0, "2023-06-02", "2023-06-05", source="nws_grid", columnar=True)
+        grid.assert_called_once_with("grid/OKX/33,35")
+        self.assertEqual([str(d) for d in results.dates], ["2023-06-02"])
+
+    def test_sites_sharing_a_cell_download_it_once(self):
+        points = {
+            "40.7000,-74.0000": "grid/OKX/33,35",
+            "40.7100,-74.0100": "grid/OKX/33,35",
+            "42.0000,-71.0000": "grid/BOX/70,80",
+        }
+
+        def fake_points(url):
+            return self._points(points[url.rsplit("/", 1)[1]])
+
+        locations = {"a": (40.7, -74.0), "b": (40.71, -74.01), "c": (42.0, -71.0), "bad": (95.0, 0.0)}
+        with mock.patch("hdd_cdd_calculator.calculator.http_get", side_effect=fake_points), \
+                mock.patch("hdd_cdd_calculator.nws_grid.http_get", return_value=_response({"properties": _gridpoint()})) as grid:
+            results, errors = fetch_gridpoint_degree_days_many(locations, columnar=True)
+        self.assertEqual(grid.call_count, 2)
+        self.assertEqual(sorted(results), ["a", "b", "c"])
+        self.assertIs(results["a"], results["b"])
+        self.assertEqual(list(errors), ["bad"])
+
+    def test_many_sites_with_several_base_temperatures(self):
+        locations = [(40.7, -74.0), (40.71, -74.01)]
+        with mock.patch("hdd_cdd_calculator.calculator.http_get", return_value=self._points("grid/OKX/33,35")), \
+                mock.patch("hdd_cdd_calculator.nws_grid.http_get", return_value=_response({"properties": _gridpoint()})):
+            results, errors = fetch_gridpoint_degree_days_many(locations, base_temp=[60, 65])
+        self.assertEqual(errors, {})
+        self.assertIsInstance(results[0], MultiBaseDegreeDays)
+        self.assertEqual(results[1].hdd.shape[1], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import io
+import unittest
+
+import numpy as np
+
+from hdd_cdd_calculator import DegreeDayIndex, MultiBaseDegreeDays, align_energy_with_billing_periods
+from helpers import daily_series
+
+HIGHS = 50 + 10 * np.sin(np.arange(60) / 5)
+
+
+class TestDegreeDayIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.degree_days = daily_series("2023-01-01", 60, HIGHS, HIGHS - 20)
+
+    def test_totals_match_direct_sums(self):
+        degree_days = self.degree_days
+        index = DegreeDayIndex.from_degree_days(degree_days)
+        starts = np.array(["2023-01-01", "2023-01-10", "2023-02-01"], dtype="datetime64[D]")
+        ends = np.array(["2023-01-31", "2023-01-10", "2023-03-01"], dtype="datetime64[D]")
+        totals = index.totals(starts, ends)
+
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            selected = degree_days.select(start, end)
+            self.assertAlmostEqual(totals.hdd[i], selected.hdd.sum())
+            self.assertAlmostEqual(totals.cdd[i], selected.cdd.sum())
+        np.testing.assert_array_equal(totals.days, [31, 1, 29])
+        np.testing.assert_array_equal(totals.missing_days, [0, 0, 0])
+        self.assertAlmostEqual(index.total("2023-01-01", "2023-01-31"), totals.hdd[0])
+
+    def test_gaps_and_out_of_range_days_are_missing(self):
+        degree_days = self.degree_days[:10]
+        degree_days.hdd[3] = np.nan
+        index = DegreeDayIndex.from_degree_days(degree_days[np.arange(10) != 5])
+        totals = index.totals(["2022-12-30", "2023-01-07"], ["2023-01-06", "2023-01-08"])
+        np.testing.assert_array_equal(totals.missing_days, [4, 0])  # 2 before, NaN day, gap
+        np.testing.assert_array_equal(totals.complete, [False, True])
+        expected = np.nansum(degree_days.hdd[[0, 1, 2, 4]])
+        self.assertAlmostEqual(totals.hdd[0], expected)
+
+    def test_multi_base_totals(self):
+        degree_days = self.degree_days
+        multi = MultiBaseDegreeDays.from_degree_days(degree_days, [60, 65])
+        index = DegreeDayIndex.from_degree_days(multi)
+        totals = index.totals(["2023-01-05"], ["2023-01-25"])
+        self.assertEqual(totals.hdd.shape, (1, 2))
+        self.assertAlmostEqual(totals.hdd[0, 1], degree_days.select("2023-01-05", "2023-01-25").hdd.sum())
+        np.testing.assert_allclose(index.total("2023-01-05", "2023-01-25", "cdd"), totals.cdd[0])
+
+    def test_invalid_periods(self):
+        index = DegreeDayIndex.from_degree_days(self.degree_days)
+        with self.assertRaises(ValueError):
+            index.totals(["2023-01-10"], ["2023-01-09"])
+        with self.assertRaises(ValueError):
+            index.total("2023-01-01", "2023-01-02", column="kwh")
+        empty = DegreeDayIndex([], [], [])
+        self.assertEqual(empty.totals(["2023-01-01"], ["2023-01-03"]).missing_days.tolist(), [3])
+
+
+class TestBillingPeriodAlignment(unittest.TestCase):
+
+    def setUp(self):
+        self.degree_days = daily_series("2023-01-01", 60, HIGHS, HIGHS - 20)
+
+    def test_aligns_bills_without_daily_rows(self):
+        degree_days = self.degree_days
+        csv = io.StringIO(
+            "start_date,end_date,kwh\n"
+            "2023-02-01,2023-02-20,300\n"
+            "2023-01-01,2023-01-31,500\n"
+            "2023-02-21,2023-03-15,250\n"  # runs past the degree day data
+        )
+        energy, hdd = align_energy_with_billing_periods(degree_days, csv)
+        self.assertEqual(energy, [500.0, 300.0])
+        self.assertAlmostEqual(hdd[0], degree_days.select("2023-01-01", "2023-01-31").hdd.sum())
+
+        csv.seek(0)
+        energy, hdd = align_energy_with_billing_periods(degree_days, csv, per_day=True)
+        self.assertAlmostEqual(energy[0], 500 / 31)
+
+    def test_multi_base_and_missing_coverage(self):
+        multi = MultiBaseDegreeDays.from_degree_days(self.degree_days, [60, 65])
+        csv = io.StringIO("start_date,end_date,kwh\n2023-01-01,2023-01-31,500\n")
+        _, hdd = align_energy_with_billing_periods(multi, csv)
+        self.assertEqual(hdd.shape, (1, 2))
+
+        with self.assertRaises(ValueError):
+            align_energy_with_billing_periods(
+                multi, io.StringIO("start_date,end_date,kwh\n2024-01-01,2024-01-31,500\n")
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
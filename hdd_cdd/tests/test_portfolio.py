@@ -0,0 +1,95 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from hdd_cdd_calculator import MultiBaseDegreeDays
+from hdd_cdd_calculator.exceptions import NWSAPIError
+from hdd_cdd_calculator.portfolio import run_portfolio
+
+
+def _fake_get_degree_days(lat, lon, start_date, end_date, source="nws", base_temp=65.0, cache=None, **kwargs):
+    if lat > 80:
+        raise NWSAPIError("no data for this site")
+    dates = np.arange(np.datetime64(start_date), np.datetime64(end_date) + 1)
+    lows = 40.0 + np.arange(len(dates))
+    return MultiBaseDegreeDays.from_temperatures(dates, lows + 20, lows, base_temp)
+
+
+class TestRunPortfolio(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        dates = pd.date_range("2023-01-01", periods=6).strftime("%Y-%m-%d")
+        # 65 - mean temp is 15, 14, ... so usage is exactly 100 + 10 * HDD
+        pd.DataFrame({"date": dates, "kwh": 100 + 10 * (15 - np.arange(6))}).to_csv(
+            os.path.join(root, "meter.csv"), index=False
+        )
+        pd.DataFrame({
+            "site_id": ["a", "b", "bad"],
+            "lat": [40.0, 41.0, 85.0],
+            "lon": [-74.0, -75.0, -75.0],
+            "meter_csv": ["meter.csv"] * 3,
+            "base_temps": ["65", "60;65", ""],
+        }).to_csv(os.path.join(root, "manifest.csv"), index=False)
+        self.manifest = os.path.join(root, "manifest.csv")
+        self.output = os.path.join(root, "results.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, **kwargs):
+        with mock.patch("hdd_cdd_calculator.portfolio.get_degree_days", side_effect=_fake_get_degree_days) as fetch:
+            summary = run_portfolio(self.manifest, self.output, workers=2, progress=io.StringIO(), **kwargs)
+        return summary, fetch
+
+    def test_writes_one_row_per_site_and_base(self):
+        summary, _ = self._run()
+
+        self.assertEqual((summary.total, summary.completed, summary.failed), (3, 2, 1))
+        self.assertIn("bad", summary.errors)
+        results = pd.read_csv(self.output)
+        self.assertEqual(list(results["site_id"]), ["a", "b", "b"])
+        self.assertEqual(list(results["base_temp"]), [65.0, 60.0, 65.0])
+        row = results.iloc[0]
+        self.assertAlmostEqual(row["slope"], 10.0)
+        self.assertAlmostEqual(row["intercept"], 100.0)
+        self.assertEqual(row["n"], 6)
+
+    def test_resume_skips_completed_sites(self):
+        self._run()
+        summary, fetch = self._run(resume=True)
+
+        self.assertEqual(summary.skipped, 2)
+        self.assertEqual(fetch.call_count, 1)  # only the failed site is retried
+        self.assertEqual(len(pd.read_csv(self.output)), 3)
+        with open(self.output + ".checkpoint.jsonl") as f:
+            statuses = [json.loads(line)["status"] for line in f]
+        self.assertEqual(statuses.count("ok"), 2)
+
+    def test_unexpected_errors_are_recorded_per_site(self):
+        def flaky(lat, *args, **kwargs):
+            if lat == 40.0:
+                raise KeyError("properties")
+            return _fake_get_degree_days(lat, *args, **kwargs)
+
+        with mock.patch("hdd_cdd_calculator.portfolio.get_degree_days", side_effect=flaky):
+            summary = run_portfolio(self.manifest, self.output, workers=2, progress=None)
+
+        self.assertEqual((summary.completed, summary.failed), (1, 2))
+        self.assertEqual(summary.errors["a"], "KeyError: 'properties'")
+        self.assertEqual(list(pd.read_csv(self.output)["site_id"]), ["b", "b"])
+
+    def test_rejects_unknown_output_format(self):
+        with self.assertRaises(ValueError):
+            run_portfolio(self.manifest, os.path.join(self.tmp.name, "results.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+from hdd_cdd_calculator import fit_change_point_model, perform_regression, perform_regression_batch
+
+
+class TestChangePointModel(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.temps = rng.uniform(20, 90, 400)
+        self.noise = rng.normal(0, 1, 400)
+
+    def test_finds_5p_balance_points(self):
+        energy = (100 + 3 * np.maximum(55 - self.temps, 0)
+                  + 4 * np.maximum(self.temps - 70, 0) + self.noise)
+        model = fit_change_point_model(self.temps, energy)
+
+        self.assertEqual(model.model_type, "5P")
+        self.assertEqual((model.heating_base, model.cooling_base), (55.0, 70.0))
+        self.assertAlmostEqual(model.heating_slope, 3.0, delta=0.05)
+        self.assertAlmostEqual(model.cooling_slope, 4.0, delta=0.05)
+        self.assertGreater(model.r2, 0.99)
+        self.assertAlmostEqual(model.nmbe, 0.0, places=9)
+
+    def test_3ph_matches_least_squares(self):
+        energy = 50 + 2 * np.maximum(60 - self.temps, 0) + self.noise
+        model = fit_change_point_model(self.temps, energy, bases=[60], models=["3PH"])
+        reference = LinearRegression().fit(np.maximum(60 - self.temps, 0).reshape(-1, 1), energy)
+
+        self.assertAlmostEqual(model.heating_slope, reference.coef_[0])
+        self.assertAlmostEqual(model.intercept, reference.intercept_)
+        np.testing.assert_allclose(model.predict([50, 70]), reference.predict([[10], [0]]))
+
+    def test_invalid_models_rejected(self):
+        with self.assertRaises(ValueError):
+            fit_change_point_model(self.temps, self.temps, models=["6P"])
+
+
+class TestPerformRegressionBatch(unittest.TestCase):
+
+    def test_matches_per_meter_regression_with_missing_readings(self):
+        rng = np.random.default_rng(1)
+        hdd = rng.uniform(0, 30, 60)
+        energy = 200 + np.array([[5.0], [2.0], [0.5]]) * hdd + rng.normal(0, 3, (3, 60))
+        energy[1, ::4] = np.nan
+
+        batch = perform_regression_batch(hdd, energy)
+        for i in range(3):
+            keep = ~np.isnan(energy[i])
+            reference = perform_regression(hdd[keep], energy[i, keep])
+            self.assertAlmostEqual(batch.slopes[i], reference.coef_[0])
+            self.assertAlmostEqual(batch.intercepts[i], reference.intercept_)
+            self.assertAlmostEqual(batch.r2[i], reference.score(hdd[keep].reshape(-1, 1), energy[i, keep]))
+            residuals = energy[i, keep] - reference.predict(hdd[keep].reshape(-1, 1))
+            self.assertAlmostEqual(batch.rmse[i], np.sqrt((residuals ** 2).sum() / (keep.sum() - 2)))
+            self.assertAlmostEqual(batch.cv_rmse[i], batch.rmse[i] / energy[i, keep].mean())
+        self.assertEqual(batch.n.tolist(), [60, 45, 60])
+
+        np.testing.assert_allclose(
+            batch.model(0).predict(hdd.reshape(-1, 1)),
+            batch.intercepts[0] + batch.slopes[0] * hdd,
+        )
+
+    def test_degenerate_meters_get_nan(self):
+        batch = perform_regression_batch(np.ones(5), np.arange(10.0).reshape(2, 5))
+        self.assertTrue(np.isnan(batch.slopes).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from io import StringIO
+
+import numpy as np
+
+from hdd_cdd_calculator import (
+    DegreeDaysArray,
+    DegreeDaysResult,
+    MultiBaseDegreeDays,
+    align_energy_with_degree_days,
+)
+
+
+class TestDegreeDaysArray(unittest.TestCase):
+
+    def setUp(self):
+        self.results = [
+            DegreeDaysResult("2023-06-01", 70.0, 50.0, 60.0, 5.0, 0.0),
+            DegreeDaysResult("2023-06-02", 80.0, 60.0, 70.0, 0.0, 5.0),
+            DegreeDaysResult("2023-06-03", 65.0, 65.0, 65.0, 0.0, 0.0),
+        ]
+        self.array = DegreeDaysArray.from_results(self.results)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.array), 3)
+        self.assertEqual(list(self.array), self.results)
+        self.assertEqual(self.array[1], self.results[1])
+        self.assertEqual(self.array.dates.dtype, np.dtype("datetime64[D]"))
+
+    def test_from_temperatures(self):
+        array = DegreeDaysArray.from_temperatures(
+            ["2023-06-01", "2023-06-02", "2023-06-03"], [70, 80, 65], [50, 60, 65]
+        )
+        self.assertEqual(array.to_list(), self.results)
+
+    def test_slicing_and_select(self):
+        self.assertIsInstance(self.array[1:], DegreeDaysArray)
+        self.assertEqual(self.array[1:].to_list(), self.results[1:])
+        self.assertEqual(self.array.select("2023-06-02", "2023-06-02").to_list(), self.results[1:2])
+        self.assertEqual(self.array[self.array.hdd > 0].to_list(), self.results[:1])
+
+    def test_zero_copy_exports(self):
+        self.assertIs(self.array.to_numpy("hdd"), self.array.hdd)
+        df = self.array.to_pandas()
+        self.assertTrue(np.shares_memory(df["hdd"].to_numpy(), self.array.hdd))
+        self.assertEqual(list(df.columns), ["date", "high_temp", "low_temp", "mean_temp", "hdd", "cdd"])
+
+    def test_float32_dtype(self):
+        array = DegreeDaysArray.from_results(self.results, dtype=np.float32)
+        self.assertEqual(array.hdd.dtype, np.float32)
+
+    def test_align_accepts_columnar_results(self):
+        csv = StringIO("date,kwh\n2023-06-01,100\n2023-06-03,300\n")
+        energy, hdd = align_energy_with_degree_days(self.array, csv)
+        self.assertEqual(energy, [100, 300])
+        self.assertEqual(hdd, [5.0, 0.0])
+
+
+class TestMultiBaseDegreeDays(unittest.TestCase):
+
+    def setUp(self):
+        self.multi = MultiBaseDegreeDays.from_temperatures(
+            ["2023-06-01", "2023-06-02"], [70, 80], [50, 60], [55, 60, 65]
+        )
+
+    def test_matrix_shape_and_values(self):
+        self.assertEqual(self.multi.hdd.shape, (2, 3))
+        np.testing.assert_allclose(self.multi.hdd[0], [0.0, 0.0, 5.0])
+        np.testing.assert_allclose(self.multi.cdd[1], [15.0, 10.0, 5.0])
+
+    def test_for_base_matches_single_base(self):
+        single = DegreeDaysArray.from_temperatures(["2023-06-01", "2023-06-02"], [70, 80], [50, 60], 60)
+        self.assertEqual(self.multi.for_base(60).to_list(), single.to_list())
+
+    def test_align_returns_matrix(self):
+        csv = StringIO("date,kwh\n2023-06-02,200\n2023-06-01,100\n")
+        energy, hdd = align_energy_with_degree_days(self.multi, csv)
+        self.assertEqual(energy, [100, 200])
+        np.testing.assert_allclose(hdd, self.multi.hdd)
+
+
+if __name__ == '__main__':
+    unittest.main()
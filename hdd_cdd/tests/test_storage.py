@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from hdd_cdd_calculator import read_degree_days, write_degree_days
+from hdd_cdd_calculator import storage
+from helpers import daily_series
+
+
+class StorageRoundTripMixin:
+    format = None
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_partitions_by_location_and_year(self):
+        write_degree_days({"site/a": daily_series("2022-12-30", 4)}, self.root, format=self.format)
+
+        location_dir = os.path.join(self.root, "location=site%2Fa")
+        self.assertEqual(sorted(os.listdir(location_dir)), ["year=2022", "year=2023"])
+        result = read_degree_days(self.root)["site/a"]
+        self.assertEqual(len(result), 4)
+        np.testing.assert_allclose(result.hdd, 5.0)
+
+    def test_date_range_is_pushed_down(self):
+        write_degree_days(daily_series("2022-12-01", 60), self.root, location_id="a", format=self.format)
+
+        result = read_degree_days(self.root, "a", "2022-12-30", "2023-01-02")["a"]
+        self.assertEqual(
+            [str(d) for d in result.dates],
+            ["2022-12-30", "2022-12-31", "2023-01-01", "2023-01-02"],
+        )
+
+    def test_rewrite_replaces_overlapping_days(self):
+        write_degree_days(daily_series("2023-06-01", 5), self.root, location_id="a", format=self.format)
+        write_degree_days(daily_series("2023-06-04", 4, high=90.0), self.root, location_id="a", format=self.format)
+
+        result = read_degree_days(self.root, "a")["a"]
+        self.assertEqual(len(result), 7)
+        self.assertTrue(np.all(result.dates[1:] > result.dates[:-1]))
+        np.testing.assert_allclose(result.cdd, [0, 0, 0, 5, 5, 5, 5])
+        np.testing.assert_allclose(result.high_temp[3:], 90.0)
+
+
+class TestNpyStorage(StorageRoundTripMixin, unittest.TestCase):
+    format = "npy"
+
+    def test_columns_are_memory_mapped(self):
+        write_degree_days(daily_series("2023-06-01", 5), self.root, location_id="a", format="npy")
+        result = read_degree_days(self.root, "a")["a"]
+        # Read-only views over the mapped files rather than in-memory copies
+        self.assertFalse(result.hdd.flags.owndata)
+        self.assertFalse(result.hdd.flags.writeable)
+
+
+@unittest.skipIf(storage.pa is None, "pyarrow is not installed")
+class TestParquetStorage(StorageRoundTripMixin, unittest.TestCase):
+    format = "parquet"
+
+
+class TestStorageFormats(unittest.TestCase):
+
+    def test_parquet_requires_pyarrow(self):
+        with mock.patch.object(storage, "pa", None):
+            self.assertEqual(storage._resolve_format("auto"), "npy")
+            with self.assertRaises(ImportError):
+                storage._resolve_format("parquet")
+
+    def test_single_result_needs_location_id(self):
+        with self.assertRaises(ValueError):
+            write_degree_days(daily_series("2023-06-01", 1), tempfile.gettempdir())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from hdd_cdd_calculator import RegressionPlot, perform_regression_batch, plot_regression, render_regressions
+from hdd_cdd_calculator.visualization import RegressionRenderer, _regression_line
+
+
+class TestVisualization(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 30, size=(5, 50))
+        y = 100 + 4 * x + rng.normal(0, 5, size=x.shape)
+        fit = perform_regression_batch(x, y)
+        self.plots = [RegressionPlot(f"meter {i}", x[i], y[i], fit.model(i)) for i in range(5)]
+
+    def test_regression_line_is_sorted(self):
+        plot = self.plots[0]
+        line_x, line_y = _regression_line(plot.degree_days, plot.model)
+        self.assertTrue(np.all(np.diff(line_x) > 0))
+        self.assertTrue(np.all(np.diff(line_y) > 0))
+
+    def test_plot_regression_releases_figure(self):
+        plot = self.plots[0]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "plot.png"
+            plot_regression(plot.degree_days, plot.energy, plot.model, save_path=path, show=False)
+            self.assertTrue(path.exists())
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_renderer_reuses_artists(self):
+        renderer = RegressionRenderer(grid=(2, 2))
+        plots = self.plots[:3]
+        renderer.draw_page(plots)
+        artists = [list(ax.lines) for ax in renderer.axes]
+        renderer.draw_page(plots[:1])
+        self.assertEqual([list(ax.lines) for ax in renderer.axes], artists)
+        self.assertEqual([ax.get_visible() for ax in renderer.axes], [True, False, False, False])
+        with self.assertRaises(ValueError):
+            renderer.draw_page(self.plots)
+
+    def test_directory_and_grid_output(self):
+        plots = self.plots
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = render_regressions(plots, Path(tmp) / "single")
+            self.assertEqual([p.name for p in paths], [f"meter_{i}.png" for i in range(5)])
+            self.assertTrue(all(p.stat().st_size > 0 for p in paths))
+
+            paths = render_regressions(plots, Path(tmp) / "grid", grid=(2, 2), workers=2)
+            self.assertEqual([p.name for p in paths], ["page-0001.png", "page-0002.png"])
+
+            with self.assertRaises(ValueError):
+                render_regressions(plots + plots[:1], Path(tmp) / "dupes")
+
+    def test_multipage_pdf(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "meters.pdf"
+            self.assertEqual(render_regressions(self.plots[:3], path, grid=(1, 2)), [path])
+            self.assertEqual(len(re.findall(rb"/Type ?/Page\b", path.read_bytes())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,46 +15,105 @@ The package also includes:
     * Visualization support for regression results
 """
 
-# NWS data source
-from .calculator import (
-    get_degree_days_for_location,
-    get_degree_days_for_period,
-    DegreeDaysResult,
-)
-
-# Meteostat data source
-from .meteostat_api import fetch_meteostat_data
-
-# Unified multi-source access
-from .data_sources import get_degree_days
-
-# Regression analysis
-from .regression import perform_regression
-
-# Visualization
-from .visualization import plot_regression
-
-# CSV utilities
-from .csv_utils import (
-    read_energy_data_from_csv,
-    read_energy_data_with_dates,
-    align_energy_with_degree_days,
-)
-
-# Utilities
+# Heavy submodules (requests, pandas, meteostat, scikit-learn, matplotlib) are
+# imported on first attribute access (PEP 562), so importing the package or
+# the pure-math utilities stays cheap. Only NumPy is loaded eagerly.
+from .exceptions import NWSAPIError, InvalidCoordinatesError
+from .results import DegreeDaysResult, DegreeDaysArray, MultiBaseDegreeDays
 from .utils import (
     validate_coordinates,
     calculate_degree_days,
+    calculate_degree_days_array,
+    calculate_degree_days_matrix,
     fahrenheit_to_celsius,
     celsius_to_fahrenheit,
     mean_temperature,
 )
 
-# Exceptions
-from .exceptions import (
-    NWSAPIError,
-    InvalidCoordinatesError,
-)
+# Public name → submodule that defines it
+_LAZY_IMPORTS = {
+    # NWS data source
+    "get_degree_days_for_location": ".calculator",
+    "get_degree_days_for_period": ".calculator",
+
+    # NWS gridpoint raw forecast data
+    "get_degree_days_for_gridpoint": ".nws_grid",
+    "fetch_gridpoint_degree_days_many": ".nws_grid",
+
+    # Meteostat data source
+    "fetch_meteostat_data": ".meteostat_api",
+
+    # Unified multi-source access
+    "get_degree_days": ".data_sources",
+
+    # Concurrent multi-location access
+    "get_degree_days_many": ".async_api",
+    "fetch_degree_days_many": ".async_api",
+    "LocationResult": ".async_api",
+
+    # Process-pool batch mode
+    "fetch_meteostat_batch": ".batch",
+    "StationIndex": ".stations",
+
+    # Hourly degree-hour integration
+    "degree_days_from_hourly": ".hourly",
+    "degree_hours": ".hourly",
+
+    # Local weather cache
+    "WeatherCache": ".cache",
+
+    # Columnar export/import
+    "write_degree_days": ".storage",
+    "read_degree_days": ".storage",
+    "DegreeDayArchive": ".archive",
+
+    # Regression analysis
+    "perform_regression": ".regression",
+    "perform_regression_batch": ".regression",
+    "BatchRegressionResult": ".regression",
+    "fit_change_point_model": ".regression",
+    "ChangePointModel": ".regression",
+
+    # Visualization
+    "plot_regression": ".visualization",
+    "render_regressions": ".visualization",
+    "RegressionPlot": ".visualization",
+
+    # CSV utilities
+    "read_energy_data_from_csv": ".csv_utils",
+    "read_energy_data_with_dates": ".csv_utils",
+    "read_energy_data_streaming": ".csv_utils",
+    "align_energy_with_degree_days": ".csv_utils",
+    "align_energy_with_billing_periods": ".csv_utils",
+
+    # Billing-period totals
+    "DegreeDayIndex": ".period_index",
+    "PeriodTotals": ".period_index",
+
+    # Instrumentation
+    "record_metrics": ".instrumentation",
+    "Metrics": ".instrumentation",
+
+    # Parsed energy datasets
+    "EnergyDataset": ".dataset",
+    "AlignedEnergy": ".dataset",
+    "AlignedMatrix": ".dataset",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "0.1.3"
 
@@ -63,29 +122,75 @@ __all__ = [
     "get_degree_days_for_location",
     "get_degree_days_for_period",
 
+    # NWS gridpoint API
+    "get_degree_days_for_gridpoint",
+    "fetch_gridpoint_degree_days_many",
+
     # Meteostat API
     "fetch_meteostat_data",
 
     # Unified multi-source API
     "get_degree_days",
+    "get_degree_days_many",
+    "fetch_degree_days_many",
+    "LocationResult",
+    "fetch_meteostat_batch",
+    "StationIndex",
+
+    # Hourly degree-hour integration
+    "degree_days_from_hourly",
+    "degree_hours",
+
+    # Local weather cache
+    "WeatherCache",
+
+    # Columnar export/import
+    "write_degree_days",
+    "read_degree_days",
+    "DegreeDayArchive",
 
     # Regression analysis
     "perform_regression",
+    "perform_regression_batch",
+    "BatchRegressionResult",
+    "fit_change_point_model",
+    "ChangePointModel",
 
     # Visualization
     "plot_regression",
+    "render_regressions",
+    "RegressionPlot",
 
     # CSV utilities
     "read_energy_data_from_csv",
     "read_energy_data_with_dates",
+    "read_energy_data_streaming",
     "align_energy_with_degree_days",
+    "align_energy_with_billing_periods",
+
+    # Billing-period totals
+    "DegreeDayIndex",
+    "PeriodTotals",
+
+    # Instrumentation
+    "record_metrics",
+    "Metrics",
+
+    # Parsed energy datasets
+    "EnergyDataset",
+    "AlignedEnergy",
+    "AlignedMatrix",
 
     # Data structures
     "DegreeDaysResult",
+    "DegreeDaysArray",
+    "MultiBaseDegreeDays",
 
     # Utilities
     "validate_coordinates",
     "calculate_degree_days",
+    "calculate_degree_days_array",
+    "calculate_degree_days_matrix",
     "fahrenheit_to_celsius",
     "celsius_to_fahrenheit",
     "mean_temperature",
@@ -1,19 +1,25 @@
 # hdd_cdd_calculator/__main__.py
 import argparse
+from contextlib import nullcontext
 from pathlib import Path
 
-# Set matplotlib backend for headless environments
-import matplotlib
-matplotlib.use('Agg')
+from .config import DEFAULT_PORTFOLIO_WORKERS
 
-from .data_sources import get_degree_days
-from .csv_utils import align_energy_with_degree_days
-from .regression import perform_regression
-from .visualization import plot_regression
+# Workflow modules pull in pandas, scikit-learn and matplotlib, so they are
+# imported by the command that needs them to keep `--help` instant.
 
 
 def run_example():
     """Run the included example workflow."""
+    # Set matplotlib backend for headless environments
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from .data_sources import get_degree_days
+    from .csv_utils import align_energy_with_degree_days
+    from .regression import perform_regression
+    from .visualization import plot_regression
+
     example_csv = Path(__file__).resolve().parent.parent / "examples" / "sample_energy_data.csv"
 
     if not example_csv.exists():
@@ -58,6 +64,37 @@ def run_example():
     print(f"Plot saved to: {plot_path}")
 
 
+def run_batch(args):
+    """Run the portfolio workflow for every site in a manifest."""
+    from .instrumentation import record_metrics
+    from .portfolio import run_portfolio
+
+    with record_metrics() if args.metrics else nullcontext() as metrics:
+        summary = run_portfolio(
+            args.manifest,
+            args.output,
+            cache_dir=args.cache_dir,
+            checkpoint=args.checkpoint,
+            resume=args.resume,
+            source=args.source,
+            base_temps=args.base_temps,
+            progress_every=args.progress_every,
+            workers=args.workers,
+        )
+    print(
+        f"Sites: {summary.total} | completed: {summary.completed} | "
+        f"skipped (checkpoint): {summary.skipped} | failed: {summary.failed}"
+    )
+    print(f"Elapsed: {summary.elapsed:.1f}s | throughput: {summary.sites_per_second:.2f} sites/s")
+    for site_id, error in summary.errors.items():
+        print(f"  {site_id}: {error}")
+    print(f"Results saved to: {args.output}")
+    if args.metrics:
+        Path(args.metrics).write_text(metrics.to_openmetrics())
+        print(f"Metrics saved to: {args.metrics}")
+    return 1 if summary.failed else 0
+
+
 def main():
     """CLI entry point for the HDD/CDD calculator package."""
     parser = argparse.ArgumentParser(description="HDD/CDD Calculator CLI")
@@ -66,8 +103,48 @@ def main():
         action="store_true",
         help="Run the package's example workflow"
     )
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch = subparsers.add_parser(
+        "batch",
+        help="Fit degree day regressions for every site in a manifest CSV"
+    )
+    batch.add_argument(
+        "manifest",
+        help="CSV with site_id, lat, lon, meter_csv and optional source, base_temps, "
+             "start_date, end_date, energy_column, degree_day_type columns"
+    )
+    batch.add_argument("-o", "--output", required=True, help="Output file (.parquet or .csv)")
+    batch.add_argument(
+        "--workers", type=int, default=DEFAULT_PORTFOLIO_WORKERS,
+        help="Sites processed concurrently (default: %(default)s)"
+    )
+    batch.add_argument("--cache-dir", help="Directory for the shared weather cache")
+    batch.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.jsonl)")
+    batch.add_argument(
+        "--resume", action="store_true",
+        help="Skip sites already completed in the checkpoint"
+    )
+    batch.add_argument(
+        "--source", default="meteostat", choices=["nws", "nws_grid", "meteostat", "auto"],
+        help="Weather source for sites without one (default: meteostat)"
+    )
+    batch.add_argument(
+        "--base-temps", type=float, nargs="+", default=[65.0],
+        help="Base temperatures (°F) for sites without base_temps (default: 65)"
+    )
+    batch.add_argument(
+        "--metrics",
+        help="Write stage timings, HTTP and cache counters to this file (OpenMetrics text)"
+    )
+    batch.add_argument(
+        "--progress-every", type=int, default=100,
+        help="Print progress after this many sites (default: 100)"
+    )
     args = parser.parse_args()
 
+    if args.command == "batch":
+        return run_batch(args)
     if args.example:
         run_example()
     else:
@@ -75,4 +152,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,327 @@
+# hdd_cdd_calculator/archive.py
+import json
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence, Union
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from .data_sources import get_degree_days
+from .exceptions import InvalidCoordinatesError, NWSAPIError
+from .results import DegreeDaysArray, DegreeDaysLike, as_degree_days_array
+
+ARCHIVE_COLUMNS = ("high_temp", "low_temp", "hdd", "cdd")
+ARCHIVE_DTYPE = np.float32
+GROWTH_DAYS = 366  # days of capacity added whenever the archive is full
+META_FILE = "archive.json"
+
+
+class DegreeDayArchive:
+    """
+    Local memory-mapped archive of daily degree days for many stations.
+
+    Each column (daily high, daily low, HDD, CDD) is a float32 ``.npy``
+    file holding a (stations × days) matrix with a fixed stride. Day ``i``
+    of every row is ``start_date + i``, so a station's date range is a
+    contiguous slice of its row. Queries therefore return views of the
+    mapped files, and only the pages that are touched are read from disk.
+    Days without data are NaN.
+
+    Station ids, their coordinates, the archive date range and how far
+    each station has been fetched are stored in ``archive.json`` next to
+    the column files.
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = "r"):
+        """
+        Open an existing archive.
+
+        Args:
+            path: Archive directory.
+            mode: "r" for read-only access, "r+" to allow writes and appends.
+        """
+        if mode not in ("r", "r+"):
+            raise ValueError("mode must be 'r' or 'r+'")
+        self.path = Path(path)
+        self.mode = mode
+        with open(self.path / META_FILE) as f:
+            meta = json.load(f)
+        self.start_date = np.datetime64(meta["start_date"], "D")
+        self.n_days = int(meta["n_days"])
+        self.base_temp = float(meta["base_temp"])
+        self.station_ids: List[str] = list(meta["station_ids"])
+        self.lats = np.asarray(meta["lats"], dtype=np.float64)
+        self.lons = np.asarray(meta["lons"], dtype=np.float64)
+        self.fetched_days = np.asarray(meta["fetched_days"], dtype=np.int64)
+        self._rows = {station_id: i for i, station_id in enumerate(self.station_ids)}
+        self._open_columns()
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, Path],
+        start_date: str,
+        station_ids: Sequence[str] = (),
+        lats: Optional[Sequence[float]] = None,
+        lons: Optional[Sequence[float]] = None,
+        base_temp: float = 65.0,
+        capacity_days: int = GROWTH_DAYS
+    ) -> "DegreeDayArchive":
+        """
+        Create an empty archive (opened in "r+" mode).
+
+        Args:
+            path: Archive directory (created if missing).
+            start_date: First day of the archive (YYYY-MM-DD).
+            station_ids: Station identifiers, one row each.
+            lats: Station latitudes, needed for :meth:`append`.
+            lons: Station longitudes, needed for :meth:`append`.
+            base_temp: Base temperature for the stored HDD/CDD (°F).
+            capacity_days: Days to preallocate per station.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        station_ids = [str(s) for s in station_ids]
+        if len(set(station_ids)) != len(station_ids):
+            raise ValueError("station_ids must be unique.")
+        n = len(station_ids)
+        lats = np.full(n, np.nan) if lats is None else np.asarray(lats, dtype=np.float64)
+        lons = np.full(n, np.nan) if lons is None else np.asarray(lons, dtype=np.float64)
+        if not (len(lats) == len(lons) == n):
+            raise ValueError("station_ids, lats and lons must have the same length.")
+
+        for name in ARCHIVE_COLUMNS:
+            column = open_memmap(
+                path / f"{name}.npy", mode="w+", dtype=ARCHIVE_DTYPE, shape=(n, capacity_days)
+            )
+            column[:] = np.nan
+            column.flush()
+            del column
+
+        meta = {
+            "start_date": str(np.datetime64(start_date, "D")),
+            "n_days": 0,
+            "base_temp": float(base_temp),
+            "station_ids": station_ids,
+            "lats": lats.tolist(),
+            "lons": lons.tolist(),
+            "fetched_days": [0] * n,
+        }
+        with open(path / META_FILE, "w") as f:
+            json.dump(meta, f)
+        return cls(path, mode="r+")
+
+    def _open_columns(self) -> None:
+        self._columns = {
+            name: np.load(self.path / f"{name}.npy", mmap_mode=self.mode)
+            for name in ARCHIVE_COLUMNS
+        }
+
+    def _save_meta(self) -> None:
+        meta = {
+            "start_date": str(self.start_date),
+            "n_days": self.n_days,
+            "base_temp": self.base_temp,
+            "station_ids": self.station_ids,
+            "lats": self.lats.tolist(),
+            "lons": self.lons.tolist(),
+            "fetched_days": self.fetched_days.tolist(),
+        }
+        tmp = self.path / (META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, self.path / META_FILE)
+
+    def _resize(self, n_stations: int, capacity_days: int) -> None:
+        """Rewrite the column files with a larger shape, keeping existing values."""
+        for name, old in self._columns.items():
+            tmp = self.path / f"{name}.npy.tmp"
+            new = open_memmap(tmp, mode="w+", dtype=ARCHIVE_DTYPE, shape=(n_stations, capacity_days))
+            new[:] = np.nan
+            new[:old.shape[0], :old.shape[1]] = old
+            new.flush()
+            del new
+            os.replace(tmp, self.path / f"{name}.npy")
+        self._open_columns()
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    def __contains__(self, station_id) -> bool:
+        return str(station_id) in self._rows
+
+    def __repr__(self) -> str:
+        return f"DegreeDayArchive({len(self)} stations, {self.n_days} days from {self.start_date})"
+
+    @property
+    def capacity_days(self) -> int:
+        """Number of days allocated per station."""
+        return self._columns["hdd"].shape[1]
+
+    @property
+    def end_date(self) -> np.datetime64:
+        """Last day covered by the archive (the day before start_date if empty)."""
+        return self.start_date + self.n_days - 1
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Dates of the archive's day axis."""
+        return np.arange(self.start_date, self.start_date + self.n_days)
+
+    def _row(self, station_id) -> int:
+        try:
+            return self._rows[str(station_id)]
+        except KeyError:
+            raise KeyError(f"Unknown station '{station_id}'") from None
+
+    def _day_slice(self, start_date=None, end_date=None) -> slice:
+        first = 0 if start_date is None else int((np.datetime64(start_date, "D") - self.start_date).astype(int))
+        last = self.n_days if end_date is None else int((np.datetime64(end_date, "D") - self.start_date).astype(int)) + 1
+        return slice(min(max(first, 0), self.n_days), min(max(last, 0), self.n_days))
+
+    def query(self, station_id, start_date=None, end_date=None) -> DegreeDaysArray:
+        """
+        Degree days for one station between two dates (inclusive).
+
+        The temperature and degree day columns of the result are views of
+        the mapped files; the range is clipped to the archived days.
+        """
+        days = self._day_slice(start_date, end_date)
+        row = self._row(station_id)
+        return DegreeDaysArray(
+            np.arange(self.start_date + days.start, self.start_date + days.stop),
+            *(self._columns[name][row, days] for name in ARCHIVE_COLUMNS),
+            dtype=ARCHIVE_DTYPE,
+        )
+
+    def matrix(self, column: str = "hdd", start_date=None, end_date=None) -> np.ndarray:
+        """
+        One column for every station as a (stations × days) view.
+
+        Args:
+            column: "high_temp", "low_temp", "hdd" or "cdd".
+            start_date: Optional first date (inclusive).
+            end_date: Optional last date (inclusive).
+        """
+        if column not in ARCHIVE_COLUMNS:
+            raise ValueError(f"column must be one of {ARCHIVE_COLUMNS}")
+        return self._columns[column][:, self._day_slice(start_date, end_date)]
+
+    def add_stations(
+        self,
+        station_ids: Sequence[str],
+        lats: Optional[Sequence[float]] = None,
+        lons: Optional[Sequence[float]] = None
+    ) -> None:
+        """Add rows for new stations; their days start out as NaN."""
+        station_ids = [str(s) for s in station_ids]
+        lats = np.full(len(station_ids), np.nan) if lats is None else np.asarray(lats, dtype=np.float64)
+        lons = np.full(len(station_ids), np.nan) if lons is None else np.asarray(lons, dtype=np.float64)
+        duplicates = [s for s in station_ids if s in self._rows]
+        if duplicates or len(set(station_ids)) != len(station_ids):
+            raise ValueError(f"Stations already in the archive or repeated: {duplicates or station_ids}")
+
+        self._resize(len(self) + len(station_ids), self.capacity_days)
+        for station_id in station_ids:
+            self._rows[station_id] = len(self.station_ids)
+            self.station_ids.append(station_id)
+        self.lats = np.concatenate([self.lats, lats])
+        self.lons = np.concatenate([self.lons, lons])
+        self.fetched_days = np.concatenate([self.fetched_days, np.zeros(len(station_ids), dtype=np.int64)])
+        self._save_meta()
+
+    def write(self, station_id, degree_days: DegreeDaysLike) -> None:
+        """
+        Store degree days for one station, overwriting any archived values.
+
+        Days after the current end extend the archive; capacity grows in
+        blocks of GROWTH_DAYS so repeated appends rarely rewrite the files.
+
+        Raises:
+            ValueError: If a date precedes the archive's start_date.
+        """
+        degree_days = as_degree_days_array(degree_days)
+        if not len(degree_days):
+            return
+        offsets = (degree_days.dates - self.start_date).astype(np.int64)
+        if offsets.min() < 0:
+            raise ValueError(f"Dates before the archive start ({self.start_date}) cannot be stored.")
+
+        row = self._row(station_id)
+        self._extend(int(offsets.max()) + 1)
+        for name in ARCHIVE_COLUMNS:
+            self._columns[name][row, offsets] = getattr(degree_days, name)
+
+    def _extend(self, n_days: int) -> None:
+        """Grow the archived day range to at least `n_days`."""
+        if n_days > self.capacity_days:
+            growth = -(-(n_days - self.capacity_days) // GROWTH_DAYS) * GROWTH_DAYS
+            self._resize(len(self), self.capacity_days + growth)
+        if n_days > self.n_days:
+            self.n_days = n_days
+            self._save_meta()
+
+    def flush(self) -> None:
+        """Write pending changes of the mapped columns to disk."""
+        for column in self._columns.values():
+            if isinstance(column, np.memmap):
+                column.flush()
+
+    def append(
+        self,
+        end_date: Optional[str] = None,
+        source: str = "meteostat",
+        station_ids: Optional[Sequence[str]] = None,
+        cache=None
+    ) -> Dict[Hashable, Exception]:
+        """
+        Extend the archive with days fetched through :func:`get_degree_days`.
+
+        Each station is fetched from the day after the last day previously
+        appended for it through `end_date`, at the archive's base
+        temperature, and written in place. Days after the last one the
+        source returned, and every day of a station that fails, are fetched
+        again on the next append.
+
+        Args:
+            end_date: Last day to fetch (YYYY-MM-DD); defaults to yesterday.
+            source: "nws", "nws_grid", "meteostat" or "auto"
+            station_ids: Stations to update (all by default).
+            cache: Optional WeatherCache passed through to get_degree_days.
+
+        Returns:
+            Per-station NWSAPIError/InvalidCoordinatesError failures.
+        """
+        if end_date is None:
+            end_date = (date.today() - timedelta(days=1)).isoformat()
+        last = int((np.datetime64(end_date, "D") - self.start_date).astype(int)) + 1
+        errors: Dict[Hashable, Exception] = {}
+
+        for station_id in (self.station_ids if station_ids is None else station_ids):
+            row = self._row(station_id)
+            if self.fetched_days[row] >= last:
+                continue
+            lat, lon = self.lats[row], self.lons[row]
+            if np.isnan(lat) or np.isnan(lon):
+                errors[station_id] = InvalidCoordinatesError(lat, lon, f"No coordinates for station '{station_id}'")
+                continue
+            try:
+                results = get_degree_days(
+                    lat, lon, str(self.start_date + self.fetched_days[row]), end_date,
+                    source=source, base_temp=self.base_temp, columnar=True, cache=cache,
+                )
+            except (NWSAPIError, InvalidCoordinatesError) as e:
+                errors[station_id] = e
+                continue
+            self.write(station_id, results)
+            self._extend(last)
+            if len(results):
+                # Trailing days the source has not published yet are fetched again next time
+                data_end = int((results.dates.max() - self.start_date).astype(int)) + 1
+                self.fetched_days[row] = max(self.fetched_days[row], min(data_end, last))
+
+        self._save_meta()
+        self.flush()
+        return errors
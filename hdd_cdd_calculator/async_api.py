@@ -0,0 +1,224 @@
+# hdd_cdd_calculator/async_api.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any, AsyncIterator, Dict, Hashable, Iterable, List, Mapping, NamedTuple,
+    Optional, Sequence, Tuple, Union,
+)
+
+import numpy as np
+
+from .calculator import (
+    daily_temps_to_degree_days,
+    get_daily_temps,
+    get_point_cache,
+    get_point_properties,
+)
+from .data_sources import get_degree_days
+from .exceptions import InvalidCoordinatesError, NWSAPIError
+from .results import DegreeDaysArray, MultiBaseDegreeDays
+from .utils import validate_coordinates
+
+# Requests per second per host; NWS asks clients to keep request rates modest
+DEFAULT_RATE_LIMITS = {
+    "nws": 5.0,
+    "nws_grid": 5.0,
+    "auto": 5.0,  # Meteostat and NWS; limited to the NWS rate
+    "meteostat": 10.0,
+}
+# HTTP requests one location costs, including an unmemoized /points lookup
+REQUESTS_PER_LOCATION = {
+    "nws": 2,       # /points, forecast
+    "nws_grid": 2,  # /points, gridpoint data
+    "auto": 3,      # /points, gridpoint data, Meteostat
+    "meteostat": 1,
+}
+DEFAULT_CONCURRENCY = 8
+
+# Errors that are recorded per location instead of aborting the batch
+LOCATION_ERRORS = (NWSAPIError, InvalidCoordinatesError)
+
+Locations = Union[Mapping[Hashable, Tuple[float, float]], Iterable[Tuple[float, float]]]
+
+
+class LocationResult(NamedTuple):
+    """Outcome of fetching degree days for one location."""
+    key: Hashable
+    lat: float
+    lon: float
+    result: Any
+    error: Optional[Exception]
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio tasks.
+
+    Allows `rate` tokens per second on average, with bursts of up to
+    `burst` tokens.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Wait until `tokens` requests may be sent."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            for _ in range(tokens):
+                while True:
+                    now = time.monotonic()
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _iter_locations(locations: Locations) -> List[Tuple[Hashable, float, float]]:
+    if isinstance(locations, Mapping):
+        return [(key, lat, lon) for key, (lat, lon) in locations.items()]
+    return [(index, lat, lon) for index, (lat, lon) in enumerate(locations)]
+
+
+async def _fetch_nws(loop, executor, limiter, lat, lon, start_date, end_date, base_temp):
+    lat, lon = validate_coordinates(lat, lon)
+
+    # Point resolution is memoized, so only unseen coordinates cost a request
+    properties = get_point_cache().get(lat, lon)
+    if properties is None:
+        await limiter.acquire()
+        properties = await loop.run_in_executor(executor, get_point_properties, lat, lon)
+
+    await limiter.acquire()
+    daily_temps = await loop.run_in_executor(executor, get_daily_temps, properties["forecast"])
+    return daily_temps_to_degree_days(daily_temps, base_temp).select(start_date, end_date)
+
+
+async def get_degree_days_many(
+    locations: Locations,
+    start_date: str,
+    end_date: str,
+    source: str = "nws",
+    base_temp: Union[float, Sequence[float]] = 65.0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limit: Optional[float] = None,
+    columnar: bool = False,
+    cache=None
+) -> AsyncIterator[LocationResult]:
+    """
+    Fetch degree days for many locations concurrently.
+
+    Results are yielded as each location completes (not in input order).
+    Per-location `NWSAPIError` and `InvalidCoordinatesError` failures are
+    returned in `LocationResult.error` instead of aborting the batch.
+
+    Example:
+        async for item in get_degree_days_many(sites, "2023-06-01", "2023-06-07"):
+            if item.error is None:
+                ...
+
+    Args:
+        locations: Sequence of (lat, lon) pairs, or a mapping of
+                   site id → (lat, lon). Result keys are the list index or
+                   the mapping key.
+        start_date: YYYY-MM-DD
+        end_date: YYYY-MM-DD
+        source: "nws", "nws_grid", "meteostat" or "auto"
+        base_temp: Base temperature for degree day calculation (°F), or a
+                   sequence of base temperatures (yields MultiBaseDegreeDays)
+        concurrency: Maximum number of locations fetched at the same time.
+        rate_limit: Maximum requests per second to the source's host
+                    (defaults to DEFAULT_RATE_LIMITS[source]). Every HTTP
+                    request a location makes takes a token (see
+                    REQUESTS_PER_LOCATION).
+        columnar: Yield DegreeDaysArray results instead of lists.
+        cache: Optional WeatherCache shared by every location.
+
+    Yields:
+        LocationResult for each location.
+    """
+    if source not in DEFAULT_RATE_LIMITS:
+        raise ValueError(f"Unknown source. Choose one of {tuple(DEFAULT_RATE_LIMITS)}")
+
+    limiter = AsyncRateLimiter(rate_limit or DEFAULT_RATE_LIMITS[source])
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def fetch_one(key, lat, lon) -> LocationResult:
+        async with semaphore:
+            try:
+                if source == "nws" and cache is None and np.ndim(base_temp) == 0:
+                    result = await _fetch_nws(
+                        loop, executor, limiter, lat, lon, start_date, end_date, base_temp
+                    )
+                else:
+                    requests = REQUESTS_PER_LOCATION[source]
+                    if source != "meteostat" and get_point_cache().get(lat, lon) is not None:
+                        requests -= 1  # the /points lookup is memoized
+                    await limiter.acquire(requests)
+                    result = await loop.run_in_executor(
+                        executor,
+                        lambda: get_degree_days(
+                            lat, lon, start_date, end_date, source=source,
+                            base_temp=base_temp, columnar=True, cache=cache,
+                        ),
+                    )
+            except LOCATION_ERRORS as e:
+                return LocationResult(key, lat, lon, None, e)
+
+        if not columnar and not isinstance(result, MultiBaseDegreeDays):
+            result = DegreeDaysArray.from_results(result).to_list()
+        return LocationResult(key, lat, lon, result, None)
+
+    tasks = [
+        asyncio.ensure_future(fetch_one(key, lat, lon))
+        for key, lat, lon in _iter_locations(locations)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Waiting for in-flight requests here would block the event loop
+        # when the caller stops iterating early
+        executor.shutdown(wait=False)
+
+
+def fetch_degree_days_many(
+    locations: Locations,
+    start_date: str,
+    end_date: str,
+    **kwargs
+) -> Tuple[Dict[Hashable, Any], Dict[Hashable, Exception]]:
+    """
+    Blocking wrapper around :func:`get_degree_days_many`.
+
+    Accepts the same keyword arguments and must not be called from a
+    running event loop.
+
+    Returns:
+        (results, errors): dicts keyed like `locations`.
+    """
+    async def collect():
+        results, errors = {}, {}
+        async for item in get_degree_days_many(locations, start_date, end_date, **kwargs):
+            if item.error is None:
+                results[item.key] = item.result
+            else:
+                errors[item.key] = item.error
+        return results, errors
+
+    return asyncio.run(collect())
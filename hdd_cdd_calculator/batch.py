@@ -0,0 +1,238 @@
+# hdd_cdd_calculator/batch.py
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from .exceptions import InvalidCoordinatesError, NWSAPIError
+from .meteostat_api import (
+    fetch_meteostat_daily,
+    fetch_meteostat_station_daily,
+    meteostat_to_degree_days,
+)
+from .results import DegreeDaysArray
+from .stations import DEFAULT_GRID_RESOLUTION, StationIndex, snap_to_grid
+from .utils import validate_coordinates
+
+# A site is (lat, lon) using the batch date range, or (lat, lon, start_date, end_date)
+Site = Union[Tuple[float, float], Tuple[float, float, str, str]]
+Sites = Union[Mapping[Hashable, Site], Iterable[Site]]
+
+# A fetch target is ("point", lat, lon) or ("station", station_id)
+Target = Tuple[Any, ...]
+
+CHUNKS_PER_WORKER = 4
+SNAP_MODES = (None, "grid", "station")
+
+
+def _normalize_sites(
+    sites: Sites,
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> List[Tuple[Hashable, float, float, str, str]]:
+    items = sites.items() if isinstance(sites, Mapping) else enumerate(sites)
+    normalized = []
+    for key, site in items:
+        if len(site) == 2:
+            if start_date is None or end_date is None:
+                raise ValueError("start_date and end_date are required for (lat, lon) sites")
+            site = (site[0], site[1], start_date, end_date)
+        normalized.append((key,) + tuple(site))
+    return normalized
+
+
+def _resolve_targets(
+    sites: List[Tuple[Hashable, float, float, str, str]],
+    snap: Optional[str],
+    grid_resolution: float,
+    station_index: Optional[StationIndex],
+    errors: Dict[Hashable, Exception]
+) -> Dict[Tuple[Target, str, str], List[Hashable]]:
+    """
+    Group sites by the data source they resolve to.
+
+    Returns a mapping of (target, start_date, end_date) → site keys, so
+    every distinct request is fetched once. Sites with invalid coordinates
+    are recorded in `errors`.
+    """
+    valid = []
+    for key, lat, lon, start_date, end_date in sites:
+        try:
+            lat, lon = validate_coordinates(lat, lon)
+        except InvalidCoordinatesError as e:
+            errors[key] = e
+            continue
+        valid.append((key, lat, lon, start_date, end_date))
+
+    lats = np.array([site[1] for site in valid], dtype=np.float64)
+    lons = np.array([site[2] for site in valid], dtype=np.float64)
+    if snap == "grid":
+        lats, lons = snap_to_grid(lats, lons, grid_resolution)
+        targets = [("point", lat, lon) for lat, lon in zip(lats.tolist(), lons.tolist())]
+    elif snap == "station":
+        if station_index is None:
+            station_index = StationIndex.from_meteostat()
+        targets = _station_targets(station_index, valid, lats, lons)
+    else:
+        targets = [("point", lat, lon) for lat, lon in zip(lats.tolist(), lons.tolist())]
+
+    groups: Dict[Tuple[Target, str, str], List[Hashable]] = {}
+    for (key, _, _, start_date, end_date), target in zip(valid, targets):
+        groups.setdefault((target, start_date, end_date), []).append(key)
+    return groups
+
+
+def _station_targets(
+    station_index: StationIndex,
+    sites: List[Tuple[Hashable, float, float, str, str]],
+    lats: np.ndarray,
+    lons: np.ndarray
+) -> List[Target]:
+    """
+    Nearest station with daily data for each site's date range.
+
+    Sites whose range no station covers fall back to a point fetch, which
+    lets Meteostat interpolate from whatever stations it can find.
+    """
+    periods: Dict[Tuple[str, str], List[int]] = {}
+    for row, site in enumerate(sites):
+        periods.setdefault((site[3], site[4]), []).append(row)
+
+    targets: List[Target] = [None] * len(sites)
+    for (start_date, end_date), rows in periods.items():
+        index = station_index.with_daily_data(start_date, end_date)
+        if not len(index):
+            for row in rows:
+                targets[row] = ("point", float(lats[row]), float(lons[row]))
+            continue
+        for row, station_id in zip(rows, index.query(lats[rows], lons[rows])[0]):
+            targets[row] = ("station", str(station_id))
+    return targets
+
+
+def _fetch_target(target: Target, start_date: str, end_date: str):
+    if target[0] == "station":
+        return fetch_meteostat_station_daily(target[1], start_date, end_date)
+    return fetch_meteostat_daily(target[1], target[2], start_date, end_date)
+
+
+def _fetch_meteostat_chunk(
+    chunk: List[Tuple[Hashable, Target, str, str]],
+    base_temp: float
+) -> Dict[str, Any]:
+    """
+    Fetch and process a chunk of requests inside a worker process.
+
+    Results are packed into one set of concatenated columns plus row
+    offsets, so a whole chunk crosses the process boundary as a handful of
+    NumPy buffers instead of one Python object per day.
+    """
+    keys, parts, errors = [], [], {}
+    for key, target, start_date, end_date in chunk:
+        try:
+            df = _fetch_target(target, start_date, end_date)
+        except (NWSAPIError, InvalidCoordinatesError) as e:
+            errors[key] = e
+            continue
+        keys.append(key)
+        parts.append(meteostat_to_degree_days(df, base_temp))
+
+    combined = DegreeDaysArray.concat(parts)
+    return {
+        "keys": keys,
+        "offsets": np.cumsum([0] + [len(part) for part in parts]),
+        "columns": combined.to_numpy(),
+        "errors": errors,
+    }
+
+
+def _unpack_chunk(packed: Dict[str, Any], results: Dict[Hashable, DegreeDaysArray]) -> None:
+    """Split a packed chunk back into per-site results (views, not copies)."""
+    columns = packed["columns"]
+    combined = DegreeDaysArray(**columns, dtype=columns["hdd"].dtype)
+    offsets = packed["offsets"]
+    for i, key in enumerate(packed["keys"]):
+        results[key] = combined[offsets[i]:offsets[i + 1]]
+
+
+def fetch_meteostat_batch(
+    sites: Sites,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    base_temp: float = 65.0,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    snap: Optional[str] = None,
+    grid_resolution: float = DEFAULT_GRID_RESOLUTION,
+    station_index: Optional[StationIndex] = None
+) -> Tuple[Dict[Hashable, DegreeDaysArray], Dict[Hashable, Exception]]:
+    """
+    Fetch Meteostat data and compute degree days for many sites in parallel.
+
+    Sites are split into chunks that are processed by a `ProcessPoolExecutor`,
+    so the blocking fetch and the pandas work of each chunk run outside the
+    calling process's GIL.
+
+    With `snap`, nearby sites are first resolved to a shared source: either
+    a grid cell center ("grid") or the nearest Meteostat station
+    ("station"). Each distinct source and date range is fetched once and
+    the result is shared by every site that resolved to it. Station
+    snapping uses the nearest station with daily data in the site's date
+    range, and that station's record directly instead of Meteostat's
+    interpolation between nearby stations.
+
+    Args:
+        sites: Sequence of (lat, lon) or (lat, lon, start_date, end_date)
+               tuples, or a mapping of site id → such a tuple.
+        start_date: YYYY-MM-DD, used for sites given without a date range.
+        end_date: YYYY-MM-DD, used for sites given without a date range.
+        base_temp: Base temperature for degree day calculation (°F)
+        workers: Number of worker processes (defaults to the CPU count);
+                 0 processes every chunk in the calling process.
+        chunk_size: Requests per task (defaults to spreading the requests
+                    over CHUNKS_PER_WORKER tasks per worker).
+        snap: None (fetch every site), "grid" or "station".
+        grid_resolution: Grid cell size in degrees for snap="grid".
+        station_index: StationIndex for snap="station" (defaults to
+                       StationIndex.from_meteostat(), cached on disk).
+
+    Returns:
+        (results, errors): DegreeDaysArray per site and the per-site
+        `NWSAPIError`/`InvalidCoordinatesError` failures, keyed by list
+        index or mapping key.
+    """
+    if snap not in SNAP_MODES:
+        raise ValueError("snap must be None, 'grid' or 'station'")
+
+    results: Dict[Hashable, DegreeDaysArray] = {}
+    errors: Dict[Hashable, Exception] = {}
+
+    normalized = _normalize_sites(sites, start_date, end_date)
+    groups = _resolve_targets(normalized, snap, grid_resolution, station_index, errors)
+    requests = [(group, target, start, end) for group, (target, start, end) in enumerate(groups)]
+    members = list(groups.values())
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(requests) / (max(workers, 1) * CHUNKS_PER_WORKER)))
+    chunks = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+
+    if workers == 0:
+        packed_chunks = [_fetch_meteostat_chunk(chunk, base_temp) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            packed_chunks = list(executor.map(_fetch_meteostat_chunk, chunks, [base_temp] * len(chunks)))
+
+    # Fan each fetched request back out to every site that resolved to it
+    fetched: Dict[int, DegreeDaysArray] = {}
+    for packed in packed_chunks:
+        _unpack_chunk(packed, fetched)
+        for group, error in packed["errors"].items():
+            errors.update((key, error) for key in members[group])
+    for group, result in fetched.items():
+        results.update((key, result) for key in members[group])
+
+    return results, errors
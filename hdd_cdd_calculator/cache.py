@@ -0,0 +1,349 @@
+# hdd_cdd_calculator/cache.py
+import json
+import os
+import time
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from . import instrumentation
+from .utils import validate_coordinates
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_FORECAST_TTL = 3 * 60 * 60
+DEFAULT_POINT_CACHE_SIZE = 10000
+DEFAULT_POINT_TTL = 7 * 24 * 60 * 60
+DEFAULT_PUBLICATION_LAG = 30
+
+# Sources whose values are forecasts and should expire after `forecast_ttl`
+FORECAST_SOURCES = ("nws", "nws_grid")
+
+
+class CachedTemperatures(NamedTuple):
+    """Daily temperature records (°F) read from the cache."""
+    dates: np.ndarray
+    high_temp: np.ndarray
+    low_temp: np.ndarray
+
+
+class WeatherCache:
+    """
+    Persistent on-disk cache of daily temperature records.
+
+    Records are keyed by source and by the rounded coordinates produced by
+    :func:`validate_coordinates`, and stored one compressed NPZ file per
+    (source, location) with one column per field: dates (int64 days since
+    epoch), daily high/low in °F (float32) and the time each day was fetched.
+
+    Days that were requested but had no data are stored as NaN so the same
+    gap is not fetched again, unless they are within `publication_lag` days
+    of today: historical sources publish recent days late, so those are
+    fetched again on the next lookup. Forecast sources expire after
+    `forecast_ttl` seconds, and the least recently used files are evicted
+    once the cache grows beyond `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        forecast_ttl: float = DEFAULT_FORECAST_TTL,
+        publication_lag: int = DEFAULT_PUBLICATION_LAG
+    ):
+        """
+        Args:
+            cache_dir: Directory for cache files (created if missing).
+            max_bytes: Size limit for the cache directory before LRU eviction.
+            forecast_ttl: Lifetime in seconds of forecast records.
+            publication_lag: Days before today for which a historical source
+                may not have published data yet; gaps this recent are not cached.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.forecast_ttl = forecast_ttl
+        self.publication_lag = publication_lag
+        # Total size of the cache files, scanned on the first store
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "writes": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters, counted in days."""
+        return dict(self._stats)
+
+    def _path(self, source: str, lat: float, lon: float) -> Path:
+        lat, lon = validate_coordinates(lat, lon)
+        return self.cache_dir / source / f"{lat:.4f}_{lon:.4f}.npz"
+
+    def _ttl(self, source: str) -> Optional[float]:
+        return self.forecast_ttl if source in FORECAST_SOURCES else None
+
+    def _load(self, path: Path) -> Optional[Dict[str, np.ndarray]]:
+        try:
+            with np.load(path) as data:
+                records = {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # mark as recently used
+        return records
+
+    def lookup(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        start_date: str,
+        end_date: str,
+        count: bool = True
+    ) -> Tuple[CachedTemperatures, List[Tuple[str, str]]]:
+        """
+        Read cached days for a date range.
+
+        Args:
+            source: Data source name ("nws", "meteostat", ...).
+            lat: Latitude
+            lon: Longitude
+            start_date: YYYY-MM-DD
+            end_date: YYYY-MM-DD (inclusive)
+            count: Whether this lookup updates the hit/miss statistics.
+
+        Returns:
+            (cached, missing): cached records with complete temperatures, and
+            the list of (start, end) date sub-ranges that must be fetched.
+        """
+        start = np.datetime64(start_date, "D")
+        end = np.datetime64(end_date, "D")
+        n_days = int((end - start).astype(int)) + 1
+        present = np.zeros(max(n_days, 0), dtype=bool)
+        empty = np.empty(0, dtype=np.float32)
+        cached = CachedTemperatures(np.empty(0, dtype="datetime64[D]"), empty, empty)
+
+        path = self._path(source, lat, lon)
+        records = self._load(path) if path.exists() else None
+        if records is not None and n_days > 0:
+            offsets = records["dates"] - start.astype(np.int64)
+            in_range = (offsets >= 0) & (offsets < n_days)
+
+            ttl = self._ttl(source)
+            if ttl is not None:
+                fresh = records["fetched"] >= time.time() - ttl
+                if count:
+                    self._stats["expired"] += int(np.count_nonzero(in_range & ~fresh))
+                in_range &= fresh
+
+            present[offsets[in_range]] = True
+            complete = in_range & ~(np.isnan(records["high_temp"]) | np.isnan(records["low_temp"]))
+            cached = CachedTemperatures(
+                records["dates"][complete].astype("datetime64[D]"),
+                records["high_temp"][complete],
+                records["low_temp"][complete],
+            )
+
+        if count:
+            hits = int(np.count_nonzero(present))
+            self._stats["hits"] += hits
+            self._stats["misses"] += len(present) - hits
+            instrumentation.increment("weather_cache.hit_days", hits)
+            instrumentation.increment("weather_cache.miss_days", len(present) - hits)
+        return cached, _missing_ranges(start, present)
+
+    def store(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        dates,
+        high_temp,
+        low_temp,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> None:
+        """
+        Merge daily records (°F) into the cache.
+
+        If `start_date`/`end_date` are given, days in that range without a
+        record are stored as NaN so they count as fetched. For historical
+        sources this skips days within `publication_lag` of today.
+        """
+        dates = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+        high = np.asarray(high_temp, dtype=np.float32)
+        low = np.asarray(low_temp, dtype=np.float32)
+
+        if start_date is not None and end_date is not None:
+            span = np.arange(
+                np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1
+            ).astype(np.int64)
+            gaps = np.setdiff1d(span, dates, assume_unique=True)
+            if self._ttl(source) is None:
+                # Recent days may not be published yet; leave them missing
+                cutoff = np.datetime64("today", "D").astype(np.int64) - self.publication_lag
+                gaps = gaps[gaps < cutoff]
+            dates = np.concatenate([dates, gaps])
+            high = np.concatenate([high, np.full(len(gaps), np.nan, dtype=np.float32)])
+            low = np.concatenate([low, np.full(len(gaps), np.nan, dtype=np.float32)])
+
+        fetched = np.full(len(dates), time.time())
+        path = self._path(source, lat, lon)
+
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            existing = self._load(path) if old_size else None
+            if existing is not None:
+                # Newer records win: keep existing days that were not refetched
+                keep = ~np.isin(existing["dates"], dates)
+                dates = np.concatenate([existing["dates"][keep], dates])
+                high = np.concatenate([existing["high_temp"][keep], high])
+                low = np.concatenate([existing["low_temp"][keep], low])
+                fetched = np.concatenate([existing["fetched"][keep], fetched])
+
+            order = np.argsort(dates, kind="stable")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    dates=dates[order],
+                    high_temp=high[order],
+                    low_temp=low[order],
+                    fetched=fetched[order],
+                )
+            os.replace(tmp_path, path)
+            self._stats["writes"] += 1
+            if self._total_bytes is None:
+                self._total_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*/*.npz"))
+            else:
+                self._total_bytes += path.stat().st_size - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = []
+        for path in self.cache_dir.glob("*/*.npz"):
+            stat = path.stat()
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink()
+            total -= size
+            self._stats["evictions"] += 1
+            instrumentation.increment("weather_cache.evictions")
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Remove every cached file."""
+        with self._lock:
+            for path in self.cache_dir.glob("*/*.npz"):
+                path.unlink()
+            self._total_bytes = 0
+
+
+class PointCache:
+    """
+    Bounded, TTL-based memo of NWS `/points` resolutions.
+
+    Maps rounded coordinates to the point metadata (forecast URLs, grid
+    office and coordinates, time zone). Entries older than `ttl` seconds are
+    ignored, and the least recently used entry is dropped once `maxsize` is
+    reached. If `path` is given, entries are loaded from that JSON file and
+    can be written back with :meth:`save` to survive process restarts.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_POINT_CACHE_SIZE,
+        ttl: float = DEFAULT_POINT_TTL,
+        path: Optional[Union[str, Path]] = None
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    @staticmethod
+    def _key(lat: float, lon: float) -> str:
+        lat, lon = validate_coordinates(lat, lon)
+        return f"{lat:.4f},{lon:.4f}"
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters."""
+        return dict(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, lat: float, lon: float) -> Optional[dict]:
+        """Return the memoized point metadata, or None if absent or expired."""
+        key = self._key(lat, lon)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time() - self.ttl:
+                self._entries.pop(key, None)
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def set(self, lat: float, lon: float, properties: dict) -> None:
+        """Memoize the point metadata for a coordinate."""
+        key = self._key(lat, lon)
+        with self._lock:
+            self._entries[key] = (time.time(), properties)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Write unexpired entries to `path` (defaults to the cache's own path)."""
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("No path given for saving the point cache.")
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            entries = {k: v for k, v in self._entries.items() if v[0] >= cutoff}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path: Union[str, Path]) -> None:
+        """Merge entries from a JSON file written by :meth:`save`."""
+        try:
+            with open(path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            for key, (stored_at, properties) in sorted(entries.items(), key=lambda e: e[1][0]):
+                self._entries[key] = (stored_at, properties)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def _missing_ranges(start: np.datetime64, present: np.ndarray) -> List[Tuple[str, str]]:
+    """Turn a per-day presence mask into a list of (start, end) date strings."""
+    edges = np.diff(np.concatenate([[False], ~present, [False]]).astype(np.int8))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1) - 1
+    return [
+        (str(start + int(s)), str(start + int(e)))
+        for s, e in zip(run_starts, run_ends)
+    ]
@@ -1,19 +1,84 @@
+import numpy as np
 import requests
 from datetime import datetime
-from typing import List, NamedTuple, Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+from .cache import PointCache, DEFAULT_POINT_CACHE_SIZE, DEFAULT_POINT_TTL
 from .exceptions import NWSAPIError, InvalidCoordinatesError
-from .utils import validate_coordinates, calculate_degree_days
+from . import instrumentation
+from .http_session import USER_AGENT, http_get
+from .hourly import degree_days_from_hourly, validate_method
+from .results import DegreeDaysArray, DegreeDaysResult
+from .utils import celsius_to_fahrenheit, validate_coordinates
 
-USER_AGENT = "HDD-CDD-Calculator/0.1 (https://github.com/rmkenv/hdd_cdd_calculator)"
+# Point metadata kept from NWS /points responses
+POINT_PROPERTIES = (
+    "forecast", "forecastHourly", "forecastGridData",
+    "gridId", "gridX", "gridY", "timeZone",
+)
 
-class DegreeDaysResult(NamedTuple):
-    """Container for degree days calculation results."""
-    date: str
-    high_temp: float
-    low_temp: float
-    mean_temp: float
-    hdd: float
-    cdd: float
+_point_cache = PointCache()
+
+def configure_point_cache(
+    maxsize: int = DEFAULT_POINT_CACHE_SIZE,
+    ttl: float = DEFAULT_POINT_TTL,
+    path: Optional[Union[str, Path]] = None
+) -> PointCache:
+    """
+    Replace the memo of NWS /points lookups.
+
+    Args:
+        maxsize: Maximum number of memoized coordinates.
+        ttl: Lifetime of an entry in seconds.
+        path: Optional JSON file to load entries from and save them to
+              (see :meth:`PointCache.save`) across process restarts.
+
+    Returns:
+        The new PointCache.
+    """
+    global _point_cache
+    _point_cache = PointCache(maxsize=maxsize, ttl=ttl, path=path)
+    return _point_cache
+
+def get_point_cache() -> PointCache:
+    """Return the active memo of NWS /points lookups."""
+    return _point_cache
+
+def get_point_properties(lat: float, lon: float) -> dict:
+    """
+    Get NWS point metadata (forecast URLs, grid, time zone) for coordinates.
+
+    Resolutions are memoized, so repeated calls for the same coordinates
+    do not hit the /points endpoint again.
+
+    Raises:
+        InvalidCoordinatesError: If coordinates are invalid
+        NWSAPIError: If there's an error with the NWS API
+    """
+    lat, lon = validate_coordinates(lat, lon)
+
+    properties = _point_cache.get(lat, lon)
+    if properties is not None:
+        instrumentation.increment("point_cache.hits")
+        return properties
+    instrumentation.increment("point_cache.misses")
+
+    url = f"https://api.weather.gov/points/{lat:.4f},{lon:.4f}"
+    try:
+        with instrumentation.stage("nws.points"):
+            response = http_get(url)
+        response.raise_for_status()
+        data = response.json()
+    except requests.exceptions.RequestException as e:
+        raise NWSAPIError(
+            f"Failed to get forecast URL: {str(e)}",
+            status_code=getattr(e.response, "status_code", None),
+            url=url,
+        )
+
+    properties = {key: data['properties'].get(key) for key in POINT_PROPERTIES}
+    _point_cache.set(lat, lon, properties)
+    return properties
 
 def get_forecast_url(lat: float, lon: float) -> str:
     """
@@ -30,16 +95,7 @@ def get_forecast_url(lat: float, lon: float) -> str:
         InvalidCoordinatesError: If coordinates are invalid
         NWSAPIError: If there's an error with the NWS API
     """
-    lat, lon = validate_coordinates(lat, lon)
-
-    try:
-        url = f"https://api.weather.gov/points/{lat:.4f},{lon:.4f}"
-        response = requests.get(url, headers={"User-Agent": USER_AGENT})
-        response.raise_for_status()
-        data = response.json()
-        return data['properties']['forecast']
-    except requests.exceptions.RequestException as e:
-        raise NWSAPIError(f"Failed to get forecast URL: {str(e)}")
+    return get_point_properties(lat, lon)['forecast']
 
 def get_daily_temps(forecast_url: str) -> List[Tuple[str, float, float]]:
     """
@@ -55,7 +111,8 @@ def get_daily_temps(forecast_url: str) -> List[Tuple[str, float, float]]:
         NWSAPIError: If there's an error with the NWS API
     """
     try:
-        response = requests.get(forecast_url, headers={"User-Agent": USER_AGENT})
+        with instrumentation.stage("nws.forecast"):
+            response = http_get(forecast_url)
         response.raise_for_status()
         data = response.json()
         
@@ -86,7 +143,57 @@ def get_daily_temps(forecast_url: str) -> List[Tuple[str, float, float]]:
     except requests.exceptions.RequestException as e:
         raise NWSAPIError(f"Failed to get forecast data: {str(e)}")
 
-def get_degree_days_for_location(lat: float, lon: float, base_temp: float = 65.0) -> List[DegreeDaysResult]:
+def get_hourly_temps(hourly_url: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get hourly temperatures from an NWS hourly forecast.
+
+    Args:
+        hourly_url: URL to NWS hourly forecast data (``forecastHourly``)
+
+    Returns:
+        (times, temps): local wall-clock times as datetime64[m] and
+        temperatures in °F
+
+    Raises:
+        NWSAPIError: If there's an error with the NWS API
+    """
+    try:
+        with instrumentation.stage("nws.forecast_hourly"):
+            response = http_get(hourly_url)
+        response.raise_for_status()
+        periods = response.json()['properties']['periods']
+    except requests.exceptions.RequestException as e:
+        raise NWSAPIError(f"Failed to get hourly forecast data: {str(e)}")
+
+    # "2023-06-01T14:00:00-04:00" -> local "2023-06-01T14:00"
+    times = np.array([period['startTime'][:16] for period in periods], dtype="datetime64[m]")
+    temps = np.array(
+        [np.nan if period['temperature'] is None else period['temperature'] for period in periods],
+        dtype=np.float64,
+    )
+    celsius = np.array([period.get('temperatureUnit') == 'C' for period in periods], dtype=bool)
+    if celsius.any():
+        temps = np.where(celsius, celsius_to_fahrenheit(temps), temps)
+    return times, temps
+
+def daily_temps_to_degree_days(
+    daily_temps: List[Tuple[str, float, float]],
+    base_temp: float = 65.0,
+    method: str = "mean"
+) -> DegreeDaysArray:
+    """Compute degree days for the (date, high, low) tuples from get_daily_temps."""
+    if not daily_temps:
+        return DegreeDaysArray.empty()
+    dates, highs, lows = zip(*daily_temps)
+    return DegreeDaysArray.from_temperatures(dates, highs, lows, base_temp, method=method)
+
+def get_degree_days_for_location(
+    lat: float,
+    lon: float,
+    base_temp: float = 65.0,
+    columnar: bool = False,
+    method: str = "mean"
+) -> Union[List[DegreeDaysResult], DegreeDaysArray]:
     """
     Get degree days for a specific location.
     
@@ -94,26 +201,38 @@ def get_degree_days_for_location(lat: float, lon: float, base_temp: float = 65.0
         lat: Latitude
         lon: Longitude
         base_temp: Base temperature (default 65°F)
+        columnar: Return a DegreeDaysArray instead of a list
+        method: "mean", "single_sine" or "double_sine" to use the daily
+                forecast highs and lows, or "hourly" to integrate the
+                hourly forecast
     
     Returns:
-        List of DegreeDaysResult objects
+        List of DegreeDaysResult objects (or a DegreeDaysArray if `columnar`)
     
     Raises:
         InvalidCoordinatesError: If coordinates are invalid
         NWSAPIError: If there's an API error
     """
-    forecast_url = get_forecast_url(lat, lon)
-    daily_temps = get_daily_temps(forecast_url)
-    
-    results = []
-    for date, high, low in daily_temps:
-        hdd, cdd = calculate_degree_days(high, low, base_temp)
-        mean_temp = (high + low) / 2
-        results.append(DegreeDaysResult(date, high, low, mean_temp, hdd, cdd))
-    
-    return results
+    validate_method(method)
+    if method == "hourly":
+        times, temps = get_hourly_temps(get_point_properties(lat, lon)['forecastHourly'])
+        # Like the daily path, drop the partial first/last forecast days
+        results = degree_days_from_hourly(times, temps, base_temp, dropna=True)
+    else:
+        forecast_url = get_forecast_url(lat, lon)
+        daily_temps = get_daily_temps(forecast_url)
+        results = daily_temps_to_degree_days(daily_temps, base_temp, method)
+    return results if columnar else results.to_list()
 
-def get_degree_days_for_period(lat: float, lon: float, start_date: str, end_date: str, base_temp: float = 65.0) -> List[DegreeDaysResult]:
+def get_degree_days_for_period(
+    lat: float,
+    lon: float,
+    start_date: str,
+    end_date: str,
+    base_temp: float = 65.0,
+    columnar: bool = False,
+    method: str = "mean"
+) -> Union[List[DegreeDaysResult], DegreeDaysArray]:
     """
     Get degree days for a location and date range.
     
@@ -123,17 +242,17 @@ def get_degree_days_for_period(lat: float, lon: float, start_date: str, end_date
         start_date: Start date in YYYY-MM-DD
         end_date: End date in YYYY-MM-DD
         base_temp: Base temperature for HDD/CDD calculations
+        columnar: Return a DegreeDaysArray instead of a list
+        method: Degree day method (see get_degree_days_for_location)
     
     Returns:
         List of DegreeDaysResult objects for the specified period
+        (or a DegreeDaysArray if `columnar`)
     
     Raises:
         InvalidCoordinatesError: If coordinates are invalid
         NWSAPIError: If there's an API error
     """
-    all_results = get_degree_days_for_location(lat, lon, base_temp)
-    filtered = [
-        result for result in all_results
-        if start_date <= result.date <= end_date
-    ]
-    return filtered
+    all_results = get_degree_days_for_location(lat, lon, base_temp, columnar=True, method=method)
+    filtered = all_results.select(start_date, end_date)
+    return filtered if columnar else filtered.to_list()
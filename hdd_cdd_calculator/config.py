@@ -0,0 +1,7 @@
+# hdd_cdd_calculator/config.py
+# Settings shared by the CLI and the workflow modules. This module imports
+# nothing, so `python -m hdd_cdd_calculator --help` can show the defaults
+# without loading pandas or the portfolio module.
+
+# Sites processed concurrently by run_portfolio
+DEFAULT_PORTFOLIO_WORKERS = 8
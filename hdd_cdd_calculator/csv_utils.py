@@ -1,8 +1,15 @@
 # hdd_cdd_calculator/csv_utils.py
+import numpy as np
 import pandas as pd
-from typing import List, Tuple, Union
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 from io import StringIO
-from hdd_cdd_calculator import DegreeDaysResult  # For typing
+from . import instrumentation
+from .results import DegreeDaysLike, MultiBaseDegreeDays, as_degree_days_array
+
+# Rows per chunk for streaming reads
+DEFAULT_CHUNKSIZE = 500_000
+# Trailing UTC offset of an ISO-8601 timestamp ("Z", "+05:00", "-0500")
+UTC_OFFSET_PATTERN = r"(?:Z|[+-]\d{2}:?\d{2})$"
 
 
 def read_energy_data_from_csv(
@@ -64,45 +71,285 @@ def read_energy_data_with_dates(
     return df[["date", column]].dropna()
 
 
-def align_energy_with_degree_days(
-    degree_days: List[DegreeDaysResult],
+def _to_local_datetime(values: pd.Series) -> pd.Series:
+    """
+    Parse timestamps as naive local (wall-clock) times.
+
+    Readings stamped with a UTC offset keep their local time and drop the
+    offset, so they fall on the same local day as the degree days, also
+    when the offset changes at a DST transition.
+    """
+    try:
+        parsed = pd.to_datetime(values)
+    except (ValueError, TypeError):
+        parsed = None
+    if parsed is None or not pd.api.types.is_datetime64_any_dtype(parsed):
+        # Mixed offsets (e.g. across a DST change) cannot share one dtype
+        parsed = pd.to_datetime(values.astype(str).str.replace(UTC_OFFSET_PATTERN, "", regex=True))
+    if parsed.dt.tz is not None:
+        parsed = parsed.dt.tz_localize(None)
+    return parsed
+
+
+def iter_energy_chunks(
     csv_input: Union[str, StringIO],
+    columns: Sequence[str] = ("kwh",),
+    date_column: str = "date",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    dtype=np.float64
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream an energy CSV in chunks, reading only the needed columns.
+
+    Args:
+        csv_input: Path or file-like object for CSV.
+        columns: Energy columns to load.
+        date_column: Name of the date/timestamp column.
+        start_date: Optional first date to keep (YYYY-MM-DD, inclusive).
+        end_date: Optional last date to keep (YYYY-MM-DD, inclusive).
+        chunksize: Number of CSV rows parsed per chunk.
+        dtype: dtype for the energy columns.
+
+    Yields:
+        DataFrames with a parsed `date_column` and the selected columns,
+        filtered to the date range. Timestamps with UTC offsets are
+        returned as naive local times.
+
+    Raises:
+        ValueError: If a requested column is missing.
+    """
+    columns = list(columns)
+    try:
+        reader = pd.read_csv(
+            csv_input,
+            usecols=[date_column] + columns,
+            dtype={column: dtype for column in columns},
+            chunksize=chunksize,
+        )
+    except ValueError as e:
+        raise ValueError(f"CSV is missing required columns {[date_column] + columns}: {e}")
+
+    start = pd.Timestamp(start_date) if start_date is not None else None
+    # Inclusive end date also keeps sub-daily readings on that day
+    end = pd.Timestamp(end_date) + pd.Timedelta(days=1) if end_date is not None else None
+
+    with reader:
+        for chunk in reader:
+            chunk[date_column] = _to_local_datetime(chunk[date_column])
+            if start is not None or end is not None:
+                keep = np.ones(len(chunk), dtype=bool)
+                if start is not None:
+                    keep &= (chunk[date_column] >= start).to_numpy()
+                if end is not None:
+                    keep &= (chunk[date_column] < end).to_numpy()
+                chunk = chunk[keep]
+            if not chunk.empty:
+                yield chunk
+
+
+def read_energy_data_streaming(
+    csv_input: Union[str, StringIO],
+    columns: Sequence[str] = ("kwh",),
+    date_column: str = "date",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    daily: bool = True,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    dtype=np.float64
+) -> pd.DataFrame:
+    """
+    Read a large (e.g. hourly AMI) energy CSV with bounded memory.
+
+    The file is parsed in chunks with `usecols` and explicit dtypes, rows
+    outside the date range are dropped while reading, and with `daily=True`
+    sub-daily readings are summed to daily totals chunk by chunk, so peak
+    memory depends on the chunk size and number of days, not the file size.
+
+    Args:
+        csv_input: Path or file-like object for CSV.
+        columns: Energy columns to load.
+        date_column: Name of the date/timestamp column.
+        start_date: Optional first date to keep (YYYY-MM-DD, inclusive).
+        end_date: Optional last date to keep (YYYY-MM-DD, inclusive).
+        daily: Aggregate readings to daily totals.
+        chunksize: Number of CSV rows parsed per chunk.
+        dtype: dtype for the energy columns.
+
+    Returns:
+        DataFrame with `date_column` and the energy columns, sorted by date.
+        Days whose readings are all missing are NaN.
+    """
+    columns = list(columns)
+    parts = []
+    for chunk in iter_energy_chunks(
+        csv_input, columns, date_column, start_date, end_date, chunksize, dtype
+    ):
+        if daily:
+            days = chunk[date_column].dt.floor("D")
+            chunk = chunk[columns].groupby(days.rename(date_column)).sum(min_count=1)
+        parts.append(chunk)
+
+    if not parts:
+        return pd.DataFrame({date_column: pd.Series(dtype="datetime64[ns]"),
+                             **{column: pd.Series(dtype=dtype) for column in columns}})
+
+    combined = pd.concat(parts)
+    if daily:
+        # A day can straddle two chunks; merge the partial totals
+        combined = combined.groupby(level=0).sum(min_count=1).reset_index()
+    return combined.sort_values(date_column, kind="stable").reset_index(drop=True)
+
+
+def align_energy_with_degree_days(
+    degree_days: Union[DegreeDaysLike, MultiBaseDegreeDays],
+    csv_input: Union[str, StringIO, "EnergyDataset"],
     energy_column: str = "kwh",
-    degree_day_type: str = "hdd"
-) -> Tuple[List[float], List[float]]:
+    degree_day_type: str = "hdd",
+    chunksize: Optional[int] = None
+) -> Tuple[List[float], Union[List[float], np.ndarray]]:
     """
     Align energy CSV data with degree days by matching on date.
 
     Args:
-        degree_days: List of DegreeDaysResult namedtuples (with `date` field).
-        csv_input: Path or file-like object to CSV containing energy data.
+        degree_days: List of DegreeDaysResult namedtuples (with `date` field),
+                     a DegreeDaysArray, or a MultiBaseDegreeDays.
+        csv_input: Path or file-like object to CSV containing energy data, or
+                   an already parsed EnergyDataset (aligned without re-reading).
         energy_column: Name of the energy data column to use ("kwh", "mmbtu", "gal").
         degree_day_type: "hdd" or "cdd" — which degree day value to align.
+        chunksize: If given, stream the CSV in chunks of this many rows,
+                   keeping only the degree day date range and summing
+                   sub-daily readings to daily totals.
 
     Returns:
         (energy_values, degree_day_values): Both lists matched by date.
+        For MultiBaseDegreeDays, degree_day_values is a (days × bases) array.
 
     Raises:
         ValueError: If no data overlaps or columns are missing.
     """
+    from .dataset import EnergyDataset  # imported here to avoid a circular import
+
+    if isinstance(csv_input, EnergyDataset):
+        aligned = csv_input.align(degree_days, energy_column)
+        degree_day_values = getattr(aligned, degree_day_type)
+        if not isinstance(degree_days, MultiBaseDegreeDays):
+            degree_day_values = degree_day_values.tolist()
+        return aligned.energy.tolist(), degree_day_values
+
     # Convert degree days to DataFrame
-    dd_df = pd.DataFrame([dd._asdict() for dd in degree_days])
-    dd_df["date"] = pd.to_datetime(dd_df["date"])
+    multi_base = isinstance(degree_days, MultiBaseDegreeDays)
+    if multi_base:
+        # Merge on row numbers and gather matrix rows afterwards
+        dd_df = pd.DataFrame({"date": degree_days.dates, "_row": np.arange(len(degree_days))})
+    else:
+        dd_df = as_degree_days_array(degree_days).to_pandas()
 
     # Read CSV with parsed dates
-    energy_df = pd.read_csv(csv_input, parse_dates=["date"])
+    with instrumentation.stage("csv.read") as stage:
+        if chunksize is not None:
+            energy_df = read_energy_data_streaming(
+                csv_input,
+                [energy_column],
+                start_date=dd_df["date"].min() if len(dd_df) else None,
+                end_date=dd_df["date"].max() if len(dd_df) else None,
+                chunksize=chunksize,
+            )
+        else:
+            energy_df = pd.read_csv(csv_input, parse_dates=["date"])
+        stage.rows = len(energy_df)
     if energy_column not in energy_df.columns:
         raise ValueError(
             f"CSV missing '{energy_column}' column. Found columns: {list(energy_df.columns)}"
         )
 
     # Merge on date
-    merged = pd.merge(dd_df, energy_df[["date", energy_column]], on="date", how="inner")
-    if merged.empty:
-        raise ValueError("No overlapping dates between degree days and energy data.")
+    with instrumentation.stage("csv.align") as stage:
+        merged = pd.merge(dd_df, energy_df[["date", energy_column]], on="date", how="inner")
+        if merged.empty:
+            raise ValueError("No overlapping dates between degree days and energy data.")
 
-    merged = merged.sort_values("date")
-    degree_day_values = merged[degree_day_type].tolist()
+        merged = merged.sort_values("date")
+        stage.rows = len(merged)
+    if multi_base:
+        degree_day_values = getattr(degree_days, degree_day_type)[merged["_row"].to_numpy()]
+    else:
+        degree_day_values = merged[degree_day_type].tolist()
     energy_values = merged[energy_column].tolist()
 
     return energy_values, degree_day_values
+
+
+def align_energy_with_billing_periods(
+    degree_days: Union[DegreeDaysLike, MultiBaseDegreeDays, "DegreeDayIndex"],
+    csv_input: Union[str, StringIO],
+    energy_column: str = "kwh",
+    degree_day_type: str = "hdd",
+    start_column: str = "start_date",
+    end_column: str = "end_date",
+    per_day: bool = False
+) -> Tuple[List[float], Union[List[float], np.ndarray]]:
+    """
+    Align billed energy use with the degree days of each billing period.
+
+    Each bill row (start date, end date inclusive, usage) is matched with
+    the total degree days over its period using a prefix-sum
+    :class:`DegreeDayIndex`, so bills are never expanded to daily rows and
+    every period costs O(1). Bills with any day missing from the degree day
+    data are dropped.
+
+    Args:
+        degree_days: Daily degree days (list, DegreeDaysArray or
+                     MultiBaseDegreeDays) or a prebuilt DegreeDayIndex.
+        csv_input: Path or file-like object for a CSV with one row per bill.
+        energy_column: Name of the energy column.
+        degree_day_type: "hdd" or "cdd".
+        start_column: Column with the first day of each billing period.
+        end_column: Column with the last day of each billing period.
+        per_day: Divide energy and degree days by the period length, so
+                 bills of different lengths are comparable.
+
+    Returns:
+        (energy_values, degree_day_values) ordered by period start. For
+        MultiBaseDegreeDays, degree_day_values is a (bills × bases) array.
+
+    Raises:
+        ValueError: If columns are missing or no bill is covered.
+    """
+    from .period_index import DegreeDayIndex  # imported here to avoid a circular import
+
+    if degree_day_type not in ("hdd", "cdd"):
+        raise ValueError("degree_day_type must be 'hdd' or 'cdd'")
+    index = degree_days if isinstance(degree_days, DegreeDayIndex) else DegreeDayIndex.from_degree_days(degree_days)
+
+    with instrumentation.stage("csv.read") as stage:
+        bills = pd.read_csv(csv_input, parse_dates=[start_column, end_column])
+        stage.rows = len(bills)
+    if energy_column not in bills.columns:
+        raise ValueError(
+            f"CSV missing '{energy_column}' column. Found columns: {list(bills.columns)}"
+        )
+
+    with instrumentation.stage("csv.align_periods") as stage:
+        bills = bills.dropna(subset=[start_column, end_column, energy_column])
+        bills = bills.sort_values(start_column, kind="stable")
+        totals = index.totals(
+            bills[start_column].to_numpy(dtype="datetime64[D]"),
+            bills[end_column].to_numpy(dtype="datetime64[D]"),
+        )
+        complete = totals.complete.reshape(len(bills), -1).all(axis=1)
+        if not complete.any():
+            raise ValueError("No billing period is fully covered by the degree day data.")
+        stage.rows = int(complete.sum())
+
+    energy = bills[energy_column].to_numpy(dtype=np.float64)[complete]
+    degree_day_values = getattr(totals, degree_day_type)[complete]
+    if per_day:
+        days = totals.days[complete]
+        energy = energy / days
+        degree_day_values = degree_day_values / days.reshape((-1,) + (1,) * (degree_day_values.ndim - 1))
+    if degree_day_values.ndim == 1:
+        degree_day_values = degree_day_values.tolist()
+    return energy.tolist(), degree_day_values
@@ -1,8 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import numpy as np
+
 from .calculator import get_degree_days_for_period as get_nws_data
-from .meteostat_api import fetch_meteostat_data
-from .utils import celsius_to_fahrenheit  # make sure this exists in your utils
+from .calculator import get_degree_days_for_location, get_point_properties
+from .cache import FORECAST_SOURCES
+from .exceptions import NWSAPIError
+from .hourly import validate_method
+from .meteostat_api import fetch_meteostat_data, station_time_zone
+from .nws_grid import get_degree_days_for_gridpoint
+from .results import DegreeDaysArray, MultiBaseDegreeDays
+from .utils import validate_coordinates
 
-def get_degree_days(lat, lon, start_date, end_date, source="nws", base_temp=65.0):
+# Source name → fetch(lat, lon, start_date, end_date, base_temp, columnar=..., method=...)
+SOURCES = {
+    "nws": get_nws_data,
+    "nws_grid": get_degree_days_for_gridpoint,
+    "meteostat": fetch_meteostat_data,
+}
+# source="auto": days before today come from history, today onward from the forecast
+AUTO_HISTORY_SOURCE = "meteostat"
+AUTO_FORECAST_SOURCE = "nws_grid"
+
+def get_degree_days(lat, lon, start_date, end_date, source="nws", base_temp=65.0, columnar=False, cache=None,
+                    method="mean"):
     """
     Retrieve HDD/CDD data from the specified source and ensure temps are in Fahrenheit.
 
@@ -11,21 +33,198 @@ def get_degree_days(lat, lon, start_date, end_date, source="nws", base_temp=65.0
         lon: Longitude
         start_date: YYYY-MM-DD
         end_date: YYYY-MM-DD
-        source: "nws" or "meteostat"
-        base_temp: Base temperature for degree day calculation (°F)
+        source: "nws" (forecast periods), "nws_grid" (gridpoint raw
+                forecast data), "meteostat", or "auto" to combine Meteostat
+                history with the NWS forecast (see _get_auto_degree_days)
+        base_temp: Base temperature for degree day calculation (°F), or a
+                   sequence of base temperatures to evaluate from one fetch
+        columnar: Return a DegreeDaysArray (NumPy-backed columns) instead of a list
+        cache: Optional WeatherCache; only days missing from it are fetched
+        method: "mean" ((high + low) / 2, the default), "single_sine" or
+                "double_sine" from the daily highs and lows, or "hourly" to
+                integrate hourly temperatures (not available with `cache`)
 
     Returns:
         List of DegreeDaysResult with temperatures in °F
+        (or a DegreeDaysArray if `columnar`). If `base_temp` is a sequence,
+        a MultiBaseDegreeDays with (days × bases) HDD/CDD matrices.
     """
+    if source not in SOURCES and source != "auto":
+        raise ValueError(f"Unknown source. Choose one of {tuple(SOURCES) + ('auto',)}")
+    validate_method(method)
+    if method == "hourly" and cache is not None:
+        raise ValueError("The weather cache stores daily highs and lows; it cannot be used with method='hourly'")
+
+    if source == "auto":
+        results = _get_auto_degree_days(lat, lon, start_date, end_date, base_temp, cache, method)
+        if columnar or isinstance(results, MultiBaseDegreeDays):
+            return results
+        return results.to_list()
+
+    if np.ndim(base_temp) > 0:
+        if method == "hourly":
+            # The hourly series is integrated once against every base
+            return SOURCES[source](lat, lon, start_date, end_date, base_temp, columnar=True, method=method)
+        # Fetch the temperatures once, then broadcast over every base
+        results = get_degree_days(lat, lon, start_date, end_date, source, columnar=True, cache=cache)
+        return MultiBaseDegreeDays.from_temperatures(
+            results.dates, results.high_temp, results.low_temp, base_temp, method=method
+        )
+
+    if cache is not None:
+        results = _get_cached_degree_days(cache, lat, lon, start_date, end_date, source, base_temp, method)
+        return results if columnar else results.to_list()
+
+    # Every source converts to °F (Meteostat and gridpoint data arrive in °C)
+    return SOURCES[source](lat, lon, start_date, end_date, base_temp, columnar=columnar, method=method)
+
+
+def _fetch_temperatures(lat, lon, start_date, end_date, source):
+    """Fetch daily temperatures (°F) for a date range as a DegreeDaysArray."""
     if source == "nws":
-        results = get_nws_data(lat, lon, start_date, end_date, base_temp)
-    elif source == "meteostat":
-        results = fetch_meteostat_data(lat, lon, start_date, end_date, base_temp)
-        # Convert C → F for consistency
-        for r in results:
-            r.high_temp = celsius_to_fahrenheit(r.high_temp)
-            r.low_temp = celsius_to_fahrenheit(r.low_temp)
+        # The forecast cannot be requested by date, so keep every day returned
+        return get_degree_days_for_location(lat, lon, columnar=True)
+    if source == "nws_grid":
+        return get_degree_days_for_gridpoint(lat, lon, columnar=True)
+    return fetch_meteostat_data(lat, lon, start_date, end_date, columnar=True)
+
+
+def _get_cached_degree_days(cache, lat, lon, start_date, end_date, source, base_temp, method="mean"):
+    """Serve a request from `cache`, fetching and storing only missing sub-ranges."""
+    lat, lon = validate_coordinates(lat, lon)
+    cached, missing = cache.lookup(source, lat, lon, start_date, end_date)
+    if missing:
+        if source in FORECAST_SOURCES:
+            # One forecast download covers every missing sub-range
+            missing = [(start_date, end_date)]
+        for sub_start, sub_end in missing:
+            fetched = _fetch_temperatures(lat, lon, sub_start, sub_end, source)
+            cache.store(
+                source, lat, lon,
+                fetched.dates, fetched.high_temp, fetched.low_temp,
+                start_date=sub_start, end_date=sub_end,
+            )
+        cached, _ = cache.lookup(source, lat, lon, start_date, end_date, count=False)
+
+    return DegreeDaysArray.from_temperatures(
+        cached.dates, cached.high_temp, cached.low_temp, base_temp, method=method
+    )
+
+
+def _today(time_zone: str = "UTC") -> date:
+    """Current civil date in an IANA time zone."""
+    import pandas as pd
+
+    return pd.Timestamp.now(tz=time_zone).date()
+
+
+def _site_time_zone(lat, lon) -> str:
+    """IANA time zone of a site: the NWS point's, else the nearest Meteostat station's."""
+    try:
+        time_zone = get_point_properties(lat, lon).get("timeZone")
+    except NWSAPIError:
+        # Outside NWS coverage only the Meteostat history can be served
+        time_zone = None
+    return time_zone or station_time_zone(lat, lon)
+
+
+def _split_range(start_date, end_date, today: date):
+    """Split an inclusive date range into its (history, forecast) parts; either may be None."""
+    start = date.fromisoformat(str(start_date))
+    end = date.fromisoformat(str(end_date))
+    if end < start:
+        raise ValueError("end_date must be on or after start_date")
+    history = (start, min(end, today - timedelta(days=1))) if start < today else None
+    forecast = (max(start, today), end) if end >= today else None
+    return history, forecast
+
+
+def _stitch(parts, start: date, end: date):
+    """
+    Concatenate results in date order between `start` and `end`, keeping
+    the first part's value for repeated dates.
+    """
+    nonempty = [part for part in parts if len(part)]
+    if not nonempty:
+        return parts[0]
+    parts = nonempty
+    dates = np.concatenate([part.dates for part in parts])
+    # np.unique sorts and returns each date's first occurrence
+    unique, rows = np.unique(dates, return_index=True)
+    # Sources may return days outside the requested range (e.g. the whole forecast)
+    rows = rows[(unique >= np.datetime64(start)) & (unique <= np.datetime64(end))]
+    if isinstance(parts[0], MultiBaseDegreeDays):
+        def column(name):
+            return np.concatenate([getattr(part, name) for part in parts])[rows]
+        return MultiBaseDegreeDays(
+            dates[rows], column("high_temp"), column("low_temp"), parts[0].base_temps,
+            column("hdd"), column("cdd"), mean_temp=column("mean_temp"),
+        )
+    return DegreeDaysArray.concat(parts)[rows]
+
+
+def _get_auto_degree_days(lat, lon, start_date, end_date, base_temp, cache, method):
+    """
+    Serve source="auto": history from Meteostat, the rest from the NWS forecast.
+
+    Only the sub-ranges that are needed are fetched, the two fetches run
+    concurrently, and the parts are stitched into one date-ordered series
+    (history wins if a date appears in both). With a daily method the
+    degree days are recomputed over the stitched highs and lows, so
+    double_sine is continuous across the seam. Recent days that Meteostat
+    has not published yet and days past the forecast horizon are absent.
+    If the forecast fetch fails with NWSAPIError (e.g. a site outside NWS
+    coverage), the history part is returned alone; a range without
+    history raises the error.
+
+    "Today" is the site's local date, so the split does not depend on the
+    machine's clock or time zone. The site's time zone is only looked up
+    when the range comes within a day of today in UTC.
+    """
+    today = _today()
+    time_zone = None
+    start, end = (date.fromisoformat(str(d)) for d in (start_date, end_date))
+    # Local dates are within one day of the UTC date
+    if end >= today - timedelta(days=1) and start <= today + timedelta(days=1):
+        time_zone = _site_time_zone(lat, lon)
+        today = _today(time_zone)
+    history, forecast = _split_range(start_date, end_date, today)
+    # Daily methods fetch temperatures only; "hourly" must integrate inside each source
+    fetch_base, fetch_method = (base_temp, method) if method == "hourly" else (65.0, "mean")
+
+    def fetch(source, date_range):
+        if method == "hourly" and source == "meteostat" and time_zone is not None:
+            # Bucket Meteostat hours into the same local days as the forecast
+            return SOURCES[source](
+                lat, lon, date_range[0].isoformat(), date_range[1].isoformat(), fetch_base,
+                columnar=True, method=method, time_zone=time_zone,
+            )
+        return get_degree_days(
+            lat, lon, date_range[0].isoformat(), date_range[1].isoformat(), source=source,
+            base_temp=fetch_base, columnar=True, cache=cache, method=fetch_method,
+        )
+
+    plan = [(source, part) for source, part in
+            ((AUTO_HISTORY_SOURCE, history), (AUTO_FORECAST_SOURCE, forecast)) if part is not None]
+    if len(plan) == 1:
+        parts = [fetch(*plan[0])]
     else:
-        raise ValueError("Unknown source. Choose 'nws' or 'meteostat'")
+        with ThreadPoolExecutor(max_workers=len(plan)) as executor:
+            history_future, forecast_future = (executor.submit(fetch, source, part) for source, part in plan)
+            parts = [history_future.result()]
+            try:
+                parts.append(forecast_future.result())
+            except NWSAPIError:
+                # Outside NWS coverage (or during an outage) serve the history alone
+                forecast = None
 
-    return results
+    results = _stitch(parts, (history or forecast)[0], (forecast or history)[1])
+    if method == "hourly":
+        return results
+    if np.ndim(base_temp) > 0:
+        return MultiBaseDegreeDays.from_temperatures(
+            results.dates, results.high_temp, results.low_temp, base_temp, method=method
+        )
+    return DegreeDaysArray.from_temperatures(
+        results.dates, results.high_temp, results.low_temp, base_temp, method=method
+    )
@@ -0,0 +1,323 @@
+# hdd_cdd_calculator/dataset.py
+from io import StringIO
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from . import instrumentation
+from .csv_utils import _to_local_datetime, read_energy_data_streaming
+from .results import DegreeDaysLike, MultiBaseDegreeDays, as_degree_days_array
+
+
+class AlignedEnergy(NamedTuple):
+    """Energy readings and degree days matched by date."""
+    dates: np.ndarray
+    energy: np.ndarray
+    hdd: np.ndarray
+    cdd: np.ndarray
+    mean_temp: np.ndarray
+
+
+class AlignedMatrix(NamedTuple):
+    """Many meters aligned with one degree day series, ready for batch regression."""
+    dates: np.ndarray
+    meter_ids: List[str]
+    energy: np.ndarray          # (meters, days), NaN where missing
+    mask: np.ndarray            # (meters, days), True where a reading exists
+    degree_days: np.ndarray     # (days,), or (days, bases) for MultiBaseDegreeDays
+
+
+class EnergyDataset:
+    """
+    Energy data parsed once and indexed by day for repeated alignment.
+
+    Dates are held as a sorted ``datetime64[D]`` array and each energy
+    column as a contiguous float64 array. Alignment against a degree day
+    result is a binary search of its dates into this index, so one parsed
+    file can be aligned against HDD, CDD, several base temperatures or
+    several sources without re-reading the CSV.
+    """
+
+    def __init__(self, dates, columns: Dict[str, np.ndarray]):
+        """
+        Args:
+            dates: One date per row (timestamps are truncated to their local
+                   day; UTC offsets are dropped, as when streaming).
+            columns: Mapping of column (or meter) name → values aligned with `dates`.
+
+        Rows are sorted by date; several readings on the same day are summed.
+        """
+        days = _local_days(dates)
+        names = [str(name) for name in columns]
+        # Column-major storage keeps every column contiguous
+        values = np.empty((len(days), len(names)), dtype=np.float64, order="F")
+        for j, col in enumerate(columns.values()):
+            col = np.asarray(col, dtype=np.float64)
+            if len(col) != len(days):
+                raise ValueError(f"Column '{names[j]}' does not match the number of dates.")
+            values[:, j] = col
+
+        if len(days) and not (np.all(days[1:] > days[:-1])):
+            unique_days, inverse = np.unique(days, return_inverse=True)
+            values = _sum_by_group(values, inverse, len(unique_days))
+            days = unique_days
+
+        self.dates = days
+        self._values = values
+        self._index = {name: j for j, name in enumerate(names)}
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        date_column: str = "date",
+        columns: Optional[Sequence[str]] = None
+    ) -> "EnergyDataset":
+        """Build a dataset from a DataFrame (all numeric columns by default)."""
+        if date_column not in df.columns:
+            raise ValueError(f"DataFrame is missing required '{date_column}' column.")
+        if columns is None:
+            columns = [
+                c for c in df.columns
+                if c != date_column and pd.api.types.is_numeric_dtype(df[c])
+            ]
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            raise ValueError(
+                f"Missing column(s) {missing}. Available columns: {list(df.columns)}"
+            )
+        values = {c: df[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in columns}
+        return cls(df[date_column], values)
+
+    @classmethod
+    def from_csv(
+        cls,
+        csv_input: Union[str, StringIO],
+        columns: Optional[Sequence[str]] = None,
+        date_column: str = "date",
+        chunksize: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> "EnergyDataset":
+        """
+        Parse an energy CSV once.
+
+        Args:
+            csv_input: Path or file-like object for CSV.
+            columns: Energy columns to keep (all numeric columns by default).
+            date_column: Name of the date column.
+            chunksize: Stream the file in chunks of this many rows (see
+                       read_energy_data_streaming); requires `columns`.
+            start_date: Optional first date to keep when streaming.
+            end_date: Optional last date to keep when streaming.
+        """
+        if chunksize is not None:
+            if columns is None:
+                raise ValueError("columns must be given when streaming with chunksize.")
+            df = read_energy_data_streaming(
+                csv_input, columns, date_column, start_date, end_date, chunksize=chunksize
+            )
+        else:
+            # Dates are parsed in __init__, the same way as when streaming
+            df = pd.read_csv(csv_input)
+        return cls.from_frame(df, date_column, columns)
+
+    @classmethod
+    def from_long_frame(
+        cls,
+        df: pd.DataFrame,
+        meter_column: str = "meter_id",
+        value_column: str = "kwh",
+        date_column: str = "date"
+    ) -> "EnergyDataset":
+        """
+        Build a multi-meter dataset from long-format rows (date, meter, value).
+
+        Meters become columns; repeated (date, meter) readings are summed.
+        """
+        missing = [c for c in (date_column, meter_column, value_column) if c not in df.columns]
+        if missing:
+            raise ValueError(
+                f"Missing column(s) {missing}. Available columns: {list(df.columns)}"
+            )
+        days = _local_days(df[date_column])
+        unique_days, day_codes = np.unique(days, return_inverse=True)
+        meter_codes, meters = pd.factorize(df[meter_column].astype(str), sort=True)
+        values = df[value_column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        keep = ~np.isnan(values)
+        totals = np.zeros((len(unique_days), len(meters)), order="F")
+        counts = np.zeros((len(unique_days), len(meters)), dtype=np.int64, order="F")
+        np.add.at(totals, (day_codes[keep], meter_codes[keep]), values[keep])
+        np.add.at(counts, (day_codes[keep], meter_codes[keep]), 1)
+
+        matrix = np.where(counts > 0, totals, np.nan)
+        return cls(unique_days, {name: matrix[:, j] for j, name in enumerate(meters)})
+
+    @classmethod
+    def from_long_csv(
+        cls,
+        csv_input: Union[str, StringIO],
+        meter_column: str = "meter_id",
+        value_column: str = "kwh",
+        date_column: str = "date"
+    ) -> "EnergyDataset":
+        """
+        Parse a long-format CSV with one (date, meter_id, value) row per reading.
+
+        Only the three needed columns are read. Wide-format files (one column
+        per meter) are read with :meth:`from_csv`.
+        """
+        df = pd.read_csv(
+            csv_input,
+            usecols=[date_column, meter_column, value_column],
+            dtype={meter_column: str, value_column: np.float64},
+        )
+        return cls.from_long_frame(df, meter_column, value_column, date_column)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return f"EnergyDataset({len(self)} days, columns={self.columns})"
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of the energy columns (meter ids for multi-meter files)."""
+        return list(self._index)
+
+    def values(self, column: str) -> np.ndarray:
+        """Return the values of one energy column (no copy)."""
+        if column not in self._index:
+            raise ValueError(f"Unknown column '{column}'. Available columns: {self.columns}")
+        return self._values[:, self._index[column]]
+
+    def match(self, dates) -> np.ndarray:
+        """
+        Locate `dates` in the dataset.
+
+        Returns:
+            Row index into this dataset for each date, or -1 where absent.
+        """
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        if not len(self.dates):
+            return np.full(len(dates), -1)
+        idx = np.minimum(np.searchsorted(self.dates, dates), len(self.dates) - 1)
+        return np.where(self.dates[idx] == dates, idx, -1)
+
+    @instrumentation.timed("dataset.align")
+    def align(
+        self,
+        degree_days: Union[DegreeDaysLike, MultiBaseDegreeDays],
+        column: str = "kwh"
+    ) -> AlignedEnergy:
+        """
+        Match an energy column with degree days by date.
+
+        Days missing from either side, and days whose energy reading is NaN,
+        are dropped. For MultiBaseDegreeDays, `hdd` and `cdd` are
+        (days × bases) matrices.
+
+        Args:
+            degree_days: List of DegreeDaysResult, DegreeDaysArray or
+                         MultiBaseDegreeDays.
+            column: Energy column to align.
+
+        Returns:
+            AlignedEnergy sorted by date.
+
+        Raises:
+            ValueError: If the column is unknown or no dates overlap.
+        """
+        energy = self.values(column)
+        if not isinstance(degree_days, MultiBaseDegreeDays):
+            degree_days = as_degree_days_array(degree_days)
+
+        dd_dates = degree_days.dates
+        order = None
+        if len(dd_dates) > 1 and not np.all(dd_dates[1:] >= dd_dates[:-1]):
+            order = np.argsort(dd_dates, kind="stable")
+            dd_dates = dd_dates[order]
+
+        rows = self.match(dd_dates)
+        keep = rows >= 0
+        keep[keep] = ~np.isnan(energy[rows[keep]])
+        if not keep.any():
+            raise ValueError("No overlapping dates between degree days and energy data.")
+
+        dd_rows = np.flatnonzero(keep) if order is None else order[keep]
+        return AlignedEnergy(
+            dates=dd_dates[keep],
+            energy=energy[rows[keep]],
+            hdd=degree_days.hdd[dd_rows],
+            cdd=degree_days.cdd[dd_rows],
+            mean_temp=degree_days.mean_temp[dd_rows],
+        )
+
+    @instrumentation.timed("dataset.align_matrix")
+    def align_matrix(
+        self,
+        degree_days: Union[DegreeDaysLike, MultiBaseDegreeDays],
+        degree_day_type: str = "hdd",
+        columns: Optional[Sequence[str]] = None
+    ) -> AlignedMatrix:
+        """
+        Align every meter against one degree day series in a single join.
+
+        Keeps the days present in both the degree days and the dataset, and
+        returns a dense (meters × days) energy matrix with a mask of which
+        readings exist. The result feeds straight into
+        ``perform_regression_batch(aligned.degree_days, aligned.energy)``.
+
+        Args:
+            degree_days: List of DegreeDaysResult, DegreeDaysArray or
+                         MultiBaseDegreeDays.
+            degree_day_type: "hdd", "cdd" or "mean_temp".
+            columns: Meters to include (all by default).
+
+        Returns:
+            AlignedMatrix sorted by date.
+
+        Raises:
+            ValueError: If a column is unknown or no dates overlap.
+        """
+        columns = self.columns if columns is None else list(columns)
+        unknown = [c for c in columns if c not in self._index]
+        if unknown:
+            raise ValueError(f"Unknown column(s) {unknown}. Available columns: {self.columns}")
+
+        if not isinstance(degree_days, MultiBaseDegreeDays):
+            degree_days = as_degree_days_array(degree_days)
+        order = np.argsort(degree_days.dates, kind="stable")
+        rows = self.match(degree_days.dates[order])
+        keep = rows >= 0
+        if not keep.any():
+            raise ValueError("No overlapping dates between degree days and energy data.")
+
+        col_idx = [self._index[c] for c in columns]
+        energy = self._values[np.ix_(rows[keep], col_idx)].T
+        dd_rows = order[keep]
+        return AlignedMatrix(
+            dates=degree_days.dates[dd_rows],
+            meter_ids=columns,
+            energy=energy,
+            mask=~np.isnan(energy),
+            degree_days=getattr(degree_days, degree_day_type)[dd_rows],
+        )
+
+
+def _sum_by_group(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Sum the rows of a (rows × columns) matrix per group, keeping NaN for empty groups."""
+    present = ~np.isnan(values)
+    totals = np.zeros((n_groups, values.shape[1]), order="F")
+    counts = np.zeros((n_groups, values.shape[1]), dtype=np.int64, order="F")
+    np.add.at(totals, groups, np.where(present, values, 0.0))
+    np.add.at(counts, groups, present)
+    return np.asfortranarray(np.where(counts > 0, totals, np.nan))
+
+
+def _local_days(dates) -> np.ndarray:
+    """Truncate dates or timestamps to their local (wall-clock) day."""
+    parsed = _to_local_datetime(pd.Series(dates))
+    return parsed.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
@@ -8,10 +8,15 @@ class NWSAPIError(Exception):
             status_code: Optional HTTP status code from the API.
             url: Optional URL of the API request that caused the error.
         """
+        self.message = message
         self.status_code = status_code
         self.url = url
         super().__init__(self._format_message(message))
 
+    def __reduce__(self):
+        # Keep the structured fields when sent between processes
+        return (self.__class__, (self.message, self.status_code, self.url))
+
     def _format_message(self, message: str) -> str:
         details = message
         if self.status_code:
@@ -35,3 +40,7 @@ class InvalidCoordinatesError(Exception):
         self.lon = lon
         default_message = f"Invalid coordinates: ({lat}, {lon})"
         super().__init__(message or default_message)
+
+    def __reduce__(self):
+        # Keep the structured fields when sent between processes
+        return (self.__class__, (self.lat, self.lon, str(self)))
@@ -0,0 +1,176 @@
+# hdd_cdd_calculator/hourly.py
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from .results import DegreeDaysArray, MultiBaseDegreeDays
+from .utils import (
+    DEGREE_DAY_METHODS,
+    MAX_PLAUSIBLE_TEMP_F,
+    MIN_PLAUSIBLE_TEMP_F,
+    ArrayLike,
+    celsius_to_fahrenheit,
+)
+
+# Degree day methods accepted by the data source entry points: the daily
+# high/low methods plus integration of hourly observations or forecasts
+SOURCE_METHODS = DEGREE_DAY_METHODS + ("hourly",)
+
+# Days with fewer valid samples than this get NaN degree days
+DEFAULT_MIN_SAMPLES = 18
+
+
+def validate_method(method: str) -> str:
+    """Raise ValueError unless `method` is one of SOURCE_METHODS."""
+    if method not in SOURCE_METHODS:
+        raise ValueError(f"method must be one of {SOURCE_METHODS}")
+    return method
+
+
+def utc_to_local(times_utc: np.ndarray, time_zone: Optional[str]) -> np.ndarray:
+    """
+    Convert UTC datetime64 values to wall-clock time in an IANA `time_zone`.
+
+    Hourly sources bucket samples into the site's civil days through this,
+    so day boundaries agree between sources and follow DST changes. With
+    no time zone the times are returned unchanged (UTC days).
+    """
+    if not time_zone:
+        return times_utc
+    import pandas as pd  # only needed for time zone conversion
+
+    local = pd.DatetimeIndex(times_utc).tz_localize("UTC").tz_convert(time_zone).tz_localize(None)
+    return local.to_numpy(dtype="datetime64[s]")
+
+
+def degree_hours(
+    temps: ArrayLike,
+    base_temp: ArrayLike = 65.0,
+    unit: str = "F"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Heating and cooling degree-hours for each temperature sample.
+
+    Returns:
+        (HDH, CDH) arrays (°F-hours per sample); NaN where the temperature
+        is missing or implausible.
+    """
+    temps = _to_fahrenheit(temps, unit)
+    base = np.asarray(base_temp, dtype=np.float64)
+    if unit.upper() == "C":
+        base = celsius_to_fahrenheit(base)
+    delta = base - temps
+    hdh = np.where(np.isnan(delta), np.nan, np.maximum(delta, 0.0))
+    cdh = np.where(np.isnan(delta), np.nan, np.maximum(-delta, 0.0))
+    return hdh, cdh
+
+
+def _to_fahrenheit(temps: ArrayLike, unit: str) -> np.ndarray:
+    unit = unit.upper()
+    if unit not in ("F", "C"):
+        raise ValueError("unit must be either 'F' or 'C'")
+    temps = np.asarray(temps, dtype=np.float64)
+    if unit == "C":
+        temps = celsius_to_fahrenheit(temps)
+    with np.errstate(invalid="ignore"):
+        plausible = (temps >= MIN_PLAUSIBLE_TEMP_F) & (temps <= MAX_PLAUSIBLE_TEMP_F)
+    return np.where(plausible, temps, np.nan)
+
+
+def degree_days_from_hourly(
+    times,
+    temps: ArrayLike,
+    base_temp: ArrayLike = 65.0,
+    unit: str = "F",
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+    dropna: bool = False
+) -> Union[DegreeDaysArray, MultiBaseDegreeDays, List[DegreeDaysArray]]:
+    """
+    Integrate hourly temperatures into daily degree days.
+
+    Each day's HDD/CDD is the mean degree-hours over its valid samples
+    (the sum of degree-hours / 24 for a complete day), so the daily
+    temperature profile is used instead of only its high and low. Days
+    are taken from `times` as given, so pass local times to get local days.
+    Everything is computed with segmented NumPy reductions; there is no
+    per-hour Python work.
+
+    Args:
+        times: Sample times (datetime64 values or ISO strings without a
+               UTC offset), shared by every site.
+        temps: Temperatures of shape (hours,) for one site or
+               (sites, hours) for several; NaN marks missing samples.
+        base_temp: Base temperature (°F unless `unit` is 'C'), or a sequence
+                   of bases for a single site.
+        unit: 'F' or 'C' for `temps` and `base_temp`; results are in °F.
+        min_samples: Minimum valid samples for a day to get degree days.
+        dropna: Drop days with too few samples instead of returning them
+                with NaN values (single site only).
+
+    Returns:
+        DegreeDaysArray for one site and one base, MultiBaseDegreeDays for
+        one site and several bases, or one DegreeDaysArray per site. High,
+        low and mean temperatures are the daily max, min and mean of the
+        samples.
+    """
+    temps = _to_fahrenheit(temps, unit)
+    bases = np.asarray(base_temp, dtype=np.float64)
+    if unit.upper() == "C":
+        bases = celsius_to_fahrenheit(bases)
+    if temps.ndim not in (1, 2):
+        raise ValueError("temps must have shape (hours,) or (sites, hours)")
+    if (bases.ndim > 0 or dropna) and temps.ndim > 1:
+        raise ValueError("Several base temperatures and dropna are only supported for a single site.")
+
+    days = np.asarray(times).astype("datetime64[D]")
+    if days.shape != temps.shape[-1:]:
+        raise ValueError("times must have one entry per hourly sample.")
+    if len(days) > 1 and not np.all(days[1:] >= days[:-1]):
+        order = np.argsort(days, kind="stable")
+        days, temps = days[order], temps[..., order]
+
+    if not len(days):
+        if bases.ndim > 0:
+            return MultiBaseDegreeDays.from_temperatures(days, [], [], bases)
+        empty = DegreeDaysArray.empty()
+        return empty if temps.ndim == 1 else [empty] * temps.shape[0]
+
+    starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+    dates = days[starts]
+
+    valid = ~np.isnan(temps)
+    counts = np.add.reduceat(valid, starts, axis=-1)
+    enough = counts >= max(min_samples, 1)
+    filled = np.where(valid, temps, 0.0)
+    # Days kept in the output
+    keep = enough if dropna else slice(None)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        high = np.where(enough, np.fmax.reduceat(temps, starts, axis=-1), np.nan)
+        low = np.where(enough, np.fmin.reduceat(temps, starts, axis=-1), np.nan)
+        mean = np.where(enough, np.add.reduceat(filled, starts, axis=-1) / counts, np.nan)
+
+        if bases.ndim > 0:
+            # (hours, bases) degree-hours reduced to (days, bases)
+            delta = bases[None, :] - temps[:, None]
+            hdh = np.where(valid[:, None], np.maximum(delta, 0.0), 0.0)
+            cdh = np.where(valid[:, None], np.maximum(-delta, 0.0), 0.0)
+            scale = np.where(enough, 1.0 / counts, np.nan)[:, None]
+            hdd = np.add.reduceat(hdh, starts, axis=0) * scale
+            cdd = np.add.reduceat(cdh, starts, axis=0) * scale
+            return MultiBaseDegreeDays(
+                dates[keep], high[keep], low[keep], bases, hdd[keep], cdd[keep], mean_temp=mean[keep]
+            )
+
+        delta = bases - filled
+        hdd = np.add.reduceat(np.where(valid, np.maximum(delta, 0.0), 0.0), starts, axis=-1) / counts
+        cdd = np.add.reduceat(np.where(valid, np.maximum(-delta, 0.0), 0.0), starts, axis=-1) / counts
+    hdd = np.where(enough, hdd, np.nan)
+    cdd = np.where(enough, cdd, np.nan)
+
+    if temps.ndim == 1:
+        return DegreeDaysArray(dates, high, low, hdd, cdd, mean_temp=mean)[keep]
+    return [
+        DegreeDaysArray(dates, high[i], low[i], hdd[i], cdd[i], mean_temp=mean[i])
+        for i in range(temps.shape[0])
+    ]
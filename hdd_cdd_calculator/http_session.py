@@ -0,0 +1,122 @@
+# hdd_cdd_calculator/http_session.py
+import threading
+from typing import Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import instrumentation
+
+USER_AGENT = "HDD-CDD-Calculator/0.1 (https://github.com/rmkenv/hdd_cdd_calculator)"
+
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_POOL_SIZE = 20
+DEFAULT_TIMEOUT = 30.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_timeout = DEFAULT_TIMEOUT
+
+
+def create_session(
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    status_forcelist: Sequence[int] = RETRY_STATUS_CODES
+) -> requests.Session:
+    """
+    Create a `requests.Session` with connection pooling and retries.
+
+    Connections are kept alive and reused between requests. Failed GETs are
+    retried with exponential backoff, and a `Retry-After` header on 429/503
+    responses is honored.
+
+    Args:
+        retries: Maximum number of retries per request.
+        backoff_factor: Backoff factor between retries (seconds).
+        pool_size: Maximum number of pooled connections per host.
+        status_forcelist: HTTP status codes that trigger a retry.
+
+    Returns:
+        Configured session with the package User-Agent.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the shared module-level session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def configure_session(timeout: Optional[float] = None, **kwargs) -> requests.Session:
+    """
+    Replace the shared session with one built from `kwargs`.
+
+    Args:
+        timeout: Optional per-request timeout in seconds.
+        **kwargs: Passed to :func:`create_session`.
+
+    Returns:
+        The new shared session.
+    """
+    global _session, _timeout
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = create_session(**kwargs)
+        if timeout is not None:
+            _timeout = timeout
+    return _session
+
+
+def _wire_bytes(response: requests.Response) -> int:
+    """Bytes received for the body as sent (compressed), not as decoded."""
+    body = response.content  # reads the body if it has not been read yet
+    try:
+        # urllib3 counts the bytes pulled over the wire
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        pass
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, TypeError, ValueError):
+        return len(body)
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET `url` through the shared session using the configured timeout."""
+    kwargs.setdefault("timeout", _timeout)
+    if not instrumentation.enabled():
+        return get_session().get(url, **kwargs)
+
+    with instrumentation.stage("http.get"):
+        response = get_session().get(url, **kwargs)
+    instrumentation.increment("http.requests")
+    retries = getattr(response.raw, "retries", None)
+    if retries is not None and retries.history:
+        instrumentation.increment("http.retries", len(retries.history))
+    if not kwargs.get("stream"):
+        instrumentation.increment("http.bytes", _wire_bytes(response))
+    return response
@@ -0,0 +1,255 @@
+# hdd_cdd_calculator/instrumentation.py
+"""
+Opt-in instrumentation for the fetch, compute, align and regression stages.
+
+Library code reports events through :func:`stage` (wall time and rows
+processed per named stage) and :func:`increment` (counters such as HTTP
+requests, bytes downloaded, retries and cache hits). Nothing is recorded
+unless a subscriber is registered; until then both calls return after a
+single check of the subscriber list.
+
+The ``http.*`` counters cover requests made through the shared session
+(the NWS API); ``http.bytes`` is the size on the wire, before
+decompression. Meteostat downloads through its own client and file
+cache, so its fetches are counted as ``meteostat.requests`` and timed by
+the ``meteostat.fetch*`` stages.
+
+Example:
+    with record_metrics() as metrics:
+        get_degree_days(40.7128, -74.006, "2023-06-01", "2023-06-07", source="meteostat")
+    print(metrics.to_openmetrics())
+"""
+import functools
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Event callback: (kind, name, value, rows) with kind "stage" or "counter"
+Subscriber = Callable[[str, str, float, Optional[int]], None]
+
+_subscribers: List[Subscriber] = []
+_subscribers_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+class StageHandle:
+    """Yielded by :func:`stage`; set `rows` to report the rows processed."""
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows: Optional[int] = None
+
+
+class _NullStage:
+    """Shared no-op stage used while nothing is subscribed."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return _NULL_HANDLE
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _NullHandle:
+    __slots__ = ()
+
+    @property
+    def rows(self):
+        return None
+
+    @rows.setter
+    def rows(self, value):
+        pass
+
+
+_NULL_HANDLE = _NullHandle()
+_NULL_STAGE = _NullStage()
+
+
+def enabled() -> bool:
+    """Whether any subscriber is registered."""
+    return bool(_subscribers)
+
+
+def subscribe(callback: Subscriber) -> None:
+    """Register a callback that receives every stage and counter event."""
+    with _subscribers_lock:
+        _subscribers.append(callback)
+
+
+def unsubscribe(callback: Subscriber) -> None:
+    """Remove a callback registered with :func:`subscribe`."""
+    with _subscribers_lock:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+
+def _emit(kind: str, name: str, value: float, rows: Optional[int] = None) -> None:
+    for callback in list(_subscribers):
+        callback(kind, name, value, rows)
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Add `value` to counter `name` (no-op when nothing is subscribed)."""
+    if _subscribers:
+        _emit("counter", name, value)
+
+
+@contextmanager
+def _timed_stage(name: str) -> Iterator[StageHandle]:
+    handle = StageHandle()
+    start = time.perf_counter()
+    try:
+        yield handle
+    finally:
+        _emit("stage", name, time.perf_counter() - start, handle.rows)
+
+
+def stage(name: str):
+    """
+    Time a block of work as stage `name`.
+
+    Example:
+        with stage("csv.align") as s:
+            merged = ...
+            s.rows = len(merged)
+    """
+    if not _subscribers:
+        return _NULL_STAGE
+    return _timed_stage(name)
+
+
+def timed(name: str):
+    """Decorator that times every call of the function as stage `name`."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _subscribers:
+                return func(*args, **kwargs)
+            with _timed_stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class Metrics:
+    """
+    Thread-safe collector of stage timings and counters.
+
+    Per stage it keeps the call count, total and maximum wall time and the
+    rows processed; counters are plain running totals.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, float] = {}
+
+    def __call__(self, kind: str, name: str, value: float, rows: Optional[int] = None) -> None:
+        with self._lock:
+            if kind == "counter":
+                self.counters[name] = self.counters.get(name, 0) + value
+                return
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "rows": 0}
+            stats["count"] += 1
+            stats["total_seconds"] += value
+            stats["max_seconds"] = max(stats["max_seconds"], value)
+            if rows is not None:
+                stats["rows"] += rows
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Return {"stages": {name: stats}, "counters": {name: value}} (a copy)."""
+        with self._lock:
+            return {
+                "stages": {name: dict(stats) for name, stats in self.stages.items()},
+                "counters": dict(self.counters),
+            }
+
+    def log(self, log: Optional[logging.Logger] = None, level: int = logging.INFO) -> None:
+        """Write one line per stage and counter to `log` (this module's logger by default)."""
+        log = log or logger
+        snapshot = self.to_dict()
+        for name, stats in sorted(snapshot["stages"].items()):
+            log.log(
+                level, "stage %s: %d calls, %.3fs total, %.3fs max, %d rows",
+                name, stats["count"], stats["total_seconds"], stats["max_seconds"], stats["rows"],
+            )
+        for name, value in sorted(snapshot["counters"].items()):
+            log.log(level, "counter %s: %s", name, value)
+
+    def to_openmetrics(self, prefix: str = "hdd_cdd") -> str:
+        """
+        Render the metrics in the OpenMetrics text exposition format.
+
+        Stages become ``<prefix>_stage_seconds`` (summary), ``<prefix>_stage_max_seconds``
+        (gauge) and ``<prefix>_stage_rows`` (counter) labelled by stage;
+        each counter ``a.b`` becomes ``<prefix>_a_b_total``.
+        """
+        snapshot = self.to_dict()
+        lines = []
+        stages = sorted(snapshot["stages"].items())
+        if stages:
+            families = (
+                ("stage_seconds", "summary", "Wall time spent per stage."),
+                ("stage_max_seconds", "gauge", "Longest single call per stage."),
+                ("stage_rows", "counter", "Rows processed per stage."),
+            )
+            for family, metric_type, help_text in families:
+                metric = f"{prefix}_{family}"
+                lines.append(f"# TYPE {metric} {metric_type}")
+                lines.append(f"# HELP {metric} {help_text}")
+                for name, stats in stages:
+                    label = f'{{stage="{_escape(name)}"}}'
+                    if family == "stage_seconds":
+                        lines.append(f"{metric}_count{label} {stats['count']}")
+                        lines.append(f"{metric}_sum{label} {stats['total_seconds']!r}")
+                    elif family == "stage_max_seconds":
+                        lines.append(f"{metric}{label} {stats['max_seconds']!r}")
+                    else:
+                        lines.append(f"{metric}_total{label} {stats['rows']}")
+        for name, value in sorted(snapshot["counters"].items()):
+            metric = f"{prefix}_{_metric_name(name)}"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}_total {value!r}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@contextmanager
+def record_metrics(metrics: Optional[Metrics] = None) -> Iterator[Metrics]:
+    """
+    Collect metrics from every thread while the block runs.
+
+    Args:
+        metrics: Existing collector to add to (a new one by default).
+
+    Yields:
+        The Metrics collector.
+    """
+    metrics = Metrics() if metrics is None else metrics
+    subscribe(metrics)
+    try:
+        yield metrics
+    finally:
+        unsubscribe(metrics)
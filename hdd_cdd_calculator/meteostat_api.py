@@ -1,64 +1,202 @@
-from meteostat import Point, Daily
-from datetime import datetime
-from typing import List, NamedTuple
-from .utils import calculate_degree_days, validate_coordinates, celsius_to_fahrenheit
+from meteostat import Point, Daily, Hourly, Stations
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Union
+import numpy as np
+import pandas as pd
+from .utils import validate_coordinates, celsius_to_fahrenheit
 from .exceptions import NWSAPIError
+from . import instrumentation
+from .hourly import degree_days_from_hourly, utc_to_local, validate_method
+from .results import DegreeDaysArray, DegreeDaysResult, MultiBaseDegreeDays
 
-class DegreeDaysResult(NamedTuple):
-    date: str
-    high_temp: float
-    low_temp: float
-    mean_temp: float
-    hdd: float
-    cdd: float
 
-def fetch_meteostat_data(
+def meteostat_to_degree_days(
+    df: pd.DataFrame,
+    base_temp: float = 65.0,
+    method: str = "mean"
+) -> DegreeDaysArray:
+    """
+    Convert a Meteostat daily DataFrame (°C, indexed by date) to degree days in °F.
+
+    All columns are processed at once; days with a missing `tmin` or `tmax`
+    are dropped.
+
+    Args:
+        df: DataFrame as returned by ``meteostat.Daily(...).fetch()``.
+        base_temp: Base temperature for degree day calculation (°F).
+        method: 'mean', 'single_sine' or 'double_sine'.
+
+    Returns:
+        DegreeDaysArray with temperatures in °F.
+    """
+    if df.empty or "tmin" not in df.columns or "tmax" not in df.columns:
+        return DegreeDaysArray.empty()
+
+    with instrumentation.stage("meteostat.process") as stage:
+        t_min_c = df["tmin"].to_numpy(dtype=np.float64, na_value=np.nan)
+        t_max_c = df["tmax"].to_numpy(dtype=np.float64, na_value=np.nan)
+        complete = ~(np.isnan(t_min_c) | np.isnan(t_max_c))  # skip incomplete days
+
+        # Convert C → F on whole columns
+        t_min_f = celsius_to_fahrenheit(t_min_c[complete])
+        t_max_f = celsius_to_fahrenheit(t_max_c[complete])
+        dates = df.index.to_numpy(dtype="datetime64[ns]")[complete].astype("datetime64[D]")
+        stage.rows = len(df)
+        return DegreeDaysArray.from_temperatures(dates, t_max_f, t_min_f, base_temp, method=method)
+
+
+def _fetch_daily(location, start_date: str, end_date: str) -> pd.DataFrame:
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+
+        with instrumentation.stage("meteostat.fetch") as stage:
+            df = Daily(location, start, end).fetch()
+            stage.rows = len(df)
+        instrumentation.increment("meteostat.requests")
+        return df
+    except Exception as e:
+        raise NWSAPIError(f"Failed to fetch Meteostat data: {str(e)}")
+
+
+def fetch_meteostat_daily(
     lat: float,
     lon: float,
     start_date: str,
-    end_date: str,
-    base_temp: float = 65.0
-) -> List[DegreeDaysResult]:
+    end_date: str
+) -> pd.DataFrame:
     """
-    Fetch Meteostat daily temps, convert to °F, then calculate HDD/CDD with °F base temp.
+    Fetch the raw Meteostat daily DataFrame (°C) for a location.
+
+    Raises:
+        InvalidCoordinatesError: If coordinates are invalid
+        NWSAPIError: If the Meteostat request fails
     """
     lat, lon = validate_coordinates(lat, lon)
+    return _fetch_daily(Point(lat, lon), start_date, end_date)
 
-    try:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
 
-        location = Point(lat, lon)
-        data = Daily(location, start, end)
-        df = data.fetch()
-
-        results = []
-        for date, row in df.iterrows():
-            t_min_c = row["tmin"]
-            t_max_c = row["tmax"]
-            if t_min_c is None or t_max_c is None:
-                continue  # skip incomplete days
-
-            # ✅ Convert C → F
-            t_min_f = celsius_to_fahrenheit(t_min_c)
-            t_max_f = celsius_to_fahrenheit(t_max_c)
-            mean_temp_f = (t_max_f + t_min_f) / 2
-
-            # HDD/CDD calc now consistent with °F base_temp
-            hdd, cdd = calculate_degree_days(t_max_f, t_min_f, base_temp)
-
-            results.append(
-                DegreeDaysResult(
-                    date.strftime("%Y-%m-%d"),
-                    t_max_f,
-                    t_min_f,
-                    mean_temp_f,
-                    hdd,
-                    cdd,
-                )
-            )
-
-        return results
+def fetch_meteostat_station_daily(
+    station_id: str,
+    start_date: str,
+    end_date: str
+) -> pd.DataFrame:
+    """
+    Fetch the raw Meteostat daily DataFrame (°C) for a single station.
+
+    Raises:
+        NWSAPIError: If the Meteostat request fails
+    """
+    return _fetch_daily(station_id, start_date, end_date)
+
+
+def fetch_meteostat_hourly(
+    lat: float,
+    lon: float,
+    start_date: str,
+    end_date: str
+) -> pd.DataFrame:
+    """
+    Fetch the raw Meteostat hourly DataFrame (°C, UTC index) for a location.
+
+    One day of padding is fetched on each side so that every local day in
+    the range is complete whatever the UTC offset.
 
+    Raises:
+        InvalidCoordinatesError: If coordinates are invalid
+        NWSAPIError: If the Meteostat request fails
+    """
+    lat, lon = validate_coordinates(lat, lon)
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d") - timedelta(days=1)
+        end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=2)
+
+        with instrumentation.stage("meteostat.fetch_hourly") as stage:
+            df = Hourly(Point(lat, lon), start, end - timedelta(hours=1)).fetch()
+            stage.rows = len(df)
+        instrumentation.increment("meteostat.requests")
+        return df
     except Exception as e:
         raise NWSAPIError(f"Failed to fetch Meteostat data: {str(e)}")
+
+
+@lru_cache(maxsize=1024)
+def station_time_zone(lat: float, lon: float) -> str:
+    """
+    IANA time zone of the Meteostat station nearest to a location.
+
+    Falls back to the solar time zone of the longitude ("Etc/GMT+5" for
+    about 75°W) if no station with a time zone is found.
+
+    Raises:
+        InvalidCoordinatesError: If coordinates are invalid
+        NWSAPIError: If the Meteostat station list cannot be loaded
+    """
+    lat, lon = validate_coordinates(lat, lon)
+    try:
+        nearest = Stations().nearby(lat, lon).fetch(1)
+    except Exception as e:
+        raise NWSAPIError(f"Failed to fetch Meteostat stations: {str(e)}")
+    if len(nearest) and isinstance(nearest["timezone"].iloc[0], str):
+        return nearest["timezone"].iloc[0]
+    # Etc/GMT signs are inverted: Etc/GMT+5 is UTC-5
+    return f"Etc/GMT{-round(lon / 15):+d}"
+
+
+def meteostat_hourly_to_degree_days(
+    df: pd.DataFrame,
+    base_temp=65.0,
+    time_zone: Optional[str] = None
+) -> Union[DegreeDaysArray, MultiBaseDegreeDays]:
+    """
+    Integrate a Meteostat hourly DataFrame (°C, UTC index) into daily degree days in °F.
+
+    Args:
+        df: DataFrame as returned by ``meteostat.Hourly(...).fetch()``.
+        base_temp: Base temperature (°F), or a sequence of bases.
+        time_zone: IANA time zone whose civil days the hours are grouped
+                   into (UTC days if None).
+
+    Returns:
+        DegreeDaysArray (MultiBaseDegreeDays for several bases); days with
+        too few observations are dropped.
+    """
+    if df.empty or "temp" not in df.columns:
+        return degree_days_from_hourly(np.array([], dtype="datetime64[m]"), [], base_temp)
+
+    with instrumentation.stage("meteostat.process") as stage:
+        times = utc_to_local(df.index.to_numpy(dtype="datetime64[ns]"), time_zone)
+        temps = celsius_to_fahrenheit(df["temp"].to_numpy(dtype=np.float64, na_value=np.nan))
+        stage.rows = len(df)
+        return degree_days_from_hourly(times, temps, base_temp, dropna=True)
+
+
+def fetch_meteostat_data(
+    lat: float,
+    lon: float,
+    start_date: str,
+    end_date: str,
+    base_temp: float = 65.0,
+    columnar: bool = False,
+    method: str = "mean",
+    time_zone: Optional[str] = None
+) -> Union[List[DegreeDaysResult], DegreeDaysArray]:
+    """
+    Fetch Meteostat daily temps, convert to °F, then calculate HDD/CDD with °F base temp.
+
+    Set `columnar=True` to get a DegreeDaysArray instead of a list. With
+    `method="hourly"` the hourly observations are integrated instead,
+    grouped into civil days of `time_zone` (an IANA name; defaults to the
+    time zone of the nearest Meteostat station), the same local days the
+    NWS sources use.
+    """
+    validate_method(method)
+    if method == "hourly":
+        df = fetch_meteostat_hourly(lat, lon, start_date, end_date)
+        results = meteostat_hourly_to_degree_days(df, base_temp, time_zone or station_time_zone(lat, lon))
+        results = results.select(start_date, end_date)
+    else:
+        df = fetch_meteostat_daily(lat, lon, start_date, end_date)
+        results = meteostat_to_degree_days(df, base_temp, method)
+    return results if columnar else results.to_list()
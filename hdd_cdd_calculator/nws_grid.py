@@ -0,0 +1,361 @@
+# hdd_cdd_calculator/nws_grid.py
+"""
+NWS gridpoint raw forecast data.
+
+The /gridpoints/{office}/{x},{y} endpoint (the ``forecastGridData`` URL of a
+point) returns every forecast element as ISO-8601 interval time series,
+e.g. ``{"validTime": "2023-06-01T12:00:00+00:00/PT13H", "value": 27.2}``.
+Daily highs and lows come straight from ``maxTemperature`` and
+``minTemperature``, and ``temperature`` gives the hourly series, so one
+download per forecast grid cell replaces the narrative forecast and the
+reconstruction of highs and lows from day/night periods.
+"""
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import requests
+
+from . import instrumentation
+from .calculator import get_point_properties
+from .exceptions import InvalidCoordinatesError, NWSAPIError
+from .hourly import degree_days_from_hourly, utc_to_local, validate_method
+from .http_session import http_get
+from .results import DegreeDaysArray, DegreeDaysResult, MultiBaseDegreeDays
+from .utils import celsius_to_fahrenheit
+
+DEFAULT_WORKERS = 8
+HOUR = np.timedelta64(1, "h")
+
+# Errors recorded per location instead of aborting a batch
+LOCATION_ERRORS = (NWSAPIError, InvalidCoordinatesError)
+
+_DURATION = re.compile(r"P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?")
+_OFFSET = re.compile(r"([+-])(\d{2}):?(\d{2})")
+
+
+def _factorize(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distinct values and the index of each element's value.
+
+    Time series repeat durations and offsets in long runs, so only the
+    first element of each run goes through the (sorting) np.unique.
+    """
+    heads = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    unique, head_inverse = np.unique(values[heads], return_inverse=True)
+    run_lengths = np.diff(np.r_[heads, len(values)])
+    return unique, np.repeat(head_inverse.ravel(), run_lengths)
+
+
+def _parse_durations(durations: np.ndarray) -> np.ndarray:
+    """ISO-8601 durations (e.g. "PT1H", "P1DT6H") as timedelta64[s]."""
+    # Forecast series repeat a handful of durations, so parse each distinct one once
+    unique, inverse = _factorize(durations)
+    seconds = np.empty(len(unique), dtype=np.int64)
+    for i, text in enumerate(unique.tolist()):
+        match = _DURATION.fullmatch(text)
+        if match is None or text in ("P", "PT") or text.endswith("T"):
+            raise ValueError(f"Invalid ISO-8601 duration: {text!r}")
+        weeks, days, hours, minutes, secs = (int(g) if g else 0 for g in match.groups())
+        seconds[i] = (((weeks * 7 + days) * 24 + hours) * 60 + minutes) * 60 + secs
+    return seconds[inverse].astype("timedelta64[s]")
+
+
+def _parse_offsets(offsets: np.ndarray) -> np.ndarray:
+    """UTC offsets ("+00:00", "-0500", "Z" or "") as timedelta64[s]."""
+    unique, inverse = _factorize(offsets)
+    seconds = np.zeros(len(unique), dtype=np.int64)
+    for i, text in enumerate(unique.tolist()):
+        if text in ("", "Z"):
+            continue
+        match = _OFFSET.fullmatch(text)
+        if match is None:
+            raise ValueError(f"Invalid UTC offset: {text!r}")
+        sign = -1 if match.group(1) == "-" else 1
+        seconds[i] = sign * (int(match.group(2)) * 3600 + int(match.group(3)) * 60)
+    return seconds[inverse].astype("timedelta64[s]")
+
+
+def parse_intervals(valid_times) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse ISO-8601 ``start/duration`` intervals.
+
+    The strings are split on a character view of the array, the
+    fixed-width timestamps are converted with NumPy casts, and only the
+    distinct durations and offsets are parsed individually, so there is
+    no per-interval Python work.
+
+    Args:
+        valid_times: Strings like "2023-06-01T12:00:00+00:00/PT13H".
+
+    Returns:
+        (starts, durations): UTC start times as datetime64[s] and
+        durations as timedelta64[s].
+
+    Raises:
+        ValueError: If an interval cannot be parsed.
+    """
+    valid_times = np.asarray(valid_times, dtype=str).ravel()
+    n = len(valid_times)
+    starts = np.empty(n, dtype="datetime64[s]")
+    durations = np.empty(n, dtype="timedelta64[s]")
+    if not n:
+        return starts, durations
+
+    width = valid_times.dtype.itemsize // 4
+    chars = valid_times.view("U1").reshape(n, width)
+    is_slash = chars == "/"
+    slash = is_slash.argmax(axis=1)
+    if not is_slash[np.arange(n), slash].all() or slash.min() < 19:
+        raise ValueError("Intervals must look like 'YYYY-MM-DDTHH:MM:SS+HH:MM/duration'")
+
+    # Rows are grouped by slash position (normally one group, e.g. "+00:00" offsets)
+    for position in np.unique(slash).tolist():
+        rows = slash == position
+        part = chars[rows]
+        # "YYYY-MM-DDTHH:MM:SS" is the first 19 characters, then the offset
+        try:
+            local = np.ascontiguousarray(part[:, :19]).view("U19").ravel().astype("datetime64[s]")
+        except ValueError as e:
+            raise ValueError(f"Invalid ISO-8601 interval start: {e}")
+        if position > 19:
+            offsets = np.ascontiguousarray(part[:, 19:position]).view(f"U{position - 19}").ravel()
+        else:
+            offsets = np.full(part.shape[0], "")
+        starts[rows] = local - _parse_offsets(offsets)
+        durations[rows] = _parse_durations(
+            np.ascontiguousarray(part[:, position + 1:]).view(f"U{max(width - position - 1, 1)}").ravel()
+        )
+    return starts, durations
+
+
+def expand_intervals(
+    starts: np.ndarray,
+    durations: np.ndarray,
+    values: np.ndarray,
+    step: np.timedelta64 = HOUR
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expand interval values into a regular series (one sample per `step`).
+
+    Returns:
+        (times, values) with each interval's value repeated for every step
+        it covers.
+    """
+    counts = np.maximum(durations // step, 1).astype(np.int64)
+    owner = np.repeat(np.arange(len(starts)), counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return starts[owner] + within * step, np.asarray(values)[owner]
+
+
+def _series(properties: Dict[str, Any], element: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(starts, durations, values in °F) of one gridpoint element."""
+    layer = properties.get(element) or {}
+    entries = layer.get("values") or []
+    starts, durations = parse_intervals([entry["validTime"] for entry in entries])
+    values = np.array(
+        [np.nan if entry["value"] is None else entry["value"] for entry in entries], dtype=np.float64
+    )
+    if str(layer.get("uom", "wmoUnit:degC")).endswith("degC"):
+        values = celsius_to_fahrenheit(values)
+    return starts, durations, values
+
+
+def _daily_extreme(properties, element, time_zone, reduce) -> Tuple[np.ndarray, np.ndarray]:
+    """Daily values of a max/min element, dated by the local day of each interval's midpoint."""
+    starts, durations, values = _series(properties, element)
+    days = utc_to_local(starts + durations // 2, time_zone).astype("datetime64[D]")
+    keep = ~np.isnan(values)
+    days, values = days[keep], values[keep]
+    if not len(days):
+        return days, values
+    order = np.argsort(days, kind="stable")
+    days, values = days[order], values[order]
+    first = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+    return days[first], reduce.reduceat(values, first)
+
+
+def gridpoint_to_degree_days(
+    properties: Dict[str, Any],
+    base_temp=65.0,
+    time_zone: Optional[str] = None,
+    method: str = "mean"
+) -> Union[DegreeDaysArray, MultiBaseDegreeDays]:
+    """
+    Compute degree days from gridpoint raw data.
+
+    Args:
+        properties: The ``properties`` object of a /gridpoints response.
+        base_temp: Base temperature (°F), or a sequence of bases.
+        time_zone: IANA time zone of the location (the point's
+                   ``timeZone``); days are local days. UTC if omitted.
+        method: "mean", "single_sine" or "double_sine" use the daily
+                ``maxTemperature``/``minTemperature``; "hourly" integrates
+                the ``temperature`` series.
+
+    Returns:
+        DegreeDaysArray (MultiBaseDegreeDays for several bases) for the
+        days with a complete forecast.
+    """
+    validate_method(method)
+    with instrumentation.stage("nws.gridpoints.process") as stage:
+        if method == "hourly":
+            starts, durations, values = _series(properties, "temperature")
+            times, temps = expand_intervals(starts, durations, values)
+            results = degree_days_from_hourly(utc_to_local(times, time_zone), temps, base_temp, dropna=True)
+        else:
+            high_days, highs = _daily_extreme(properties, "maxTemperature", time_zone, np.fmax)
+            low_days, lows = _daily_extreme(properties, "minTemperature", time_zone, np.fmin)
+            dates, hi, lo = np.intersect1d(high_days, low_days, assume_unique=True, return_indices=True)
+            if np.ndim(base_temp) > 0:
+                results = MultiBaseDegreeDays.from_temperatures(
+                    dates, highs[hi], lows[lo], base_temp, method=method
+                )
+            else:
+                results = DegreeDaysArray.from_temperatures(dates, highs[hi], lows[lo], base_temp, method=method)
+        stage.rows = len(results)
+    return results
+
+
+def get_gridpoint_data(grid_url: str) -> Dict[str, Any]:
+    """
+    Download the raw forecast data of one NWS grid cell.
+
+    Args:
+        grid_url: The point's ``forecastGridData`` URL.
+
+    Returns:
+        The ``properties`` object of the response.
+
+    Raises:
+        NWSAPIError: If there's an error with the NWS API
+    """
+    try:
+        with instrumentation.stage("nws.gridpoints"):
+            response = http_get(grid_url)
+        response.raise_for_status()
+        return response.json()["properties"]
+    except requests.exceptions.RequestException as e:
+        raise NWSAPIError(
+            f"Failed to get gridpoint data: {str(e)}",
+            status_code=getattr(e.response, "status_code", None),
+            url=grid_url,
+        )
+
+
+def get_degree_days_for_gridpoint(
+    lat: float,
+    lon: float,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    base_temp: Union[float, Sequence[float]] = 65.0,
+    columnar: bool = False,
+    method: str = "mean"
+) -> Union[List[DegreeDaysResult], DegreeDaysArray, MultiBaseDegreeDays]:
+    """
+    Get forecast degree days for a location from NWS gridpoint raw data.
+
+    The point lookup is memoized, so after the first call for a location
+    only the gridpoint request is made.
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+        start_date: Optional first date to keep (YYYY-MM-DD)
+        end_date: Optional last date to keep (YYYY-MM-DD)
+        base_temp: Base temperature (°F), or a sequence of base
+                   temperatures for a MultiBaseDegreeDays result
+        columnar: Return a DegreeDaysArray instead of a list
+        method: Degree day method (see gridpoint_to_degree_days)
+
+    Raises:
+        InvalidCoordinatesError: If coordinates are invalid
+        NWSAPIError: If there's an API error
+    """
+    validate_method(method)
+    point = get_point_properties(lat, lon)
+    if not point.get("forecastGridData"):
+        raise NWSAPIError(f"No forecast grid data for {lat}, {lon}")
+    results = gridpoint_to_degree_days(
+        get_gridpoint_data(point["forecastGridData"]), base_temp, point.get("timeZone"), method
+    ).select(start_date, end_date)
+    if columnar or isinstance(results, MultiBaseDegreeDays):
+        return results
+    return results.to_list()
+
+
+def fetch_gridpoint_degree_days_many(
+    locations: Union[Mapping[Hashable, Tuple[float, float]], Iterable[Tuple[float, float]]],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    base_temp: Union[float, Sequence[float]] = 65.0,
+    method: str = "mean",
+    workers: int = DEFAULT_WORKERS,
+    columnar: bool = False
+) -> Tuple[Dict[Hashable, Any], Dict[Hashable, Exception]]:
+    """
+    Fetch gridpoint degree days for many locations, one download per grid cell.
+
+    Locations are resolved to their forecast grid cells (memoized point
+    lookups), grouped, and every distinct cell is downloaded and converted
+    once; sites in the same cell and time zone share the result. Columnar
+    results are the same object for every site in a cell, so copy one
+    before modifying it in place.
+
+    Args:
+        locations: Sequence of (lat, lon) pairs, or a mapping of
+                   site id → (lat, lon). Result keys are the list index or
+                   the mapping key.
+        start_date: Optional first date to keep (YYYY-MM-DD)
+        end_date: Optional last date to keep (YYYY-MM-DD)
+        base_temp: Base temperature (°F), or a sequence of base
+                   temperatures; each result is then a MultiBaseDegreeDays
+                   whatever `columnar` is.
+        method: Degree day method (see gridpoint_to_degree_days)
+        workers: Number of concurrent requests.
+        columnar: Return DegreeDaysArray results instead of lists.
+
+    Returns:
+        (results, errors): dicts keyed like `locations`.
+    """
+    validate_method(method)
+    multi_base = np.ndim(base_temp) > 0
+    items = locations.items() if isinstance(locations, Mapping) else enumerate(locations)
+    sites = [(key, lat, lon) for key, (lat, lon) in items]
+    results: Dict[Hashable, Any] = {}
+    errors: Dict[Hashable, Exception] = {}
+
+    def resolve(site):
+        key, lat, lon = site
+        try:
+            return key, get_point_properties(lat, lon), None
+        except LOCATION_ERRORS as e:
+            return key, None, e
+
+    def convert(cell):
+        grid_url, time_zone = cell
+        try:
+            data = get_gridpoint_data(grid_url)
+            return gridpoint_to_degree_days(data, base_temp, time_zone, method).select(start_date, end_date), None
+        except LOCATION_ERRORS as e:
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        cells: Dict[Tuple[str, Optional[str]], List[Hashable]] = {}
+        for key, point, error in executor.map(resolve, sites):
+            if error is not None:
+                errors[key] = error
+            elif not point.get("forecastGridData"):
+                errors[key] = NWSAPIError("No forecast grid data for this location")
+            else:
+                cells.setdefault((point["forecastGridData"], point.get("timeZone")), []).append(key)
+        instrumentation.increment("nws.gridpoints.cells", len(cells))
+
+        for (cell, keys), (degree_days, error) in zip(cells.items(), executor.map(convert, cells)):
+            for key in keys:
+                if error is not None:
+                    errors[key] = error
+                else:
+                    results[key] = degree_days if columnar or multi_base else degree_days.to_list()
+    return results, errors
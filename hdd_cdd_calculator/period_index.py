@@ -0,0 +1,149 @@
+# hdd_cdd_calculator/period_index.py
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from .results import DegreeDaysLike, MultiBaseDegreeDays, as_degree_days_array
+
+DEGREE_DAY_COLUMNS = ("hdd", "cdd")
+
+
+class PeriodTotals(NamedTuple):
+    """Degree day totals for a batch of date ranges."""
+    hdd: np.ndarray            # (periods, *columns)
+    cdd: np.ndarray            # (periods, *columns)
+    days: np.ndarray           # calendar days in each period
+    missing_days: np.ndarray   # (periods, *columns) days without a value
+
+    @property
+    def complete(self) -> np.ndarray:
+        """True where every day of the period has a value."""
+        return self.missing_days == 0
+
+
+class DegreeDayIndex:
+    """
+    Prefix-sum index over daily degree days.
+
+    Daily HDD/CDD are laid out on a contiguous calendar from the first to
+    the last date and accumulated once, so the total over any inclusive
+    date range is the difference of two cumulative sums found by integer
+    offset: O(1) per range regardless of its length, and vectorized over
+    arrays of ranges (e.g. every bill of a meter). Days that are absent or
+    NaN contribute nothing and are reported as missing.
+
+    The degree day columns may carry trailing axes (base temperatures,
+    sites, or both); totals keep them.
+    """
+
+    __slots__ = ("start", "end", "base_temps", "_cumulative", "_cumulative_count")
+
+    def __init__(self, dates, hdd, cdd, base_temps: Optional[Sequence[float]] = None):
+        """
+        Args:
+            dates: Dates as ``datetime64`` values or YYYY-MM-DD strings (any order).
+            hdd: Heating degree days, shape (days,) or (days, ...).
+            cdd: Cooling degree days with the same shape as `hdd`.
+            base_temps: Optional base temperatures labelling the second axis.
+        """
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        hdd = np.asarray(hdd, dtype=np.float64)
+        cdd = np.asarray(cdd, dtype=np.float64)
+        if hdd.shape != cdd.shape or hdd.shape[:1] != dates.shape:
+            raise ValueError("hdd and cdd must have the same shape with one row per date.")
+        if len(np.unique(dates)) != len(dates):
+            raise ValueError("dates must be unique.")
+        self.base_temps = None if base_temps is None else np.atleast_1d(np.asarray(base_temps, dtype=np.float64))
+
+        if not len(dates):
+            self.start = self.end = None
+            self._cumulative = np.zeros((2, 1) + hdd.shape[1:])
+            self._cumulative_count = np.zeros((1,) + hdd.shape[1:], dtype=np.int64)
+            return
+
+        self.start, self.end = dates.min(), dates.max()
+        offsets = (dates - self.start).astype(np.int64)
+        n_days = int(offsets.max()) + 1
+
+        # Dense calendar; row 0 of each cumulative sum is the empty prefix
+        values = np.zeros((2, n_days + 1) + hdd.shape[1:])
+        present = np.zeros((n_days + 1,) + hdd.shape[1:], dtype=np.int64)
+        valid = ~(np.isnan(hdd) | np.isnan(cdd))
+        values[0, offsets + 1] = np.where(valid, hdd, 0.0)
+        values[1, offsets + 1] = np.where(valid, cdd, 0.0)
+        present[offsets + 1] = valid
+        self._cumulative = np.cumsum(values, axis=1)
+        self._cumulative_count = np.cumsum(present, axis=0)
+
+    @classmethod
+    def from_degree_days(
+        cls, degree_days: Union[DegreeDaysLike, MultiBaseDegreeDays]
+    ) -> "DegreeDayIndex":
+        """Build an index from a list of DegreeDaysResult, a DegreeDaysArray or a MultiBaseDegreeDays."""
+        if isinstance(degree_days, MultiBaseDegreeDays):
+            return cls(degree_days.dates, degree_days.hdd, degree_days.cdd, degree_days.base_temps)
+        array = as_degree_days_array(degree_days)
+        return cls(array.dates, array.hdd, array.cdd)
+
+    def __len__(self) -> int:
+        """Number of calendar days covered (including gaps)."""
+        return self._cumulative.shape[1] - 1
+
+    def __repr__(self) -> str:
+        if self.start is None:
+            return "DegreeDayIndex(empty)"
+        return f"DegreeDayIndex({self.start} to {self.end}, shape {self._cumulative.shape[2:]})"
+
+    def _offsets(self, dates) -> np.ndarray:
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        # An empty index covers no days, so any origin gives correct lengths
+        origin = np.datetime64(0, "D") if self.start is None else self.start
+        return (dates - origin).astype(np.int64)
+
+    def totals(self, start_dates, end_dates) -> PeriodTotals:
+        """
+        Sum HDD and CDD over many inclusive date ranges at once.
+
+        Args:
+            start_dates: First day of each period.
+            end_dates: Last day of each period (inclusive).
+
+        Returns:
+            PeriodTotals with one row per period. Days outside the indexed
+            range count as missing.
+
+        Raises:
+            ValueError: If a period ends before it starts.
+        """
+        lo = np.atleast_1d(self._offsets(start_dates))
+        hi = np.atleast_1d(self._offsets(end_dates)) + 1
+        if lo.shape != hi.shape:
+            raise ValueError("start_dates and end_dates must have the same length.")
+        days = hi - lo
+        if np.any(days < 1):
+            raise ValueError("Every period must end on or after its start date.")
+
+        n_days = len(self)
+        lo_clipped = np.clip(lo, 0, n_days)
+        hi_clipped = np.clip(hi, 0, n_days)
+        sums = self._cumulative[:, hi_clipped] - self._cumulative[:, lo_clipped]
+        counts = self._cumulative_count[hi_clipped] - self._cumulative_count[lo_clipped]
+        trailing = (slice(None),) + (None,) * (counts.ndim - 1)
+        return PeriodTotals(
+            hdd=sums[0],
+            cdd=sums[1],
+            days=days,
+            missing_days=days[trailing] - counts,
+        )
+
+    def total(self, start_date, end_date, column: str = "hdd") -> Union[float, np.ndarray]:
+        """
+        Total `column` ("hdd" or "cdd") between two dates (inclusive).
+
+        Returns a float, or an array over the trailing axes (e.g. one total
+        per base temperature).
+        """
+        if column not in DEGREE_DAY_COLUMNS:
+            raise ValueError("column must be 'hdd' or 'cdd'")
+        value = getattr(self.totals([start_date], [end_date]), column)[0]
+        return float(value) if np.ndim(value) == 0 else value
@@ -0,0 +1,276 @@
+# hdd_cdd_calculator/portfolio.py
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, TextIO, Union
+
+import numpy as np
+import pandas as pd
+
+from .cache import WeatherCache
+from .config import DEFAULT_PORTFOLIO_WORKERS
+from .data_sources import get_degree_days
+from .dataset import EnergyDataset
+from . import instrumentation
+from .regression import perform_regression_batch
+
+MANIFEST_COLUMNS = ("site_id", "lat", "lon", "meter_csv")
+OUTPUT_COLUMNS = (
+    "site_id", "lat", "lon", "source", "degree_day_type", "base_temp",
+    "start_date", "end_date", "n", "slope", "intercept", "r2", "rmse", "cv_rmse",
+)
+
+
+class PortfolioSummary(NamedTuple):
+    """Outcome of a portfolio run."""
+    total: int
+    completed: int
+    skipped: int
+    failed: int
+    elapsed: float
+    errors: Dict[str, str]
+
+    @property
+    def sites_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _parse_base_temps(value, default: Sequence[float]) -> List[float]:
+    if value is None or (isinstance(value, float) and np.isnan(value)) or str(value).strip() == "":
+        return list(default)
+    return [float(v) for v in str(value).replace(",", ";").split(";") if v.strip()]
+
+
+def read_manifest(manifest: Union[str, Path]) -> pd.DataFrame:
+    """
+    Read a portfolio manifest CSV.
+
+    Required columns are site_id, lat, lon and meter_csv (resolved relative
+    to the manifest). Optional columns: source, base_temps (e.g. "60;65"),
+    start_date, end_date, energy_column and degree_day_type.
+
+    Raises:
+        ValueError: If a required column is missing or site ids repeat.
+    """
+    manifest = Path(manifest)
+    df = pd.read_csv(manifest, dtype={"site_id": str, "meter_csv": str})
+    missing = [c for c in MANIFEST_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Manifest is missing required column(s) {missing}.")
+    if df["site_id"].duplicated().any():
+        raise ValueError("Manifest site_id values must be unique.")
+    df["meter_csv"] = [
+        str(path if Path(path).is_absolute() else manifest.parent / path)
+        for path in df["meter_csv"]
+    ]
+    return df
+
+
+def _optional(row: Dict[str, Any], column: str, default):
+    value = row.get(column)
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return default
+    return value
+
+
+@instrumentation.timed("portfolio.site")
+def process_site(
+    row: Dict[str, Any],
+    source: str = "meteostat",
+    base_temps: Sequence[float] = (65.0,),
+    cache: Optional[WeatherCache] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run the full workflow for one manifest row.
+
+    Reads the meter CSV, fetches degree days for its date range (all base
+    temperatures from one fetch), aligns them by date and fits one
+    regression per base temperature.
+
+    Returns:
+        One output record per base temperature.
+    """
+    energy_column = _optional(row, "energy_column", "kwh")
+    degree_day_type = _optional(row, "degree_day_type", "hdd")
+    if degree_day_type not in ("hdd", "cdd"):
+        raise ValueError("degree_day_type must be 'hdd' or 'cdd'")
+    source = _optional(row, "source", source)
+    bases = _parse_base_temps(row.get("base_temps"), base_temps)
+
+    dataset = EnergyDataset.from_csv(row["meter_csv"], columns=[energy_column])
+    if not len(dataset):
+        raise ValueError(f"No energy data in {row['meter_csv']}")
+    start_date = str(_optional(row, "start_date", dataset.dates[0]))
+    end_date = str(_optional(row, "end_date", dataset.dates[-1]))
+
+    degree_days = get_degree_days(
+        float(row["lat"]), float(row["lon"]), start_date, end_date,
+        source=source, base_temp=bases, cache=cache,
+    )
+    aligned = dataset.align(degree_days, energy_column)
+
+    x = getattr(aligned, degree_day_type).T
+    fit = perform_regression_batch(x, np.broadcast_to(aligned.energy, x.shape))
+    return [
+        {
+            "site_id": str(row["site_id"]),
+            "lat": float(row["lat"]),
+            "lon": float(row["lon"]),
+            "source": source,
+            "degree_day_type": degree_day_type,
+            "base_temp": float(base),
+            "start_date": start_date,
+            "end_date": end_date,
+            "n": int(fit.n[j]),
+            "slope": float(fit.slopes[j]),
+            "intercept": float(fit.intercepts[j]),
+            "r2": float(fit.r2[j]),
+            "rmse": float(fit.rmse[j]),
+            "cv_rmse": float(fit.cv_rmse[j]),
+        }
+        for j, base in enumerate(bases)
+    ]
+
+
+def _load_checkpoint(path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the records of sites that completed in a previous run."""
+    done: Dict[str, List[Dict[str, Any]]] = {}
+    if not path.exists():
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partial line from an interrupted run
+            if entry.get("status") == "ok":
+                done[entry["site_id"]] = entry["records"]
+    return done
+
+
+def _check_output(output: Union[str, Path]) -> None:
+    """Fail before any site is processed if the output cannot be written."""
+    suffix = Path(output).suffix
+    if suffix not in (".parquet", ".csv"):
+        raise ValueError("Output file must end in .parquet or .csv")
+    if suffix == ".parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow: pip install hdd-cdd-calculator[parquet]") from None
+
+
+def write_results(records: List[Dict[str, Any]], output: Union[str, Path]) -> None:
+    """
+    Write output records as a columnar file chosen by extension.
+
+    ".parquet" requires pyarrow; ".csv" is written with pandas.
+    """
+    _check_output(output)
+    df = pd.DataFrame.from_records(records, columns=list(OUTPUT_COLUMNS))
+    if Path(output).suffix == ".parquet":
+        df.to_parquet(output, index=False)
+    else:
+        df.to_csv(output, index=False)
+
+
+def run_portfolio(
+    manifest: Union[str, Path],
+    output: Union[str, Path],
+    workers: int = DEFAULT_PORTFOLIO_WORKERS,
+    cache_dir: Optional[Union[str, Path]] = None,
+    checkpoint: Optional[Union[str, Path]] = None,
+    resume: bool = False,
+    source: str = "meteostat",
+    base_temps: Sequence[float] = (65.0,),
+    progress: Optional[TextIO] = sys.stderr,
+    progress_every: int = 100
+) -> PortfolioSummary:
+    """
+    Fit degree day regressions for every site in a manifest.
+
+    Sites run concurrently on `workers` threads (the work is dominated by
+    weather API requests). Each finished site is appended to a JSON-lines
+    checkpoint, so with `resume` a rerun skips the sites that already
+    completed and only retries the failed or missing ones. Any exception
+    raised for a site (API errors, a bad manifest row, an unreadable meter
+    file, an unexpected response) is recorded in the summary's `errors`
+    as "ExceptionType: message" and the run continues. Results for every
+    completed site are written to `output`.
+
+    Args:
+        manifest: Manifest CSV (see read_manifest).
+        output: Output file (.parquet or .csv).
+        workers: Number of sites processed at the same time.
+        cache_dir: Optional WeatherCache directory shared by every site.
+        checkpoint: Checkpoint path (defaults to "<output>.checkpoint.jsonl").
+        resume: Continue from an existing checkpoint instead of starting over.
+        source: Default weather source for rows without one.
+        base_temps: Default base temperatures for rows without base_temps.
+        progress: Stream for progress lines, or None for silence.
+        progress_every: Report progress after this many finished sites.
+
+    Returns:
+        PortfolioSummary with counts, elapsed time and per-site errors.
+    """
+    started = time.monotonic()
+    _check_output(output)
+    sites = read_manifest(manifest)
+    checkpoint = Path(checkpoint) if checkpoint is not None else Path(f"{output}.checkpoint.jsonl")
+    if not resume and checkpoint.exists():
+        os.remove(checkpoint)
+    done = _load_checkpoint(checkpoint)
+    cache = WeatherCache(cache_dir) if cache_dir is not None else None
+
+    rows = [row for row in sites.to_dict("records") if str(row["site_id"]) not in done]
+    errors: Dict[str, str] = {}
+    finished = 0
+
+    def report():
+        elapsed = time.monotonic() - started
+        rate = finished / elapsed if elapsed > 0 else 0.0
+        print(
+            f"[{finished}/{len(rows)}] {len(errors)} failed, {elapsed:.1f}s elapsed, {rate:.1f} sites/s",
+            file=progress,
+        )
+
+    with open(checkpoint, "a") as log, ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = {
+            executor.submit(process_site, row, source, base_temps, cache): str(row["site_id"])
+            for row in rows
+        }
+        for future in as_completed(futures):
+            site_id = futures[future]
+            try:
+                records = future.result()
+            except Exception as e:
+                errors[site_id] = f"{type(e).__name__}: {e}"
+                entry = {"site_id": site_id, "status": "error", "error": errors[site_id]}
+            else:
+                done[site_id] = records
+                entry = {"site_id": site_id, "status": "ok", "records": records}
+            log.write(json.dumps(entry) + "\n")
+            log.flush()
+
+            finished += 1
+            if progress is not None and finished % progress_every == 0:
+                report()
+
+    # Output follows manifest order regardless of completion order
+    write_results(
+        [record for site_id in sites["site_id"] if site_id in done for record in done[site_id]],
+        output,
+    )
+    if progress is not None:
+        report()
+    return PortfolioSummary(
+        total=len(sites),
+        completed=len(rows) - len(errors),
+        skipped=len(sites) - len(rows),
+        failed=len(errors),
+        elapsed=time.monotonic() - started,
+        errors=errors,
+    )
@@ -1,7 +1,10 @@
 # hdd_cdd_calculator/regression.py
 from sklearn.linear_model import LinearRegression
+import numpy as np
 import pandas as pd
-from typing import Union
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
+
+from . import instrumentation
 
 def perform_regression(
     degree_days: Union[pd.Series, list],
@@ -17,8 +20,359 @@ def perform_regression(
     Returns:
         Trained LinearRegression model
     """
-    model = LinearRegression()
-    X = pd.Series(degree_days).values.reshape(-1, 1)
-    y = pd.Series(energy_data).values
-    model.fit(X, y)
+    with instrumentation.stage("regression.fit") as stage:
+        model = LinearRegression()
+        X = pd.Series(degree_days).values.reshape(-1, 1)
+        y = pd.Series(energy_data).values
+        model.fit(X, y)
+        stage.rows = len(y)
     return model
+
+
+class LinearModel(NamedTuple):
+    """
+    Lightweight fitted linear model with a scikit-learn style interface.
+
+    Exposes `coef_`, `intercept_` and `predict()`, so it can be passed
+    anywhere a fitted `LinearRegression` is expected (e.g. plot_regression).
+    """
+    coef_: np.ndarray
+    intercept_: float
+
+    def predict(self, X: Union[np.ndarray, list]) -> np.ndarray:
+        """Predict energy for degree day values of shape (n,) or (n, 1)."""
+        X = np.asarray(X, dtype=np.float64)
+        return X.reshape(len(X), -1) @ self.coef_ + self.intercept_
+
+
+class BatchRegressionResult(NamedTuple):
+    """
+    Per-meter statistics from perform_regression_batch (one entry per meter).
+
+    RMSE and CV(RMSE) both use n - 2 degrees of freedom (n observations
+    minus the two fitted parameters), as in ASHRAE Guideline 14 and
+    fit_change_point_model, so cv_rmse == rmse / mean(energy).
+    """
+    slopes: np.ndarray
+    intercepts: np.ndarray
+    r2: np.ndarray
+    rmse: np.ndarray
+    cv_rmse: np.ndarray
+    n: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.slopes)
+
+    def model(self, i: int) -> LinearModel:
+        """Return meter `i` as a LinearModel."""
+        return LinearModel(np.array([self.slopes[i]]), float(self.intercepts[i]))
+
+
+@instrumentation.timed("regression.batch")
+def perform_regression_batch(
+    degree_days: Union[np.ndarray, list],
+    energy_data: Union[np.ndarray, list]
+) -> BatchRegressionResult:
+    """
+    Fit energy = intercept + slope * degree_days for many meters at once.
+
+    All meters are solved together with vectorized closed-form least squares;
+    no per-meter model objects are created. Missing readings (NaN in either
+    input) are excluded per meter.
+
+    Parameters:
+        degree_days: HDD or CDD values, shape (days,) shared by every meter
+                     or (meters, days)
+        energy_data: Energy consumption, shape (meters, days) with NaN for
+                     missing readings
+
+    Returns:
+        BatchRegressionResult with slopes, intercepts, R², RMSE, CV(RMSE) and
+        the number of observations for each meter. Meters with fewer than
+        two observations or constant degree days get NaN statistics.
+    """
+    y = np.atleast_2d(np.asarray(energy_data, dtype=np.float64))
+    x = np.broadcast_to(np.asarray(degree_days, dtype=np.float64), y.shape)
+
+    mask = ~(np.isnan(x) | np.isnan(y))
+    x0 = np.where(mask, x, 0.0)
+    y0 = np.where(mask, y, 0.0)
+    n = mask.sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = x0.sum(axis=1) / n
+        y_mean = y0.sum(axis=1) / n
+        dx = np.where(mask, x - x_mean[:, None], 0.0)
+        dy = np.where(mask, y - y_mean[:, None], 0.0)
+        sxx = np.einsum("ij,ij->i", dx, dx)
+        sxy = np.einsum("ij,ij->i", dx, dy)
+        syy = np.einsum("ij,ij->i", dy, dy)
+
+        slopes = sxy / sxx
+        intercepts = y_mean - slopes * x_mean
+        sse = np.maximum(syy - slopes * sxy, 0.0)
+        r2 = 1.0 - sse / syy
+        rmse = np.sqrt(sse / np.maximum(n - 2, 1))
+        cv_rmse = rmse / y_mean
+
+    invalid = (n < 2) | (sxx == 0)
+    for stat in (slopes, intercepts, r2, rmse, cv_rmse):
+        stat[invalid] = np.nan
+    return BatchRegressionResult(slopes, intercepts, r2, rmse, cv_rmse, n)
+
+
+CHANGE_POINT_MODELS = ("2P", "3PH", "3PC", "4P", "5P")
+_N_PARAMS = {"2P": 2, "3PH": 3, "3PC": 3, "4P": 4, "5P": 5}
+
+
+class ChangePointModel(NamedTuple):
+    """
+    Change-point (PRISM / ASHRAE Guideline 14 style) energy model.
+
+    energy = intercept
+             + heating_slope * max(heating_base - T, 0)
+             + cooling_slope * max(T - cooling_base, 0)
+
+    For the 2P model the single slope is applied to T itself and is stored
+    in `cooling_slope` with no bases; it is unconstrained, so a
+    heating-dominated site gets a negative value.
+    """
+    model_type: str
+    intercept: float
+    heating_slope: float
+    cooling_slope: float
+    heating_base: Optional[float]
+    cooling_base: Optional[float]
+    r2: float
+    cv_rmse: float
+    nmbe: float
+    n: int
+
+    def predict(self, mean_temps: Union[pd.Series, list, np.ndarray]) -> np.ndarray:
+        """Predict energy use for daily mean temperatures."""
+        t = np.asarray(mean_temps, dtype=np.float64)
+        if self.model_type == "2P":
+            return self.intercept + self.cooling_slope * t
+        y = np.full(t.shape, self.intercept)
+        if self.heating_base is not None:
+            y = y + self.heating_slope * np.maximum(self.heating_base - t, 0.0)
+        if self.cooling_base is not None:
+            y = y + self.cooling_slope * np.maximum(t - self.cooling_base, 0.0)
+        return y
+
+
+class _Sums(NamedTuple):
+    """Uncentered sums of a regressor over every candidate base."""
+    sx: np.ndarray
+    sxx: np.ndarray
+    sxy: np.ndarray
+    count: np.ndarray  # points on the active side of the base
+
+
+def _prefix_sums(t_sorted: np.ndarray, y_sorted: np.ndarray) -> Tuple[np.ndarray, ...]:
+    zero = np.zeros(1)
+    return (
+        np.concatenate([zero, np.cumsum(t_sorted)]),
+        np.concatenate([zero, np.cumsum(t_sorted ** 2)]),
+        np.concatenate([zero, np.cumsum(y_sorted)]),
+        np.concatenate([zero, np.cumsum(t_sorted * y_sorted)]),
+    )
+
+
+def _heating_sums(t_sorted, prefix, bases) -> _Sums:
+    """Sums of x = max(base - T, 0) for each base, from prefix sums over T < base."""
+    s1, s2, sy, sty = prefix
+    k = np.searchsorted(t_sorted, bases, side="left")
+    return _Sums(
+        sx=k * bases - s1[k],
+        sxx=k * bases ** 2 - 2 * bases * s1[k] + s2[k],
+        sxy=bases * sy[k] - sty[k],
+        count=k,
+    )
+
+
+def _cooling_sums(t_sorted, prefix, bases) -> _Sums:
+    """Sums of x = max(T - base, 0) for each base, from suffix sums over T > base."""
+    s1, s2, sy, sty = prefix
+    n = len(t_sorted)
+    m = np.searchsorted(t_sorted, bases, side="right")
+    count = n - m
+    c1, c2, cy, cty = s1[n] - s1[m], s2[n] - s2[m], sy[n] - sy[m], sty[n] - sty[m]
+    return _Sums(
+        sx=c1 - count * bases,
+        sxx=c2 - 2 * bases * c1 + count * bases ** 2,
+        sxy=cty - bases * cy,
+        count=count,
+    )
+
+
+def _one_regressor_fit(sums: _Sums, n: int, sum_y: float, syy_c: float):
+    """Closed-form OLS for y = b0 + b1 x; returns (b0, b1, sse) arrays."""
+    sxx_c = sums.sxx - sums.sx ** 2 / n
+    sxy_c = sums.sxy - sums.sx * sum_y / n
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = sxy_c / sxx_c
+    intercept = (sum_y - slope * sums.sx) / n
+    sse = syy_c - slope * sxy_c
+    return intercept, slope, sse
+
+
+def _two_regressor_fit(h: _Sums, c: _Sums, n: int, sum_y: float, syy_c: float):
+    """
+    Closed-form OLS for y = b0 + bh xh + bc xc over a grid of (h, c) bases.
+
+    Heating and cooling regressors are never both non-zero when the heating
+    base is at or below the cooling base, so their raw cross product is 0.
+    """
+    hx, hxx, hxy = h.sx[:, None], h.sxx[:, None], h.sxy[:, None]
+    cx, cxx, cxy = c.sx[None, :], c.sxx[None, :], c.sxy[None, :]
+    shh = hxx - hx ** 2 / n
+    scc = cxx - cx ** 2 / n
+    shc = -hx * cx / n
+    shy = hxy - hx * sum_y / n
+    scy = cxy - cx * sum_y / n
+    det = shh * scc - shc ** 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        bh = (scc * shy - shc * scy) / det
+        bc = (shh * scy - shc * shy) / det
+    intercept = (sum_y - bh * hx - bc * cx) / n
+    sse = syy_c - bh * shy - bc * scy
+    return intercept, bh, bc, sse
+
+
+def _default_bases(t: np.ndarray) -> np.ndarray:
+    lo, hi = np.percentile(t, [10, 90])
+    return np.arange(np.floor(lo), np.ceil(hi) + 1.0, 1.0)
+
+
+@instrumentation.timed("regression.change_point")
+def fit_change_point_model(
+    mean_temps: Union[pd.Series, list, np.ndarray],
+    energy_data: Union[pd.Series, list, np.ndarray],
+    bases: Optional[Union[list, np.ndarray]] = None,
+    models: Sequence[str] = CHANGE_POINT_MODELS,
+    min_points: int = 3
+) -> ChangePointModel:
+    """
+    Search change-point models and balance temperatures for the best fit.
+
+    Every candidate base temperature (and, for 5P, every heating/cooling
+    base pair) is evaluated with closed-form least squares computed from
+    cumulative sums over the temperature-sorted data, so the whole search
+    costs one O(n log n) sort plus O(1) work per candidate.
+
+    Supported models:
+        2P:  energy = b0 + b1 * T
+        3PH: heating only, energy = b0 + bh * HDD(base)
+        3PC: cooling only, energy = b0 + bc * CDD(base)
+        4P:  heating and cooling slopes around one shared base
+        5P:  separate heating and cooling bases with a flat band between
+
+    Candidates with a negative heating/cooling slope or fewer than
+    `min_points` days on the active side of a base are rejected. The model
+    with the lowest CV(RMSE) is returned.
+
+    Args:
+        mean_temps: Daily mean temperatures (°F), aligned with `energy_data`.
+        energy_data: Energy consumption values.
+        bases: Candidate base temperatures (defaults to 1°F steps between the
+               10th and 90th percentile of `mean_temps`).
+        models: Model types to consider.
+        min_points: Minimum days on each side of a change point.
+
+    Returns:
+        The best ChangePointModel with its R², CV(RMSE) and NMBE.
+
+    Raises:
+        ValueError: If the inputs are misaligned, an unknown model is given,
+                    or no candidate model can be fitted.
+    """
+    t = np.asarray(mean_temps, dtype=np.float64)
+    y = np.asarray(energy_data, dtype=np.float64)
+    if t.shape != y.shape:
+        raise ValueError("mean_temps and energy_data must have the same length.")
+    unknown = set(models) - set(CHANGE_POINT_MODELS)
+    if unknown:
+        raise ValueError(f"Unknown model type(s) {sorted(unknown)}. Choose from {CHANGE_POINT_MODELS}")
+
+    keep = ~(np.isnan(t) | np.isnan(y))
+    t, y = t[keep], y[keep]
+    n = len(t)
+    if n < 3:
+        raise ValueError("At least 3 complete observations are required.")
+
+    # Centering energy keeps the running sums well conditioned for large meters
+    y_mean = float(np.mean(y))
+    order = np.argsort(t, kind="stable")
+    t_sorted, y_sorted = t[order], y[order] - y_mean
+    prefix = _prefix_sums(t_sorted, y_sorted)
+    bases = _default_bases(t) if bases is None else np.asarray(bases, dtype=np.float64)
+
+    sum_y = 0.0
+    syy_c = float(np.sum(y_sorted ** 2))
+
+    # (sse, model_type, intercept, heating_slope, cooling_slope, heating_base, cooling_base)
+    candidates = []
+
+    def best_of(model_type, sse, valid, build):
+        sse = np.where(valid, sse, np.inf)
+        if not np.isfinite(sse).any():
+            return
+        idx = np.unravel_index(np.argmin(sse), sse.shape)
+        candidates.append((float(sse[idx]), model_type) + build(idx))
+
+    if "2P" in models:
+        sx, sxx, sxy = prefix[0][-1], prefix[1][-1], prefix[3][-1]
+        sums = _Sums(np.array([sx]), np.array([sxx]), np.array([sxy]), np.array([n]))
+        b0, b1, sse = _one_regressor_fit(sums, n, sum_y, syy_c)
+        best_of("2P", sse, np.isfinite(b1), lambda i: (b0[i], 0.0, b1[i], None, None))
+
+    heating = _heating_sums(t_sorted, prefix, bases)
+    cooling = _cooling_sums(t_sorted, prefix, bases)
+    heating_ok = (heating.count >= min_points) & (n - heating.count >= min_points)
+    cooling_ok = (cooling.count >= min_points) & (n - cooling.count >= min_points)
+
+    if "3PH" in models:
+        b0, bh, sse = _one_regressor_fit(heating, n, sum_y, syy_c)
+        best_of("3PH", sse, heating_ok & (bh >= 0),
+                lambda i: (b0[i], bh[i], 0.0, bases[i[0]], None))
+
+    if "3PC" in models:
+        b0, bc, sse = _one_regressor_fit(cooling, n, sum_y, syy_c)
+        best_of("3PC", sse, cooling_ok & (bc >= 0),
+                lambda i: (b0[i], 0.0, bc[i], None, bases[i[0]]))
+
+    if "4P" in models or "5P" in models:
+        b0, bh, bc, sse = _two_regressor_fit(heating, cooling, n, sum_y, syy_c)
+        valid = heating_ok[:, None] & cooling_ok[None, :] & (bh >= 0) & (bc >= 0)
+
+        def pair(i):
+            return b0[i], bh[i], bc[i], bases[i[0]], bases[i[1]]
+
+        if "4P" in models:
+            best_of("4P", sse, valid & np.eye(len(bases), dtype=bool), pair)
+        if "5P" in models:
+            best_of("5P", sse, valid & np.triu(np.ones((len(bases),) * 2, dtype=bool), k=1), pair)
+
+    if not candidates:
+        raise ValueError("No change-point model could be fitted to the data.")
+
+    def cv_rmse(candidate):
+        p = _N_PARAMS[candidate[1]]
+        return np.sqrt(max(candidate[0], 0.0) / max(n - p, 1))
+
+    sse, model_type, b0, bh, bc, hb, cb = min(candidates, key=cv_rmse)
+
+    model = ChangePointModel(
+        model_type, float(b0) + y_mean, float(bh), float(bc),
+        None if hb is None else float(hb), None if cb is None else float(cb),
+        r2=np.nan, cv_rmse=np.nan, nmbe=np.nan, n=n,
+    )
+    residuals = y - model.predict(t)
+    p = _N_PARAMS[model_type]
+    sse = float(np.sum(residuals ** 2))
+    return model._replace(
+        r2=1.0 - sse / syy_c if syy_c > 0 else np.nan,
+        cv_rmse=float(np.sqrt(sse / max(n - p, 1)) / y_mean),
+        nmbe=float(np.sum(residuals) / (max(n - p, 1) * y_mean)),
+    )
@@ -0,0 +1,316 @@
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from .utils import (
+    calculate_degree_days_array,
+    calculate_degree_days_matrix,
+    celsius_to_fahrenheit,
+)
+
+
+class DegreeDaysResult(NamedTuple):
+    """Container for degree days calculation results."""
+    date: str
+    high_temp: float
+    low_temp: float
+    mean_temp: float
+    hdd: float
+    cdd: float
+
+
+COLUMNS = ("high_temp", "low_temp", "mean_temp", "hdd", "cdd")
+
+
+def _date_slice(dates: np.ndarray, start_date=None, end_date=None) -> slice:
+    """Binary-search the (sorted) dates for an inclusive date range."""
+    lo = 0 if start_date is None else int(np.searchsorted(
+        dates, np.datetime64(start_date, "D"), side="left"))
+    hi = len(dates) if end_date is None else int(np.searchsorted(
+        dates, np.datetime64(end_date, "D"), side="right"))
+    return slice(lo, hi)
+
+
+class DegreeDaysArray:
+    """
+    Columnar container for daily degree day results.
+
+    Every field of :class:`DegreeDaysResult` is held as one NumPy array:
+    `dates` as ``datetime64[D]`` and the temperature/degree day columns as
+    float arrays. Integer indexing returns a :class:`DegreeDaysResult`,
+    slicing and boolean/integer array indexing return a new
+    ``DegreeDaysArray``, and iteration yields ``DegreeDaysResult`` tuples so
+    the container is a drop-in replacement for the list-based results.
+    """
+
+    __slots__ = ("dates",) + COLUMNS
+
+    def __init__(
+        self,
+        dates,
+        high_temp,
+        low_temp,
+        hdd,
+        cdd,
+        mean_temp=None,
+        dtype=np.float64
+    ):
+        """
+        Args:
+            dates: Dates as ``datetime64`` values or YYYY-MM-DD strings.
+            high_temp: Daily high temperatures (°F).
+            low_temp: Daily low temperatures (°F).
+            hdd: Heating degree days.
+            cdd: Cooling degree days.
+            mean_temp: Daily mean temperatures; computed from highs/lows if omitted.
+            dtype: Float dtype for the numeric columns (float64 or float32).
+
+        Raises:
+            ValueError: If the columns do not all have the same length.
+        """
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.high_temp = np.asarray(high_temp, dtype=dtype)
+        self.low_temp = np.asarray(low_temp, dtype=dtype)
+        if mean_temp is None:
+            mean_temp = (self.high_temp + self.low_temp) / 2
+        self.mean_temp = np.asarray(mean_temp, dtype=dtype)
+        self.hdd = np.asarray(hdd, dtype=dtype)
+        self.cdd = np.asarray(cdd, dtype=dtype)
+
+        n = len(self.dates)
+        if any(len(getattr(self, name)) != n for name in COLUMNS):
+            raise ValueError("All degree day columns must have the same length.")
+
+    @classmethod
+    def from_temperatures(
+        cls,
+        dates,
+        high_temp,
+        low_temp,
+        base_temp: float = 65.0,
+        unit: str = "F",
+        dtype=np.float64,
+        method: str = "mean"
+    ) -> "DegreeDaysArray":
+        """
+        Build a result directly from daily highs and lows.
+
+        Temperatures are stored in °F; rows with missing or suspicious values
+        get NaN degree days (see :func:`calculate_degree_days_array`, which
+        also describes `method`).
+        """
+        high = np.asarray(high_temp, dtype=np.float64)
+        low = np.asarray(low_temp, dtype=np.float64)
+        if unit.upper() == "C":
+            high = celsius_to_fahrenheit(high)
+            low = celsius_to_fahrenheit(low)
+            base_temp = celsius_to_fahrenheit(np.asarray(base_temp, dtype=np.float64))
+        hdd, cdd = calculate_degree_days_array(high, low, base_temp, method=method)
+        return cls(dates, high, low, hdd, cdd, dtype=dtype)
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Sequence[DegreeDaysResult],
+        dtype=np.float64
+    ) -> "DegreeDaysArray":
+        """Build a columnar result from a sequence of DegreeDaysResult tuples."""
+        if isinstance(results, cls):
+            return results
+        if len(results) == 0:
+            return cls.empty(dtype=dtype)
+        dates, high, low, mean, hdd, cdd = zip(*results)
+        return cls(dates, high, low, hdd, cdd, mean_temp=mean, dtype=dtype)
+
+    @classmethod
+    def empty(cls, dtype=np.float64) -> "DegreeDaysArray":
+        """Return a result with no rows."""
+        none = np.empty(0, dtype=dtype)
+        return cls(np.empty(0, dtype="datetime64[D]"), none, none, none, none, none, dtype=dtype)
+
+    @classmethod
+    def concat(cls, parts: Sequence["DegreeDaysArray"]) -> "DegreeDaysArray":
+        """Concatenate several results into one (row order is preserved)."""
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.empty()
+        columns = {
+            name: np.concatenate([getattr(p, name) for p in parts])
+            for name in ("dates",) + COLUMNS
+        }
+        return cls(**columns, dtype=np.result_type(*(p.hdd.dtype for p in parts)))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, key) -> Union[DegreeDaysResult, "DegreeDaysArray"]:
+        if isinstance(key, (int, np.integer)):
+            return DegreeDaysResult(
+                str(self.dates[key]),
+                *(getattr(self, name)[key].item() for name in COLUMNS)
+            )
+        return DegreeDaysArray(
+            self.dates[key],
+            self.high_temp[key],
+            self.low_temp[key],
+            self.hdd[key],
+            self.cdd[key],
+            mean_temp=self.mean_temp[key],
+            dtype=self.hdd.dtype,
+        )
+
+    def __iter__(self) -> Iterator[DegreeDaysResult]:
+        date_strings = np.datetime_as_string(self.dates, unit="D").tolist()
+        columns = [getattr(self, name).tolist() for name in COLUMNS]
+        for row in zip(date_strings, *columns):
+            yield DegreeDaysResult(*row)
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "DegreeDaysArray(0 days)"
+        return f"DegreeDaysArray({len(self)} days, {self.dates[0]} to {self.dates[-1]})"
+
+    def select(self, start_date=None, end_date=None) -> "DegreeDaysArray":
+        """
+        Return the rows between `start_date` and `end_date` (inclusive).
+
+        Dates are assumed to be sorted, so this is a pair of binary searches
+        and returns views of the underlying arrays.
+        """
+        return self[_date_slice(self.dates, start_date, end_date)]
+
+    def to_list(self) -> List[DegreeDaysResult]:
+        """Return the rows as a list of DegreeDaysResult tuples."""
+        return list(self)
+
+    def to_numpy(self, column: Optional[str] = None) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Return the underlying arrays without copying.
+
+        Args:
+            column: Optional column name ("dates", "high_temp", "low_temp",
+                    "mean_temp", "hdd" or "cdd").
+
+        Returns:
+            The requested array, or a dict of all columns when `column` is None.
+        """
+        if column is not None:
+            if column not in self.__slots__:
+                raise ValueError(f"Unknown column '{column}'. Choose from {list(self.__slots__)}")
+            return getattr(self, column)
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_pandas(self):
+        """
+        Return a DataFrame with a `date` column followed by the numeric columns.
+
+        The numeric columns share memory with this container.
+        """
+        import pandas as pd
+
+        data = {"date": self.dates}
+        data.update((name, getattr(self, name)) for name in COLUMNS)
+        return pd.DataFrame(data, copy=False)
+
+
+class MultiBaseDegreeDays:
+    """
+    Daily degree days evaluated at several base temperatures.
+
+    Holds one temperature series (`dates`, `high_temp`, `low_temp`,
+    `mean_temp`) and `hdd`/`cdd` matrices of shape (days, bases), with one
+    column per entry of `base_temps`.
+    """
+
+    __slots__ = ("dates", "high_temp", "low_temp", "mean_temp", "base_temps", "hdd", "cdd")
+
+    def __init__(self, dates, high_temp, low_temp, base_temps, hdd, cdd, mean_temp=None):
+        """
+        Args:
+            dates: Dates as ``datetime64`` values or YYYY-MM-DD strings.
+            high_temp: Daily high temperatures (°F).
+            low_temp: Daily low temperatures (°F).
+            base_temps: Base temperatures (°F), one per matrix column.
+            hdd: Heating degree days, shape (days, bases).
+            cdd: Cooling degree days, shape (days, bases).
+            mean_temp: Daily mean temperatures; computed from highs/lows if omitted.
+        """
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.high_temp = np.asarray(high_temp, dtype=np.float64)
+        self.low_temp = np.asarray(low_temp, dtype=np.float64)
+        if mean_temp is None:
+            mean_temp = (self.high_temp + self.low_temp) / 2
+        self.mean_temp = np.asarray(mean_temp, dtype=np.float64)
+        self.base_temps = np.atleast_1d(np.asarray(base_temps, dtype=np.float64))
+        self.hdd = np.asarray(hdd, dtype=np.float64)
+        self.cdd = np.asarray(cdd, dtype=np.float64)
+
+        shape = (len(self.dates), len(self.base_temps))
+        if self.hdd.shape != shape or self.cdd.shape != shape:
+            raise ValueError(f"hdd and cdd must have shape {shape} (days, bases).")
+
+    @classmethod
+    def from_temperatures(
+        cls, dates, high_temp, low_temp, base_temps, method: str = "mean"
+    ) -> "MultiBaseDegreeDays":
+        """Compute the HDD/CDD matrices for daily highs and lows (°F) in one pass."""
+        hdd, cdd = calculate_degree_days_matrix(high_temp, low_temp, base_temps, method=method)
+        return cls(dates, high_temp, low_temp, base_temps, hdd, cdd)
+
+    @classmethod
+    def from_degree_days(cls, degree_days: "DegreeDaysLike", base_temps) -> "MultiBaseDegreeDays":
+        """Re-evaluate an existing single-base result at several base temperatures."""
+        array = as_degree_days_array(degree_days)
+        return cls.from_temperatures(array.dates, array.high_temp, array.low_temp, base_temps)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return f"MultiBaseDegreeDays({len(self)} days, {len(self.base_temps)} base temperatures)"
+
+    def _base_index(self, base_temp: float) -> int:
+        matches = np.flatnonzero(np.isclose(self.base_temps, base_temp))
+        if not len(matches):
+            raise KeyError(f"Base temperature {base_temp} not in {self.base_temps.tolist()}")
+        return int(matches[0])
+
+    def for_base(self, base_temp: float) -> DegreeDaysArray:
+        """Return the single-base DegreeDaysArray for one of `base_temps`."""
+        j = self._base_index(base_temp)
+        return DegreeDaysArray(
+            self.dates, self.high_temp, self.low_temp, self.hdd[:, j], self.cdd[:, j],
+            mean_temp=self.mean_temp,
+        )
+
+    def select(self, start_date=None, end_date=None) -> "MultiBaseDegreeDays":
+        """Return the rows between `start_date` and `end_date` (inclusive)."""
+        rows = _date_slice(self.dates, start_date, end_date)
+        return MultiBaseDegreeDays(
+            self.dates[rows], self.high_temp[rows], self.low_temp[rows],
+            self.base_temps, self.hdd[rows], self.cdd[rows], mean_temp=self.mean_temp[rows],
+        )
+
+    def to_pandas(self):
+        """Return a wide DataFrame with `hdd_<base>` and `cdd_<base>` columns."""
+        import pandas as pd
+
+        data = {
+            "date": self.dates,
+            "high_temp": self.high_temp,
+            "low_temp": self.low_temp,
+            "mean_temp": self.mean_temp,
+        }
+        for kind in ("hdd", "cdd"):
+            matrix = getattr(self, kind)
+            for j, base in enumerate(self.base_temps.tolist()):
+                data[f"{kind}_{base:g}"] = matrix[:, j]
+        return pd.DataFrame(data)
+
+
+DegreeDaysLike = Union[Sequence[DegreeDaysResult], DegreeDaysArray]
+
+
+def as_degree_days_array(degree_days: DegreeDaysLike) -> DegreeDaysArray:
+    """Return `degree_days` as a DegreeDaysArray, converting lists if needed."""
+    return DegreeDaysArray.from_results(degree_days)
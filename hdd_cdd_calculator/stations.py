@@ -0,0 +1,166 @@
+# hdd_cdd_calculator/stations.py
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+from meteostat import Stations
+from sklearn.neighbors import KDTree
+
+EARTH_RADIUS_KM = 6371.0
+DEFAULT_GRID_RESOLUTION = 0.05  # degrees, ~5 km
+DEFAULT_STATION_CACHE = Path.home() / ".cache" / "hdd_cdd_calculator" / "meteostat_stations.npz"
+
+
+def _to_unit_vectors(lats, lons) -> np.ndarray:
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def snap_to_grid(
+    lats: Union[float, Sequence[float]],
+    lons: Union[float, Sequence[float]],
+    resolution: float = DEFAULT_GRID_RESOLUTION
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Snap coordinates to the centers of a regular lat/lon grid.
+
+    Args:
+        lats: Latitudes
+        lons: Longitudes
+        resolution: Grid cell size in degrees.
+
+    Returns:
+        (lats, lons) of the grid cell centers, rounded to 4 decimals.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    snapped_lats = (np.floor(lats / resolution) + 0.5) * resolution
+    snapped_lons = (np.floor(lons / resolution) + 0.5) * resolution
+    return np.round(snapped_lats, 4), np.round(snapped_lons, 4)
+
+
+class StationIndex:
+    """
+    Nearest-station lookup over weather station coordinates.
+
+    Stations are indexed with a KD-tree over unit vectors on the sphere, so
+    nearest-neighbour queries use true great-circle distances without a
+    haversine metric. When the daily inventory (first and last day of
+    daily data) is known, :meth:`with_daily_data` narrows the index to the
+    stations that have data for a period.
+    """
+
+    def __init__(
+        self,
+        station_ids: Sequence[str],
+        lats: Sequence[float],
+        lons: Sequence[float],
+        daily_start: Optional[Sequence] = None,
+        daily_end: Optional[Sequence] = None
+    ):
+        """
+        Args:
+            station_ids: Station identifiers (e.g. Meteostat IDs).
+            lats: Station latitudes.
+            lons: Station longitudes.
+            daily_start: Optional first day of daily data per station
+                         (NaT for stations without daily data).
+            daily_end: Optional last day of daily data per station.
+        """
+        self.station_ids = np.asarray(station_ids, dtype=str)
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        if not (len(self.station_ids) == len(self.lats) == len(self.lons)):
+            raise ValueError("station_ids, lats and lons must have the same length.")
+        if (daily_start is None) != (daily_end is None):
+            raise ValueError("daily_start and daily_end must be given together.")
+        self.daily_start = None if daily_start is None else np.asarray(daily_start, dtype="datetime64[D]")
+        self.daily_end = None if daily_end is None else np.asarray(daily_end, dtype="datetime64[D]")
+        if self.daily_start is not None and not (len(self.daily_start) == len(self.daily_end) == len(self)):
+            raise ValueError("daily_start and daily_end must have one entry per station.")
+        self._tree = KDTree(_to_unit_vectors(self.lats, self.lons)) if len(self) else None
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    def query(
+        self,
+        lats: Union[float, Sequence[float]],
+        lons: Union[float, Sequence[float]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest station for each coordinate.
+
+        Returns:
+            (station_ids, distances_km) arrays aligned with the input.
+        """
+        if self._tree is None:
+            raise ValueError("The station index is empty.")
+        chord, index = self._tree.query(_to_unit_vectors(np.atleast_1d(lats), np.atleast_1d(lons)), k=1)
+        distances_km = 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord[:, 0] / 2, 0, 1))
+        return self.station_ids[index[:, 0]], distances_km
+
+    def with_daily_data(self, start_date, end_date) -> "StationIndex":
+        """
+        Restrict the index to stations with daily data between two dates.
+
+        A station is kept if its daily inventory overlaps the period, so
+        the nearest station in the result has at least some data for it.
+        An index without inventory is returned unchanged.
+        """
+        if self.daily_start is None:
+            return self
+        start = np.datetime64(start_date, "D")
+        end = np.datetime64(end_date, "D")
+        # Comparisons with NaT are False, so stations without daily data drop out
+        keep = (self.daily_start <= end) & (self.daily_end >= start)
+        return StationIndex(
+            self.station_ids[keep], self.lats[keep], self.lons[keep],
+            self.daily_start[keep], self.daily_end[keep],
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the station coordinates (and inventory, if known) to an NPZ file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = dict(station_ids=self.station_ids, lats=self.lats, lons=self.lons)
+        if self.daily_start is not None:
+            columns.update(daily_start=self.daily_start, daily_end=self.daily_end)
+        np.savez_compressed(path, **columns)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "StationIndex":
+        """Load an index written by :meth:`save`."""
+        with np.load(path) as data:
+            inventory = (data["daily_start"], data["daily_end"]) if "daily_start" in data else (None, None)
+            return cls(data["station_ids"], data["lats"], data["lons"], *inventory)
+
+    @classmethod
+    def from_meteostat(
+        cls,
+        cache_path: Optional[Union[str, Path]] = DEFAULT_STATION_CACHE,
+        refresh: bool = False
+    ) -> "StationIndex":
+        """
+        Build an index over every Meteostat station, with its daily inventory.
+
+        The station list is downloaded once and stored at `cache_path`;
+        later calls load it from disk unless `refresh` is set (or the
+        cached file predates the inventory columns).
+        """
+        if cache_path is not None and Path(cache_path).exists() and not refresh:
+            index = cls.load(cache_path)
+            if index.daily_start is not None:
+                return index
+
+        stations = Stations().fetch()
+        stations = stations.dropna(subset=["latitude", "longitude"])
+        index = cls(
+            stations.index.astype(str), stations["latitude"], stations["longitude"],
+            stations["daily_start"].to_numpy("datetime64[D]"), stations["daily_end"].to_numpy("datetime64[D]"),
+        )
+        if cache_path is not None:
+            index.save(cache_path)
+        return index
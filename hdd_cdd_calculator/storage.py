@@ -0,0 +1,188 @@
+# hdd_cdd_calculator/storage.py
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+from .results import COLUMNS, DegreeDaysArray, DegreeDaysLike, as_degree_days_array
+
+try:  # Optional dependency for Parquet output
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = None
+    pq = None
+
+FORMATS = ("auto", "parquet", "npy")
+_FIELDS = ("dates",) + COLUMNS
+
+
+def _resolve_format(fmt: str) -> str:
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}")
+    if fmt == "auto":
+        return "parquet" if pa is not None else "npy"
+    if fmt == "parquet" and pa is None:
+        raise ImportError("Parquet support requires pyarrow: pip install hdd-cdd-calculator[parquet]")
+    return fmt
+
+
+def _partition_dir(root: Path, location_id: str, year: int) -> Path:
+    return root / f"location={quote(str(location_id), safe='')}" / f"year={year}"
+
+
+def _write_partition(path: Path, part: DegreeDaysArray, fmt: str) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    if fmt == "parquet":
+        table = pa.table({
+            "date": pa.array(part.dates),
+            **{name: pa.array(getattr(part, name)) for name in COLUMNS},
+        })
+        pq.write_table(table, path / "part-0.parquet")
+    else:
+        for name in _FIELDS:
+            np.save(path / f"{name}.npy", getattr(part, name))
+
+
+def _clear_partition(path: Path) -> None:
+    for file in list(path.glob("*.parquet")) + list(path.glob("*.npy")):
+        file.unlink()
+
+
+def _read_partition(
+    path: Path,
+    start: Optional[np.datetime64],
+    end: Optional[np.datetime64]
+) -> Optional[DegreeDaysArray]:
+    parquet_file = path / "part-0.parquet"
+    if parquet_file.exists():
+        if pq is None:
+            raise ImportError("Reading Parquet partitions requires pyarrow.")
+        filters = []
+        if start is not None:
+            filters.append(("date", ">=", start.astype(object)))
+        if end is not None:
+            filters.append(("date", "<=", end.astype(object)))
+        table = pq.read_table(parquet_file, filters=filters or None)
+        columns = {name: table.column(name).to_numpy() for name in COLUMNS}
+        dates = table.column("date").to_numpy().astype("datetime64[D]")
+        return DegreeDaysArray(dates, **columns)
+
+    if not (path / "dates.npy").exists():
+        return None
+    # Memory-mapped columns: only the pages of the selected rows are read
+    columns = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in _FIELDS}
+    part = DegreeDaysArray(**columns, dtype=columns["hdd"].dtype)
+    return part.select(start, end)
+
+
+def write_degree_days(
+    results: Union[DegreeDaysLike, Mapping[str, DegreeDaysLike]],
+    root: Union[str, Path],
+    location_id: Optional[str] = None,
+    format: str = "auto"
+) -> List[Path]:
+    """
+    Write degree day results as a columnar dataset partitioned by location and year.
+
+    Layout: ``root/location=<id>/year=<yyyy>/`` holding either one Parquet
+    file (via pyarrow) or one memory-mappable ``.npy`` file per column.
+    Rows are merged into existing partitions, and newly written days
+    replace stored days with the same date.
+
+    Args:
+        results: One result (with `location_id`) or a mapping of
+                 location id → result.
+        root: Dataset root directory.
+        location_id: Location id when `results` is a single result.
+        format: "parquet", "npy", or "auto" (Parquet if pyarrow is installed).
+
+    Returns:
+        Paths of the partitions that were written.
+    """
+    fmt = _resolve_format(format)
+    root = Path(root)
+    if not isinstance(results, Mapping):
+        if location_id is None:
+            raise ValueError("location_id is required when writing a single result.")
+        results = {location_id: results}
+
+    written = []
+    for loc, result in results.items():
+        result = as_degree_days_array(result)
+        if not len(result):
+            continue
+        years = result.dates.astype("datetime64[Y]").astype(int) + 1970
+        for year in np.unique(years).tolist():
+            part = result[years == year]
+            path = _partition_dir(root, loc, year)
+            existing = _read_partition(path, None, None) if path.exists() else None
+            if existing is not None:
+                existing = existing[~np.isin(existing.dates, part.dates)]
+                part = DegreeDaysArray.concat([existing, part])
+                order = np.argsort(part.dates, kind="stable")
+                part = part[order]
+                _clear_partition(path)
+            _write_partition(path, part, fmt)
+            written.append(path)
+    return written
+
+
+def list_locations(root: Union[str, Path]) -> List[str]:
+    """Return the location ids stored under `root`."""
+    return sorted(
+        unquote(p.name.split("=", 1)[1])
+        for p in Path(root).glob("location=*") if p.is_dir()
+    )
+
+
+def read_degree_days(
+    root: Union[str, Path],
+    location_ids: Optional[Union[str, Iterable[str]]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Dict[str, DegreeDaysArray]:
+    """
+    Read degree day results written by :func:`write_degree_days`.
+
+    Only the partitions for the requested locations and the years that
+    overlap the date range are opened, and rows outside the range are
+    filtered while reading (Parquet row-group filters, or binary search on
+    memory-mapped ``.npy`` columns).
+
+    Args:
+        root: Dataset root directory.
+        location_ids: One id, several ids, or None for every location.
+        start_date: Optional first date (YYYY-MM-DD, inclusive).
+        end_date: Optional last date (YYYY-MM-DD, inclusive).
+
+    Returns:
+        Mapping of location id → DegreeDaysArray sorted by date.
+    """
+    root = Path(root)
+    if location_ids is None:
+        location_ids = list_locations(root)
+    elif isinstance(location_ids, str):
+        location_ids = [location_ids]
+
+    start = np.datetime64(start_date, "D") if start_date is not None else None
+    end = np.datetime64(end_date, "D") if end_date is not None else None
+    first_year = int(str(start)[:4]) if start is not None else None
+    last_year = int(str(end)[:4]) if end is not None else None
+
+    results = {}
+    for loc in location_ids:
+        location_dir = root / f"location={quote(str(loc), safe='')}"
+        parts = []
+        year_dirs = sorted(location_dir.glob("year=*"), key=lambda p: int(p.name[5:]))
+        for year_dir in year_dirs:
+            year = int(year_dir.name[5:])
+            if (first_year is not None and year < first_year) or (last_year is not None and year > last_year):
+                continue  # partition pruning
+            part = _read_partition(year_dir, start, end)
+            if part is not None:
+                parts.append(part)
+        # A single partition is returned as-is so memory-mapped columns stay views
+        results[loc] = parts[0] if len(parts) == 1 else DegreeDaysArray.concat(parts)
+    return results
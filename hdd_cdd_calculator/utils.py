@@ -1,6 +1,22 @@
-from typing import Tuple
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
 from .exceptions import InvalidCoordinatesError
 
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+# Plausible range (°F) for observed air temperatures; values outside are masked
+MIN_PLAUSIBLE_TEMP_F = -100.0
+MAX_PLAUSIBLE_TEMP_F = 150.0
+
+# Ways to estimate degree days from a daily high and low:
+#   "mean"        - base minus (high + low) / 2 (the standard NOAA method)
+#   "single_sine" - integrate a sine curve through the day's low and high
+#   "double_sine" - today's high paired with today's low for the first half
+#                   of the day and with tomorrow's low for the second half
+DEGREE_DAY_METHODS = ("mean", "single_sine", "double_sine")
+
 
 def validate_coordinates(lat: float, lon: float) -> Tuple[float, float]:
     """
@@ -37,44 +53,165 @@ def mean_temperature(high: float, low: float) -> float:
     return (high + low) / 2.0
 
 
-def calculate_degree_days(
-    high_temp: float,
-    low_temp: float,
-    base_temp: float = 65.0,
-    unit: str = "F"
-) -> Tuple[float, float]:
+def _sine_degree_days(high: np.ndarray, low: np.ndarray, base: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calculate Heating Degree Days (HDD) and Cooling Degree Days (CDD).
+    Average degree days over one cycle of a sine wave between `low` and `high`.
+
+    The cooling part is the closed-form integral of max(T(t) - base, 0); the
+    heating part follows from HDD - CDD = base - mean over a full cycle.
+    """
+    hi = np.maximum(high, low)
+    lo = np.minimum(high, low)
+    mean = (hi + lo) / 2.0
+    amplitude = (hi - lo) / 2.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        theta = np.arcsin(np.clip((base - mean) / amplitude, -1.0, 1.0))
+        partial = ((mean - base) * (np.pi / 2 - theta) + amplitude * np.cos(theta)) / np.pi
+    cdd = np.where(base <= lo, mean - base, np.where(base >= hi, 0.0, partial))
+    hdd = cdd + base - mean
+    # Clip rounding noise around the crossover
+    return np.maximum(hdd, 0.0), np.maximum(cdd, 0.0)
+
+
+def calculate_degree_days_array(
+    high_temps: ArrayLike,
+    low_temps: ArrayLike,
+    base_temp: ArrayLike = 65.0,
+    unit: str = "F",
+    errors: str = "mask",
+    method: str = "mean"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate HDD and CDD for whole arrays of daily highs and lows in one pass.
 
     Args:
-        high_temp: Daily high temperature.
-        low_temp: Daily low temperature.
-        base_temp: Base/reference temperature
-                   (default: 65°F if unit='F', 18.3°C if unit='C').
+        high_temps: Daily high temperatures (array, list or pandas Series).
+        low_temps: Daily low temperatures, same length as `high_temps`.
+        base_temp: Scalar base temperature or one base per element.
         unit: 'F' for Fahrenheit, 'C' for Celsius. If 'C', temps/base_temp
               will be converted to Fahrenheit before calculations.
+        errors: 'mask' sets HDD/CDD to NaN for rows with missing or
+                suspicious temperatures; 'raise' raises on the first such row.
+        method: 'mean', 'single_sine' or 'double_sine' (see DEGREE_DAY_METHODS).
+                For 'double_sine' consecutive days run along the first axis;
+                the last day (or a day followed by a missing low) reuses its
+                own low.
 
     Returns:
-        Tuple of (HDD, CDD) — both based on Fahrenheit values.
+        Tuple of (HDD, CDD) float64 arrays — both based on Fahrenheit values.
+
+    Raises:
+        ValueError: If `unit` or `errors` is invalid, the inputs cannot be
+                    broadcast together, or `errors='raise'` and a row is
+                    suspicious.
     """
     unit = unit.upper()
     if unit not in ("F", "C"):
         raise ValueError("unit must be either 'F' or 'C'")
+    if errors not in ("mask", "raise"):
+        raise ValueError("errors must be either 'mask' or 'raise'")
+    if method not in DEGREE_DAY_METHODS:
+        raise ValueError(f"method must be one of {DEGREE_DAY_METHODS}")
+
+    high, low, base = np.broadcast_arrays(
+        np.asarray(high_temps, dtype=np.float64),
+        np.asarray(low_temps, dtype=np.float64),
+        np.asarray(base_temp, dtype=np.float64),
+    )
 
     # Convert to Fahrenheit if needed
     if unit == "C":
-        high_temp = celsius_to_fahrenheit(high_temp)
-        low_temp = celsius_to_fahrenheit(low_temp)
-        base_temp = celsius_to_fahrenheit(base_temp)
-
-    # Sanity check: warn if values are suspicious
-    if not (-100 <= high_temp <= 150) or not (-100 <= low_temp <= 150):
+        high = celsius_to_fahrenheit(high)
+        low = celsius_to_fahrenheit(low)
+        base = celsius_to_fahrenheit(base)
+
+    # NaN compares False, so missing values are flagged alongside out-of-range ones
+    valid = (
+        (high >= MIN_PLAUSIBLE_TEMP_F) & (high <= MAX_PLAUSIBLE_TEMP_F)
+        & (low >= MIN_PLAUSIBLE_TEMP_F) & (low <= MAX_PLAUSIBLE_TEMP_F)
+    )
+    if errors == "raise" and not valid.all():
+        bad = np.flatnonzero(~valid)[0]
         raise ValueError(
             f"Temperature values look suspicious after conversion: "
-            f"high={high_temp}, low={low_temp}"
+            f"high={high.flat[bad]}, low={low.flat[bad]}"
         )
 
-    mean_temp = mean_temperature(high_temp, low_temp)
-    hdd = max(0, base_temp - mean_temp)
-    cdd = max(0, mean_temp - base_temp)
+    if method == "mean":
+        with np.errstate(invalid="ignore"):
+            delta = base - (high + low) / 2.0
+            hdd = np.maximum(delta, 0.0)
+            cdd = np.maximum(-delta, 0.0)
+    elif method == "single_sine" or high.ndim == 0:
+        hdd, cdd = _sine_degree_days(high, low, base)
+    else:
+        next_low = np.concatenate([low[1:], low[-1:]], axis=0)
+        next_valid = np.concatenate([valid[1:], valid[-1:]], axis=0)
+        next_low = np.where(next_valid, next_low, low)
+        hdd_am, cdd_am = _sine_degree_days(high, low, base)
+        hdd_pm, cdd_pm = _sine_degree_days(high, next_low, base)
+        hdd = (hdd_am + hdd_pm) / 2.0
+        cdd = (cdd_am + cdd_pm) / 2.0
+
+    hdd = np.where(valid, hdd, np.nan)
+    cdd = np.where(valid, cdd, np.nan)
     return hdd, cdd
+
+
+def calculate_degree_days_matrix(
+    high_temps: ArrayLike,
+    low_temps: ArrayLike,
+    base_temps: ArrayLike,
+    unit: str = "F",
+    errors: str = "mask",
+    method: str = "mean"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate HDD and CDD for every day at several base temperatures at once.
+
+    Args:
+        high_temps: Daily high temperatures (length n).
+        low_temps: Daily low temperatures (length n).
+        base_temps: Base temperatures to evaluate (length k).
+        unit: 'F' or 'C' (see :func:`calculate_degree_days_array`).
+        errors: 'mask' or 'raise' (see :func:`calculate_degree_days_array`).
+        method: 'mean', 'single_sine' or 'double_sine'.
+
+    Returns:
+        Tuple of (HDD, CDD) arrays of shape (n, k) — one column per base.
+    """
+    high = np.asarray(high_temps, dtype=np.float64).reshape(-1, 1)
+    low = np.asarray(low_temps, dtype=np.float64).reshape(-1, 1)
+    bases = np.asarray(base_temps, dtype=np.float64).reshape(1, -1)
+    return calculate_degree_days_array(high, low, bases, unit=unit, errors=errors, method=method)
+
+
+def calculate_degree_days(
+    high_temp: float,
+    low_temp: float,
+    base_temp: float = 65.0,
+    unit: str = "F",
+    method: str = "mean"
+) -> Tuple[float, float]:
+    """
+    Calculate Heating Degree Days (HDD) and Cooling Degree Days (CDD).
+
+    Scalar wrapper around :func:`calculate_degree_days_array`.
+
+    Args:
+        high_temp: Daily high temperature.
+        low_temp: Daily low temperature.
+        base_temp: Base/reference temperature
+                   (default: 65°F if unit='F', 18.3°C if unit='C').
+        unit: 'F' for Fahrenheit, 'C' for Celsius. If 'C', temps/base_temp
+              will be converted to Fahrenheit before calculations.
+        method: 'mean' (default) or 'single_sine'; a single day has no next
+                low, so 'double_sine' gives the single-sine value.
+
+    Returns:
+        Tuple of (HDD, CDD) — both based on Fahrenheit values.
+    """
+    hdd, cdd = calculate_degree_days_array(
+        high_temp, low_temp, base_temp, unit=unit, errors="raise", method=method
+    )
+    return float(hdd), float(cdd)
@@ -1,6 +1,44 @@
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from typing import Optional, Union
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+# Points at which the regression line is evaluated (sorted, independent of data size)
+LINE_POINTS = 64
+DEFAULT_DPI = 150
+CELL_SIZE = (4.0, 2.5)  # inches per grid cell
+# Fixed margins in inches (left, right, bottom, top, horizontal gap, vertical gap),
+# wide enough for 7-character tick labels plus the axis labels and title
+MARGINS = (0.95, 0.2, 0.6, 0.4, 0.95, 0.8)
+PAGES_PER_TASK = 8
+
+
+class RegressionPlot(NamedTuple):
+    """One chart for render_regressions."""
+    name: str
+    degree_days: Any
+    energy: Any
+    model: Any  # fitted model with predict(), e.g. LinearRegression or LinearModel
+    title: Optional[str] = None
+
+
+def _regression_line(x: np.ndarray, model) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate `model` on a sorted grid spanning `x`."""
+    finite = x[np.isfinite(x)]
+    if not len(finite):
+        return np.empty(0), np.empty(0)
+    line_x = np.linspace(finite.min(), finite.max(), LINE_POINTS)
+    return line_x, np.asarray(model.predict(line_x.reshape(-1, 1)), dtype=np.float64).ravel()
+
 
 def plot_regression(
     degree_days: Union[pd.Series, list],
@@ -19,34 +57,236 @@ def plot_regression(
         save_path: Optional file path to save the plot (e.g., 'examples/regression_plot.png')
         show: Whether to display the plot window (default True)
     """
-    # Convert to Pandas Series for consistency
-    dd_series = pd.Series(degree_days)
-    en_series = pd.Series(energy_data)
+    dd_values = np.asarray(degree_days, dtype=np.float64)
+    en_values = np.asarray(energy_data, dtype=np.float64)
 
     # Scatter plot data points
-    plt.figure(figsize=(8, 5))
-    plt.scatter(dd_series, en_series, label='Data Points', color='blue')
-
-    # Regression line
-    plt.plot(
-        dd_series,
-        model.predict(dd_series.values.reshape(-1, 1)),
-        color='red',
-        label='Regression Line'
-    )
-
-    plt.xlabel('Degree Days')
-    plt.ylabel('Energy Consumption')
-    plt.title('Degree Days vs Energy Consumption')
-    plt.legend()
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.scatter(dd_values, en_values, label='Data Points', color='blue')
+
+    # Regression line, drawn left to right
+    ax.plot(*_regression_line(dd_values, model), color='red', label='Regression Line')
+
+    ax.set_xlabel('Degree Days')
+    ax.set_ylabel('Energy Consumption')
+    ax.set_title('Degree Days vs Energy Consumption')
+    ax.legend(loc='upper left')
 
     # Save if requested
     if save_path:
-        plt.savefig(save_path, dpi=150)
+        fig.savefig(save_path, dpi=150)
         print(f"[INFO] Plot saved to {save_path}")
 
-    # Show the plot if desired
+    # Show the plot if desired; the figure is released either way
     if show:
         plt.show()
+    plt.close(fig)
+
+
+class RegressionRenderer:
+    """
+    Reusable renderer for regression charts on a pyplot-free Agg canvas.
+
+    One Figure with a rows × cols grid of axes is built up front, each with
+    a marker line for the data points and a line for the regression fit.
+    Rendering a page only swaps the artists' data, titles and axis limits,
+    so no figure, axes or artist is created per chart. Margins are fixed
+    instead of recomputed by a layout engine on every save.
+    """
+
+    def __init__(
+        self,
+        grid: Tuple[int, int] = (1, 1),
+        figsize: Optional[Tuple[float, float]] = None,
+        dpi: int = DEFAULT_DPI
+    ):
+        """
+        Args:
+            grid: (rows, cols) of charts per page.
+            figsize: Page size in inches (defaults to CELL_SIZE per cell).
+            dpi: Resolution of raster output.
+        """
+        rows, cols = grid
+        if rows < 1 or cols < 1:
+            raise ValueError("grid must have at least one row and one column")
+        self.grid = (rows, cols)
+        self.dpi = dpi
+        if figsize is None:
+            figsize = (CELL_SIZE[0] * cols, CELL_SIZE[1] * rows) if grid != (1, 1) else (8, 5)
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+
+        small = grid != (1, 1)
+        width, height = self.figure.get_size_inches()
+        left, right, bottom, top, gap_x, gap_y = MARGINS
+        cell_width = (width - left - right - gap_x * (cols - 1)) / cols
+        cell_height = (height - bottom - top - gap_y * (rows - 1)) / rows
+        if cell_width <= 0 or cell_height <= 0:
+            raise ValueError("figsize is too small for the grid")
+        self.axes = self.figure.subplots(
+            rows, cols, squeeze=False,
+            gridspec_kw={
+                "left": left / width, "right": 1 - right / width,
+                "bottom": bottom / height, "top": 1 - top / height,
+                "wspace": gap_x / cell_width, "hspace": gap_y / cell_height,
+            },
+        ).ravel()
+        self._points = []
+        self._lines = []
+        for ax in self.axes:
+            points, = ax.plot(
+                [], [], linestyle="none", marker="o", markersize=2 if small else 4,
+                color="blue", label="Data Points", rasterized=True,
+            )
+            line, = ax.plot([], [], color="red", label="Regression Line")
+            self._points.append(points)
+            self._lines.append(line)
+            ax.set_xlabel("Degree Days")
+            ax.set_ylabel("Energy Consumption")
+            if not small:
+                ax.legend(loc="upper left")
+
+    @property
+    def per_page(self) -> int:
+        return len(self.axes)
+
+    def draw_page(self, plots: Sequence[RegressionPlot]) -> None:
+        """Load up to `per_page` charts into the grid; unused cells are hidden."""
+        if len(plots) > self.per_page:
+            raise ValueError(f"At most {self.per_page} plots fit on a page")
+        for i, ax in enumerate(self.axes):
+            if i >= len(plots):
+                ax.set_visible(False)
+                continue
+            plot = plots[i]
+            x = np.asarray(plot.degree_days, dtype=np.float64)
+            y = np.asarray(plot.energy, dtype=np.float64)
+            line_x, line_y = _regression_line(x, plot.model)
+            self._points[i].set_data(x, y)
+            self._lines[i].set_data(line_x, line_y)
+            ax.set_title(plot.title or plot.name, fontsize="medium")
+            _set_limits(ax, np.concatenate([x, line_x]), np.concatenate([y, line_y]))
+            ax.set_visible(True)
+
+    def save(self, path: Union[str, Path], format: Optional[str] = None) -> None:
+        """Write the current page to `path`."""
+        self.figure.savefig(path, dpi=self.dpi, format=format)
+
+
+def _set_limits(ax, x: np.ndarray, y: np.ndarray, margin: float = 0.05) -> None:
+    """Set axis limits from the data directly (cheaper than relim/autoscale)."""
+    for values, setter in ((x, ax.set_xlim), (y, ax.set_ylim)):
+        finite = values[np.isfinite(values)]
+        if not len(finite):
+            setter(0.0, 1.0)
+            continue
+        lo, hi = float(finite.min()), float(finite.max())
+        pad = (hi - lo) * margin or max(abs(lo) * margin, 0.5)
+        setter(lo - pad, hi + pad)
+
+
+def _file_stem(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", str(name)).strip("._") or "plot"
+
+
+def _pages(plots: Sequence[RegressionPlot], per_page: int) -> List[Sequence[RegressionPlot]]:
+    return [plots[i:i + per_page] for i in range(0, len(plots), per_page)]
+
+
+def _render_to_directory(
+    plots: Sequence[RegressionPlot],
+    directory: str,
+    first_page: int,
+    grid: Tuple[int, int],
+    figsize: Optional[Tuple[float, float]],
+    dpi: int,
+    format: str
+) -> List[str]:
+    """Render pages into `directory` (runs in a worker process when parallel)."""
+    renderer = RegressionRenderer(grid, figsize, dpi)
+    paths = []
+    for number, page in enumerate(_pages(plots, renderer.per_page), start=first_page):
+        stem = _file_stem(page[0].name) if renderer.per_page == 1 else f"page-{number:04d}"
+        path = os.path.join(directory, f"{stem}.{format}")
+        renderer.draw_page(page)
+        renderer.save(path, format=format)
+        paths.append(path)
+    return paths
+
+
+def render_regressions(
+    plots: Sequence[RegressionPlot],
+    output: Union[str, Path],
+    grid: Tuple[int, int] = (1, 1),
+    workers: Optional[int] = 0,
+    figsize: Optional[Tuple[float, float]] = None,
+    dpi: int = DEFAULT_DPI,
+    format: str = "png"
+) -> List[Path]:
+    """
+    Render many regression charts without pyplot.
+
+    Charts are drawn by a RegressionRenderer that reuses one figure and its
+    artists for every page, optionally as small multiples (`grid` charts
+    per page). Nothing is shown or printed and every figure is released,
+    so thousands of meters can be rendered in one call.
+
+    Args:
+        plots: RegressionPlot entries (name, degree days, energy, model).
+        output: A path ending in ".pdf" for one multi-page PDF, otherwise a
+                directory that receives one file per page (named after the
+                plot for a 1 × 1 grid, "page-0001" etc. for larger grids).
+        grid: (rows, cols) of charts per page.
+        workers: Worker processes for directory output (None uses the CPU
+                 count, 0 renders in the calling process). PDF output is
+                 always rendered in the calling process.
+        figsize: Page size in inches.
+        dpi: Resolution of raster output.
+        format: Image format for directory output ("png", "svg", "pdf", ...).
+
+    Returns:
+        Paths of the written files, in page order.
+
+    Raises:
+        ValueError: If 1 × 1 directory output would reuse a file name.
+    """
+    plots = list(plots)
+    output = Path(output)
+
+    if output.suffix.lower() == ".pdf":
+        renderer = RegressionRenderer(grid, figsize, dpi)
+        with PdfPages(output) as pdf:
+            for page in _pages(plots, renderer.per_page):
+                renderer.draw_page(page)
+                pdf.savefig(renderer.figure)
+        return [output]
+
+    per_page = grid[0] * grid[1]
+    if per_page == 1:
+        stems = [_file_stem(plot.name) for plot in plots]
+        if len(set(stems)) != len(stems):
+            raise ValueError("Plot names must map to unique file names.")
+    output.mkdir(parents=True, exist_ok=True)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(plots) <= per_page:
+        paths = _render_to_directory(plots, str(output), 1, grid, figsize, dpi, format)
     else:
-        plt.close()
+        # Whole pages per task, a few tasks per worker
+        pages_per_task = max(1, min(PAGES_PER_TASK, math.ceil(len(plots) / per_page / workers)))
+        step = pages_per_task * per_page
+        starts = range(0, len(plots), step)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _render_to_directory,
+                [plots[i:i + step] for i in starts],
+                [str(output)] * len(starts),
+                [1 + i // per_page for i in starts],
+                [grid] * len(starts),
+                [figsize] * len(starts),
+                [dpi] * len(starts),
+                [format] * len(starts),
+            )
+            paths = [path for chunk in chunks for path in chunk]
+    return [Path(path) for path in paths]